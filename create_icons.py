@@ -0,0 +1,77 @@
+"""
+Script om de ribbon iconen vooraf te renderen naar PNG's en een Qt resource bestand
+
+Genereert:
+    resources/icons/ribbon/<naam>_<grootte>.png
+    resources/icons.qrc
+    src/ui/icons_rc.py  (via pyside6-rcc, als die beschikbaar is)
+
+Met icons_rc.py aanwezig laadt de applicatie de iconen uit het resource
+systeem en hoeft er bij het opstarten niets getekend te worden.
+Opnieuw draaien na elke wijziging aan de tekeningen in src/ui/icons.py;
+een module met een andere ICON_CACHE_VERSION wordt genegeerd.
+"""
+
+from PySide6.QtWidgets import QApplication
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+
+from src.ui.icons import _PAINTERS, _BAKED_SIZES, _ICON_CACHE_VERSION, _render
+
+
+ROOT = Path(__file__).parent
+RESOURCES_DIR = ROOT / "resources"
+ICONS_DIR = RESOURCES_DIR / "icons" / "ribbon"
+QRC_PATH = RESOURCES_DIR / "icons.qrc"
+RC_MODULE_PATH = ROOT / "src" / "ui" / "icons_rc.py"
+
+
+def bake_icons() -> list[Path]:
+    """Render alle iconen op de gebakken groottes naar PNG bestanden"""
+    ICONS_DIR.mkdir(parents=True, exist_ok=True)
+
+    files = []
+    for name, paint_fn in _PAINTERS.items():
+        for size in _BAKED_SIZES:
+            path = ICONS_DIR / f"{name}_{size}.png"
+            _render(paint_fn, size).save(str(path), "PNG")
+            files.append(path)
+    print(f"{len(files)} iconen opgeslagen in {ICONS_DIR}")
+    return files
+
+
+def write_qrc(files: list[Path]):
+    """Schrijf het .qrc bestand met alle iconen onder het :/icons prefix"""
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '<qresource prefix="/icons">']
+    for path in files:
+        relative = path.relative_to(RESOURCES_DIR).as_posix()
+        lines.append(f'    <file alias="{path.name}">{relative}</file>')
+    lines.extend(['</qresource>', '</RCC>', ''])
+
+    QRC_PATH.write_text("\n".join(lines), encoding="utf-8")
+    print(f"Resource bestand opgeslagen als {QRC_PATH}")
+
+
+def compile_qrc():
+    """Compileer het .qrc bestand naar een Python module"""
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        print("pyside6-rcc niet gevonden; compileer handmatig met:")
+        print(f"    pyside6-rcc {QRC_PATH} -o {RC_MODULE_PATH}")
+        print(f"en voeg daaraan de regel ICON_CACHE_VERSION = {_ICON_CACHE_VERSION} toe")
+        return
+
+    subprocess.run([rcc, str(QRC_PATH), "-o", str(RC_MODULE_PATH)], check=True)
+    # Versie van de tekeningen, zodat icons.py een verouderde bake kan negeren
+    with RC_MODULE_PATH.open("a", encoding="utf-8") as f:
+        f.write(f"\nICON_CACHE_VERSION = {_ICON_CACHE_VERSION}\n")
+    print(f"Resource module opgeslagen als {RC_MODULE_PATH}")
+
+
+if __name__ == "__main__":
+    app = QApplication.instance() or QApplication(sys.argv)
+    write_qrc(bake_icons())
+    compile_qrc()
+    print("\nAlle iconen zijn gebakken!")
@@ -11,6 +11,8 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QTimer
 from src.ui.main_window import MainWindow
+from src.ui.icons import start_icon_prerender
+from src.ui.ifc_3d_viewer import configure_webengine
 
 
 def main():
@@ -21,11 +23,17 @@ def main():
     parser.add_argument("--ifc3d", help="IFC bestand voor 3D viewer")
     args = parser.parse_args()
 
+    # Chromium vlaggen voor de 3D viewer moeten vóór de QApplication staan
+    configure_webengine()
+
     app = QApplication(sys.argv)
     app.setApplicationName("OpenCalc")
     app.setOrganizationName("OpenCalc")
     app.setApplicationVersion("0.2.0")
 
+    # Teken de ribbon iconen op de achtergrond terwijl het venster opbouwt
+    start_icon_prerender()
+
     # Stel applicatie icoon in
     icon_path = Path(__file__).parent / "resources" / "icons" / "app_icon.ico"
     if icon_path.exists():
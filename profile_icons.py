@@ -0,0 +1,57 @@
+"""
+Script om het aantal QPainter aanroepen bij het tekenen van alle iconen te tellen
+
+Het icoon-tekenen is gebonden aan de overhead per Python -> Qt aanroep, niet
+aan pixelwerk (de canvassen zijn 32x32). Het juiste criterium voor
+optimalisaties in src/ui/icons.py is daarom het aantal QPainter aanroepen,
+niet de tijd per pixel.
+
+Gebruik:
+    python profile_icons.py              # rapport per QPainter methode
+    python profile_icons.py --budget 400 # exit code 1 bij overschrijding
+"""
+
+from PySide6.QtWidgets import QApplication
+import argparse
+import cProfile
+import pstats
+import sys
+
+from src.ui.icons import _PAINTERS, _MASTER_SIZE, _render_image
+
+
+def count_painter_calls() -> dict[str, int]:
+    """Teken alle iconen één keer (koude start) en tel de QPainter aanroepen"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for paint_fn in _PAINTERS.values():
+        _render_image(paint_fn, _MASTER_SIZE)
+    profiler.disable()
+
+    counts = {}
+    for (_, _, func_name), (_, calls, *_) in pstats.Stats(profiler).stats.items():
+        if "QPainter" in func_name:
+            counts[func_name] = counts.get(func_name, 0) + calls
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tel QPainter aanroepen van de iconen")
+    parser.add_argument("--budget", type=int, help="Maximaal toegestaan aantal aanroepen")
+    args = parser.parse_args()
+
+    counts = count_painter_calls()
+    total = sum(counts.values())
+    for func_name, calls in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"{calls:6d}  {func_name}")
+    print(f"{total:6d}  totaal voor {len(_PAINTERS)} iconen")
+
+    if args.budget is not None and total > args.budget:
+        print(f"\nBudget van {args.budget} aanroepen overschreden!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # QPainter op een QImage heeft een QApplication nodig; de naam houdt hem in leven
+    app = QApplication.instance() or QApplication(sys.argv)
+    main()
@@ -5,9 +5,14 @@ Biedt een high-level interface voor het werken met IFC kostenschema's
 
 import ifcopenshell
 import ifcopenshell.api
+import ifcopenshell.util.element
 from typing import Optional, List, Dict, Any
 
 
+# PropertySets waarin OpenCalc de SFB-code en opmaak van kostenposten bewaart
+_OPENCALC_PSETS = frozenset({"Pset_CostClassification", "Pset_CostFormatting"})
+
+
 class CostAPI:
     """Wrapper klasse voor IfcOpenShell cost API"""
 
@@ -162,6 +167,32 @@ class CostAPI:
 
         return item
 
+    def add_cost_items_bulk(self, cost_item, specs: List[Dict[str, Any]]) -> List:
+        """
+        Voeg een boom van kostenposten in één keer toe onder een bestaand cost item.
+
+        Args:
+            cost_item: Het bovenliggende IfcCostItem
+            specs: Platte lijst in pre-order met per post "name", "identification"
+                   en "parent": de index van een eerdere spec, of None voor cost_item
+
+        Returns:
+            De aangemaakte IfcCostItems, in dezelfde volgorde als specs
+        """
+        run = ifcopenshell.api.run
+        ifc_file = self._ifc_file
+        created = []
+        for spec in specs:
+            parent_index = spec.get("parent")
+            parent = cost_item if parent_index is None else created[parent_index]
+            item = run("cost.add_cost_item", ifc_file, cost_item=parent)
+            if spec.get("name"):
+                item.Name = spec["name"]
+            if spec.get("identification"):
+                item.Identification = spec["identification"]
+            created.append(item)
+        return created
+
     def edit_cost_item(
         self,
         cost_item,
@@ -182,6 +213,31 @@ class CostAPI:
             attributes=attributes
         )
 
+    def edit_cost_items_bulk(self, edits: Dict[Any, Dict[str, Any]]):
+        """
+        Bewerk veel kostenposten in één keer.
+
+        Attributen worden direct op de entiteiten gezet en properties worden per
+        PropertySet gebundeld tot één pset.edit_pset aanroep, in plaats van één
+        API aanroep per attribuut of property.
+
+        Args:
+            edits: {IfcCostItem: {"attributes": {...}, "psets": {pset_naam: {prop: waarde}}}}
+        """
+        run = ifcopenshell.api.run
+        ifc_file = self._ifc_file
+        for cost_item, edit in edits.items():
+            for name, value in edit.get("attributes", {}).items():
+                setattr(cost_item, name, value)
+
+            psets = edit.get("psets")
+            if not psets:
+                continue
+            existing = self._get_psets(cost_item)
+            for pset_name, properties in psets.items():
+                pset = existing.get(pset_name) or self._get_or_create_pset(cost_item, pset_name)
+                run("pset.edit_pset", ifc_file, pset=pset, properties=properties)
+
     def remove_cost_item(self, cost_item):
         """
         Verwijder een kostenpost.
@@ -195,6 +251,26 @@ class CostAPI:
             cost_item=cost_item
         )
 
+    def move_cost_item(self, cost_item, before=None):
+        """
+        Verplaats een kostenpost binnen zijn IfcRelNests of IfcRelAssignsToControl.
+
+        De volgorde van RelatedObjects bepaalt de volgorde bij het openen.
+
+        Args:
+            cost_item: Het te verplaatsen IfcCostItem
+            before: IfcCostItem uit dezelfde relatie waar de post vóór komt,
+                    of None voor achteraan
+        """
+        rels = list(cost_item.Nests) or [
+            rel for rel in cost_item.HasAssignments if rel.is_a("IfcRelAssignsToControl")
+        ]
+        for rel in rels:
+            objects = [obj for obj in rel.RelatedObjects if obj != cost_item]
+            position = objects.index(before) if before in objects else len(objects)
+            objects.insert(position, cost_item)
+            rel.RelatedObjects = objects
+
     def copy_cost_item(self, cost_item):
         """
         Kopieer een kostenpost inclusief sub-items.
@@ -545,6 +621,41 @@ class CostAPI:
                                     return str(prop.NominalValue.wrappedValue).lower() == "true"
         return False
 
+    def get_psets_bulk(self, cost_item) -> Dict[str, Dict[str, Any]]:
+        """
+        Haal alle PropertySets van een kostenpost in één keer op.
+
+        Args:
+            cost_item: Het IfcCostItem
+
+        Returns:
+            Dictionary van pset naam naar {property naam: waarde}
+        """
+        return ifcopenshell.util.element.get_psets(cost_item, psets_only=True)
+
+    def get_opencalc_props(self, cost_item) -> Dict[str, Dict[str, Any]]:
+        """
+        Haal alleen de OpenCalc PropertySets van een kostenpost op in één doorloop.
+
+        Andere psets worden overgeslagen in plaats van volledig omgezet.
+
+        Args:
+            cost_item: Het IfcCostItem
+
+        Returns:
+            Dictionary van pset naam naar {property naam: waarde}
+        """
+        result = {}
+        for name, pset in self._get_psets(cost_item).items():
+            if name not in _OPENCALC_PSETS:
+                continue
+            props = result[name] = {}
+            for prop in pset.HasProperties:
+                value = getattr(prop, "NominalValue", None)
+                if value is not None:
+                    props[prop.Name] = value.wrappedValue
+        return result
+
     # =========================================================================
     # SFB CODE OPERATIES
     # =========================================================================
@@ -588,6 +699,24 @@ class CostAPI:
                                     return str(prop.NominalValue.wrappedValue)
         return ""
 
+    def _get_psets(self, element) -> Dict[str, Any]:
+        """
+        Haal alle PropertySets van een element op in één doorloop.
+
+        Args:
+            element: Het IFC element
+
+        Returns:
+            Dictionary van pset naam naar IfcPropertySet
+        """
+        psets = {}
+        for rel in getattr(element, "IsDefinedBy", None) or ():
+            if rel.is_a("IfcRelDefinesByProperties"):
+                pset = rel.RelatingPropertyDefinition
+                if pset.is_a("IfcPropertySet"):
+                    psets.setdefault(pset.Name, pset)
+        return psets
+
     def _get_or_create_pset(self, element, pset_name: str):
         """
         Haal een PropertySet op of maak een nieuwe aan.
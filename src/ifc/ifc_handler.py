@@ -98,16 +98,32 @@ class IFCHandler:
             FileNotFoundError: Als bestand niet bestaat
             Exception: Bij andere fouten tijdens openen
         """
+        ifc_file = self.read_file(file_path)
+        self.adopt_file(ifc_file, file_path)
+        return ifc_file
+
+    @staticmethod
+    def read_file(file_path: str | Path) -> ifcopenshell.file:
+        """
+        Lees een IFC bestand zonder de handler te wijzigen.
+
+        Veilig vanuit een worker thread; geef het resultaat daarna
+        op de GUI thread door aan adopt_file().
+
+        Raises:
+            FileNotFoundError: Als bestand niet bestaat
+        """
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Bestand niet gevonden: {path}")
+        return ifcopenshell.open(str(path))
 
-        self._ifc_file = ifcopenshell.open(str(path))
-        self._file_path = path
+    def adopt_file(self, ifc_file: ifcopenshell.file, file_path: str | Path):
+        """Neem een ingelezen IFC bestand over als het huidige, ongewijzigde bestand"""
+        self._ifc_file = ifc_file
+        self._file_path = Path(file_path)
         self._is_modified = False
 
-        return self._ifc_file
-
     def save_file(self, file_path: Optional[str | Path] = None) -> Path:
         """
         Sla het IFC bestand op.
@@ -121,23 +137,44 @@ class IFCHandler:
         Raises:
             ValueError: Als er geen bestand is om op te slaan
         """
+        path = self.resolve_save_path(file_path)
+        self.write_file(self._ifc_file, path)
+        self.mark_saved(path)
+        return path
+
+    def resolve_save_path(self, file_path: Optional[str | Path] = None) -> Path:
+        """
+        Bepaal het pad waarnaar opgeslagen wordt, zonder iets te schrijven.
+
+        Raises:
+            ValueError: Als er geen bestand of pad is om op te slaan
+        """
         if not self._ifc_file:
             raise ValueError("Geen IFC bestand om op te slaan")
 
         if file_path:
-            self._file_path = Path(file_path)
-        elif not self._file_path:
+            path = Path(file_path)
+        elif self._file_path:
+            path = self._file_path
+        else:
             raise ValueError("Geen bestandspad opgegeven")
 
         # Zorg ervoor dat het bestand .ifc extensie heeft
-        if self._file_path.suffix.lower() != ".ifc":
-            self._file_path = self._file_path.with_suffix(".ifc")
-
-        self._ifc_file.write(str(self._file_path))
+        if path.suffix.lower() != ".ifc":
+            path = path.with_suffix(".ifc")
+        return path
+
+    @staticmethod
+    def write_file(ifc_file: ifcopenshell.file, path: Path) -> Path:
+        """Schrijf een IFC bestand weg zonder de handler te wijzigen (veilig in een worker thread)"""
+        ifc_file.write(str(path))
+        return path
+
+    def mark_saved(self, path: Path):
+        """Onthoud het pad van een geslaagde opslag en markeer het bestand als ongewijzigd"""
+        self._file_path = path
         self._is_modified = False
 
-        return self._file_path
-
     def close_file(self):
         """Sluit het huidige bestand"""
         self._ifc_file = None
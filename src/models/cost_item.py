@@ -3,6 +3,7 @@ CostItem Model - Representeert een kostenpost (hiërarchisch)
 """
 
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Optional, List, TYPE_CHECKING
 from .cost_value import CostValue, QuantityType
 
@@ -10,6 +11,15 @@ if TYPE_CHECKING:
     from .cost_schedule import CostSchedule
 
 
+# Bron van stabiele, nooit hergebruikte item nummers (in tegenstelling tot id())
+_next_uid = count(1).__next__
+
+# Velden die naar IFC gesynchroniseerd worden; wijzigingen worden bijgehouden in _dirty
+_SYNCED_FIELDS = frozenset({
+    "name", "html_name", "identification", "sfb_code", "description", "is_text_only",
+})
+
+
 @dataclass
 class CostItem:
     """
@@ -27,6 +37,7 @@ class CostItem:
         children: Geneste kostenposten
         parent: Bovenliggende kostenpost
         ifc_cost_item: Referentie naar IFC object
+        uid: Stabiel uniek nummer binnen de sessie
     """
     name: str = ""
     html_name: str = ""  # HTML opmaak van de naam (voor vet, italic, etc.)
@@ -39,11 +50,40 @@ class CostItem:
     parent: Optional["CostItem"] = field(default=None, repr=False)
     schedule: Optional["CostSchedule"] = field(default=None, repr=False)
     ifc_cost_item: Optional[object] = field(default=None, repr=False)
+    uid: int = field(default_factory=_next_uid, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Zet parent referenties voor children"""
         for child in self.children:
             child.parent = self
+        # Een nieuw item is nog nergens naartoe geschreven: alles is gewijzigd
+        self.__dict__["_dirty"] = set(_SYNCED_FIELDS)
+
+    def __setattr__(self, name, value):
+        if name in _SYNCED_FIELDS:
+            dirty = self.__dict__.get("_dirty")
+            # Dezelfde waarde opnieuw zetten (bijv. een herhaald dataChanged) telt niet als wijziging
+            if dirty is not None and self.__dict__.get(name) != value:
+                dirty.add(name)
+                schedule = self.__dict__.get("schedule")
+                if schedule is not None:
+                    schedule.note_dirty(self)
+        object.__setattr__(self, name, value)
+
+    @property
+    def dirty_fields(self) -> set:
+        """Gesynchroniseerde velden die sinds de laatste sync gewijzigd zijn"""
+        return self._dirty
+
+    def mark_all_dirty(self):
+        """Markeer alle velden als gewijzigd, bijv. na het opnieuw aanmaken in IFC"""
+        self._dirty.update(_SYNCED_FIELDS)
+        if self.schedule is not None:
+            self.schedule.note_dirty(self)
+
+    def clear_dirty(self):
+        """Markeer alle velden als gesynchroniseerd"""
+        self._dirty.clear()
 
     @property
     def is_chapter(self) -> bool:
@@ -127,8 +167,9 @@ class CostItem:
             De toegevoegde CostItem
         """
         child.parent = self
-        child.schedule = self.schedule
+        child._set_schedule(self.schedule)
         self.children.append(child)
+        self._structure_changed()
         return child
 
     def remove_child(self, child: "CostItem") -> bool:
@@ -145,6 +186,7 @@ class CostItem:
             child.parent = None
             child.schedule = None
             self.children.remove(child)
+            self._structure_changed()
             return True
         return False
 
@@ -160,10 +202,24 @@ class CostItem:
             De toegevoegde CostItem
         """
         child.parent = self
-        child.schedule = self.schedule
+        child._set_schedule(self.schedule)
         self.children.insert(index, child)
+        self._structure_changed()
         return child
 
+    def _set_schedule(self, schedule: Optional["CostSchedule"]):
+        """Zet de begroting referentie voor dit item en alle onderliggende items"""
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            item.schedule = schedule
+            stack.extend(item.children)
+
+    def _structure_changed(self):
+        """Meld een wijziging in de boomstructuur aan de begroting"""
+        if self.schedule is not None:
+            self.schedule.mark_structure_changed()
+
     def get_child_index(self, child: "CostItem") -> int:
         """
         Haal de index van een kind op.
@@ -193,6 +249,7 @@ class CostItem:
             return False
         self.parent.children.remove(self)
         self.parent.children.insert(index - 1, self)
+        self._structure_changed()
         return True
 
     def move_down(self) -> bool:
@@ -209,6 +266,7 @@ class CostItem:
             return False
         self.parent.children.remove(self)
         self.parent.children.insert(index + 1, self)
+        self._structure_changed()
         return True
 
     def get_path(self) -> List["CostItem"]:
@@ -308,6 +366,50 @@ class CostItem:
 
         return new_item
 
+    def to_tuple(self) -> tuple:
+        """
+        Serialiseer dit item en zijn kinderen naar geneste tuples (zonder IFC referenties).
+
+        Returns:
+            Tuple die met from_tuple weer een CostItem wordt
+        """
+        value = self.cost_value
+        return (
+            self.name, self.html_name, self.identification, self.sfb_code,
+            self.description, self.is_text_only,
+            value.unit_price, value.quantity, value.quantity_type,
+            tuple(child.to_tuple() for child in self.children),
+        )
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> "CostItem":
+        """
+        Maak een nieuw CostItem uit de uitvoer van to_tuple.
+
+        Args:
+            data: Tuple van to_tuple
+
+        Returns:
+            Nieuwe CostItem (zonder parent/schedule referenties)
+        """
+        (name, html_name, identification, sfb_code, description, is_text_only,
+         unit_price, quantity, quantity_type, children) = data
+        item = cls(
+            name=name,
+            html_name=html_name,
+            identification=identification,
+            sfb_code=sfb_code,
+            description=description,
+            is_text_only=is_text_only,
+            cost_value=CostValue(
+                unit_price=unit_price,
+                quantity=quantity,
+                quantity_type=quantity_type
+            ),
+            children=[cls.from_tuple(child) for child in children]
+        )
+        return item
+
     @classmethod
     def from_ifc(cls, ifc_cost_item, parent: Optional["CostItem"] = None) -> "CostItem":
         """
@@ -340,7 +442,7 @@ class CostItem:
                         ifc_quantity = quantities[0]
                 cost_value = CostValue.from_ifc(values[0], ifc_quantity)
 
-        return cls(
+        item = cls(
             name=name,
             identification=identification,
             description=description,
@@ -348,3 +450,5 @@ class CostItem:
             parent=parent,
             ifc_cost_item=ifc_cost_item
         )
+        item.clear_dirty()  # Komt overeen met het IFC bestand
+        return item
@@ -3,7 +3,7 @@ CostSchedule Model - Representeert een kostenbegroting
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import date
 from enum import Enum
 
@@ -56,6 +56,16 @@ class CostSchedule:
     items: List[CostItem] = field(default_factory=list)
     vat_rate: float = 21.0  # BTW percentage
     ifc_cost_schedule: Optional[object] = field(default=None, repr=False)
+    # Verhoogd bij elke structuurwijziging; sleutel voor de gecachte platte lijst
+    _structure_version: int = field(default=0, init=False, repr=False, compare=False)
+    _all_items_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _uid_map_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _root_pos_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Verhoogd bij elke wijziging (inhoud of structuur); sleutel voor gecachte services
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Items met niet gesynchroniseerde wijzigingen op uid; volledig na een scan bij _dirty_scan_version
+    _dirty_items: Dict[int, CostItem] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _dirty_scan_version: int = field(default=-1, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Zet schedule referenties voor items"""
@@ -107,9 +117,10 @@ class CostSchedule:
         Returns:
             De toegevoegde CostItem
         """
-        item.schedule = self
+        self._set_schedule_recursive(item)
         item.parent = None
         self.items.append(item)
+        self.mark_structure_changed()
         return item
 
     def remove_item(self, item: CostItem) -> bool:
@@ -125,6 +136,7 @@ class CostSchedule:
         if item in self.items:
             item.schedule = None
             self.items.remove(item)
+            self.mark_structure_changed()
             return True
         return False
 
@@ -139,25 +151,29 @@ class CostSchedule:
         Returns:
             De toegevoegde CostItem
         """
-        item.schedule = self
+        self._set_schedule_recursive(item)
         item.parent = None
         self.items.insert(index, item)
+        self.mark_structure_changed()
         return item
 
     def get_item_index(self, item: CostItem) -> int:
         """
         Haal de index van een root item op.
 
+        De posities worden gecached tot de volgende structuurwijziging.
+
         Args:
             item: De CostItem om te zoeken
 
         Returns:
             Index van het item, of -1 als niet gevonden
         """
-        try:
-            return self.items.index(item)
-        except ValueError:
-            return -1
+        cache = self._root_pos_cache
+        if cache is None or cache[0] != self._structure_version:
+            positions = {root.uid: index for index, root in enumerate(self.items)}
+            cache = self._root_pos_cache = (self._structure_version, positions)
+        return cache[1].get(item.uid, -1)
 
     def find_by_identification(self, identification: str) -> Optional[CostItem]:
         """
@@ -188,6 +204,63 @@ class CostSchedule:
             all_items.extend(item.get_all_descendants())
         return all_items
 
+    @property
+    def all_items_cached(self) -> List[CostItem]:
+        """
+        Platte lijst van alle items, gecached tot de volgende structuurwijziging.
+
+        De lijst wordt gedeeld en mag niet aangepast worden.
+        """
+        cache = self._all_items_cache
+        if cache is None or cache[0] != self._structure_version:
+            cache = self._all_items_cache = (self._structure_version, self.get_all_items())
+        return cache[1]
+
+    @property
+    def items_by_uid(self) -> Dict[int, CostItem]:
+        """
+        Alle items op uid, gecached tot de volgende structuurwijziging.
+
+        De dict wordt gedeeld en mag niet aangepast worden.
+        """
+        cache = self._uid_map_cache
+        if cache is None or cache[0] != self._structure_version:
+            items = {item.uid: item for item in self.all_items_cached}
+            cache = self._uid_map_cache = (self._structure_version, items)
+        return cache[1]
+
+    def find_by_uid(self, uid: int) -> Optional[CostItem]:
+        """Zoek een item op uid"""
+        return self.items_by_uid.get(uid)
+
+    def note_dirty(self, item: CostItem):
+        """Onthoud een item waarvan een gesynchroniseerd veld gewijzigd is"""
+        self._dirty_items[item.uid] = item
+
+    def dirty_items(self) -> List[CostItem]:
+        """
+        Items in de begroting met wijzigingen die nog niet naar IFC gesynchroniseerd zijn.
+
+        Alleen na een structuurwijziging (nieuwe items zijn al gewijzigd) wordt
+        de hele boom doorlopen; anders alleen de bijgehouden items.
+        """
+        if self._dirty_scan_version != self._structure_version:
+            self._dirty_scan_version = self._structure_version
+            dirty = {item.uid: item for item in self.all_items_cached if item.dirty_fields}
+        else:
+            in_tree = self.items_by_uid
+            dirty = {
+                uid: item for uid, item in self._dirty_items.items()
+                if uid in in_tree and item.dirty_fields
+            }
+        self._dirty_items = dirty
+        return list(dirty.values())
+
+    def mark_structure_changed(self):
+        """Invalideer de gecachte platte lijst na een wijziging in de boomstructuur"""
+        self._structure_version += 1
+        self._version += 1
+
     def get_items_at_level(self, level: int) -> List[CostItem]:
         """
         Haal alle items op een bepaald niveau.
@@ -198,7 +271,7 @@ class CostSchedule:
         Returns:
             Lijst van CostItems op dat niveau
         """
-        return [item for item in self.get_all_items() if item.level == level]
+        return [item for item in self.all_items_cached if item.level == level]
 
     def format_subtotal(self, currency: str = "€") -> str:
         """Formatteer het subtotaal als tekst"""
@@ -243,6 +316,7 @@ class CostSchedule:
     def mark_modified(self):
         """Markeer de begroting als gewijzigd"""
         self.update_date = date.today()
+        self._version += 1
 
     @classmethod
     def from_ifc(cls, ifc_cost_schedule) -> "CostSchedule":
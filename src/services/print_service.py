@@ -19,17 +19,28 @@ class PrintService:
 
     def __init__(self, schedule: CostSchedule):
         self.schedule = schedule
+        self._html_cache: dict = {}
 
     def generate_html(self, include_details: bool = True) -> str:
         """
         Genereer HTML representatie van de begroting.
 
+        Het resultaat wordt per instantie bewaard; maak een nieuwe service
+        aan (of gebruik de gecachte van het hoofdvenster) na een wijziging.
+
         Args:
             include_details: Inclusief alle details per post
 
         Returns:
             HTML string
         """
+        html = self._html_cache.get(include_details)
+        if html is None:
+            html = self._html_cache[include_details] = self._build_html(include_details)
+        return html
+
+    def _build_html(self, include_details: bool) -> str:
+        """Bouw de HTML van de begroting op"""
         html = f"""
 <!DOCTYPE html>
 <html>
@@ -1289,6 +1289,8 @@ class CostTableView(QWidget):
                 chapter.children.sort(key=sort_key, reverse=reverse)
                 # Recursief sorteren van sub-items
                 self._sort_children_recursive(chapter, sort_key, reverse)
+        # Volgorde in place gewijzigd: gecachte lijsten en rapporten vervallen
+        self._schedule.mark_structure_changed()
 
         # Refresh de view
         self._model.set_schedule(self._schedule)
@@ -1320,6 +1322,7 @@ class CostTableView(QWidget):
             if chapter.children:
                 chapter.children.sort(key=stabu_sort_key)
                 self._sort_children_recursive(chapter, stabu_sort_key, False)
+        self._schedule.mark_structure_changed()
 
         # Refresh de view
         self._model.set_schedule(self._schedule)
@@ -1414,11 +1417,10 @@ class CostTableView(QWidget):
                 root_item = root_item.parent
 
             # Voeg het nieuwe hoofdstuk toe na dit root item
-            try:
-                index = self._schedule.items.index(root_item)
-                self._schedule.items.insert(index + 1, new_chapter)
-                new_chapter.schedule = self._schedule
-            except ValueError:
+            index = self._schedule.get_item_index(root_item)
+            if index >= 0:
+                self._schedule.insert_item(index + 1, new_chapter)
+            else:
                 self._schedule.add_item(new_chapter)
         else:
             self._schedule.add_item(new_chapter)
@@ -1448,16 +1450,14 @@ class CostTableView(QWidget):
             # Voeg toe aan dit hoofdstuk
             if selected_item == parent_chapter:
                 # Geselecteerde item is zelf een hoofdstuk, voeg als eerste child toe
-                parent_chapter.children.insert(0, new_item)
-                new_item.parent = parent_chapter
+                parent_chapter.insert_child(0, new_item)
                 new_item.schedule = self._schedule
             else:
                 # Voeg toe na het geselecteerde item binnen hetzelfde parent
                 parent = selected_item.parent if selected_item.parent else parent_chapter
                 try:
                     index = parent.children.index(selected_item)
-                    parent.children.insert(index + 1, new_item)
-                    new_item.parent = parent
+                    parent.insert_child(index + 1, new_item)
                     new_item.schedule = self._schedule
                 except ValueError:
                     parent.add_child(new_item)
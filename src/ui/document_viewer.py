@@ -9,18 +9,54 @@ from PySide6.QtWidgets import (
     QSplitter, QListWidget, QListWidgetItem, QFrame, QToolButton,
     QMenu, QSizePolicy, QRubberBand, QGraphicsLineItem, QGraphicsTextItem
 )
-from PySide6.QtCore import Qt, Signal, QPointF, QRectF, QSize, QLineF, QPoint, QRect
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool, QPointF, QRectF, QSize, QLineF,
+    QPoint, QRect
+)
 from PySide6.QtGui import (
     QPixmap, QImage, QPainter, QPen, QColor, QFont, QWheelEvent,
     QMouseEvent, QCursor, QBrush, QTransform
 )
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterable
+import importlib
 import math
+import mmap
+import re
+
+# Bestandsextensies die in de DXF viewer geopend worden
+_DXF_SUFFIXES = frozenset({".dxf", ".dwg"})
+
+# Viewer per extensie als (module, klassenaam). Modules worden pas bij het
+# eerste gebruik geïmporteerd (ook om circulaire imports te voorkomen)
+_VIEWER_IMPORTS = {
+    ".pdf": (__name__, "PDFViewer"),
+    ".ifc": (".ifc_3d_viewer", "IFC3DViewer"),
+    **{suffix: (__name__, "DXFViewer") for suffix in _DXF_SUFFIXES},
+}
+_viewer_classes: dict[str, type] = {}
+
+
+def _load_viewer(suffix: str) -> type:
+    """Geef de viewer klasse voor een extensie, importeer de module bij eerste gebruik"""
+    cls = _viewer_classes.get(suffix)
+    if cls is None:
+        module_name, class_name = _VIEWER_IMPORTS[suffix]
+        module = importlib.import_module(module_name, __package__)
+        cls = _viewer_classes[suffix] = getattr(module, class_name)
+    return cls
 
-# Lazy import voor IFC 3D viewer om circulaire imports te voorkomen
-IFC3DViewer = None
+
+# Viewer klassen die maatvoering ondersteunen (zie supports_measuring)
+_MEASURING_CAPABLE: set[type] = set()
+
+
+def supports_measuring(cls: type) -> type:
+    """Class decorator: registreer een viewer als geschikt voor maatvoering"""
+    _MEASURING_CAPABLE.add(cls)
+    return cls
 
 
 class AnnotationItem:
@@ -306,11 +342,14 @@ class DocumentGraphicsView(QGraphicsView):
         return self._current_scale
 
 
+@supports_measuring
 class PDFViewer(QWidget):
     """PDF document viewer"""
 
     pageChanged = Signal(int, int)  # current, total
 
+    tab_title = "{name}"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._doc = None
@@ -422,7 +461,7 @@ class PDFViewer(QWidget):
         if hasattr(self, '_measurement_overlay'):
             self._measurement_overlay.setGeometry(self._view.viewport().rect())
 
-    def open_file(self, file_path: str) -> bool:
+    def load(self, file_path: str) -> bool:
         """Open een PDF bestand"""
         try:
             import fitz  # PyMuPDF
@@ -563,9 +602,12 @@ class PDFViewer(QWidget):
         self._measurement_overlay.set_scale(pixels_per_real_mm)
 
 
+@supports_measuring
 class DXFViewer(QWidget):
     """DXF/DWG tekening viewer"""
 
+    tab_title = "{name}"
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._doc = None
@@ -619,7 +661,7 @@ class DXFViewer(QWidget):
         if hasattr(self, '_measurement_overlay'):
             self._measurement_overlay.setGeometry(self._view.viewport().rect())
 
-    def open_file(self, file_path: str) -> bool:
+    def load(self, file_path: str) -> bool:
         """Open een DXF bestand"""
         try:
             import ezdxf
@@ -742,12 +784,129 @@ class DXFViewer(QWidget):
             self._view.setDragMode(QGraphicsView.ScrollHandDrag)
 
 
+# Entiteiten per telling in het IFC overzicht, inclusief subtypen
+# (zoals ifcopenshell's by_type die ook meetelt)
+_SUMMARY_ENTITIES = (
+    (b"IFCWALL", b"IFCWALLSTANDARDCASE", b"IFCWALLELEMENTEDCASE"),
+    (b"IFCSLAB", b"IFCSLABSTANDARDCASE", b"IFCSLABELEMENTEDCASE"),
+    (b"IFCWINDOW", b"IFCWINDOWSTANDARDCASE"),
+    (b"IFCDOOR", b"IFCDOORSTANDARDCASE"),
+)
+_SUMMARY_ENTITY_INDEX = {
+    name: index for index, names in enumerate(_SUMMARY_ENTITIES) for name in names
+}
+# Verankerd op het begin van een instantie (#12=...), zodat tekst als
+# ='IFCWALL( in een STEP string (Name, Description, ...) niet meetelt
+_ENTITY_RE = re.compile(
+    rb"^#\d+\s*=\s*(" + b"|".join(_SUMMARY_ENTITY_INDEX) + rb")\s*\(", re.M
+)
+# Naam (derde attribuut) van het eerste IfcProject / IfcBuilding
+_NAME_RE = {
+    entity: re.compile(
+        rb"^#\d+\s*=\s*" + entity
+        + rb"\s*\(\s*'[^']*'\s*,\s*(?:#\d+|\$)\s*,\s*(\$|'(?:[^']|'')*')",
+        re.M
+    )
+    for entity in (b"IFCPROJECT", b"IFCBUILDING")
+}
+
+
+def _scan_ifc_summary(file_path: str) -> Optional[tuple]:
+    """
+    Tel de overzichtselementen direct in de ruwe STEP bytes.
+
+    Zoekt met gecompileerde regexes over een mmap naar entiteiten zoals
+    ``#12=IFCWALL(`` zonder attributen te decoderen of het model op te
+    bouwen. Geeft None terug als het bestand zo niet te lezen is (geen
+    STEP bestand, of namen met STEP escape codes); de aanroeper valt dan
+    terug op ifcopenshell.
+
+    Returns:
+        Tuple (projectnaam, gebouwnaam, tellingen) of None
+    """
+    try:
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b"ISO-10303-21", 0, 1024) == -1:
+                return None
+
+            counts = [0] * len(_SUMMARY_ENTITIES)
+            for name in _ENTITY_RE.findall(mm):
+                counts[_SUMMARY_ENTITY_INDEX[name]] += 1
+
+            names = []
+            for entity, pattern in _NAME_RE.items():
+                match = pattern.search(mm)
+                if match is None:
+                    names.append(None)
+                    continue
+                raw = match.group(1)
+                if b"\\" in raw:
+                    # STEP escape codes (\X2\ e.d.) laten we aan ifcopenshell over
+                    return None
+                name = raw[1:-1].replace(b"''", b"'").decode('utf-8', 'replace')
+                names.append(name or 'Onbekend')
+    except (OSError, ValueError):
+        return None
+
+    return names[0], names[1], tuple(counts)
+
+
+# Afmeting van het gerenderde IFC overzicht (breedte, hoogte)
+_SUMMARY_SIZE = (500, 400)
+
+
+class _SummaryRenderSignals(QObject):
+    """Signalen van de achtergrond render taak voor het IFC overzicht"""
+
+    renderReady = Signal(object, QImage)  # cache sleutel, gerenderde afbeelding
+
+
+class _SummaryRenderTask(QRunnable):
+    """Render het IFC overzicht in een worker thread naar een QImage"""
+
+    def __init__(self, key, data_fn, paint_fn, signals: _SummaryRenderSignals):
+        super().__init__()
+        self._key = key
+        self._data_fn = data_fn
+        self._paint_fn = paint_fn
+        self._signals = signals
+
+    def run(self):
+        try:
+            image = self._paint_fn(self._data_fn())
+        except Exception as e:
+            print(f"IFC render error: {e}")
+            return
+        self._signals.renderReady.emit(self._key, image)
+
+
 class IFCViewer(QWidget):
     """IFC 3D model viewer (2D projectie)"""
 
+    tab_title = "{name}"
+
+    _labels = ("Muren", "Vloeren/Daken", "Ramen", "Deuren")
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._model = None
+        # Alleen de samenvatting wordt bewaard, niet het model of de elementen
+        self._project_name: Optional[str] = None
+        self._building_name: Optional[str] = None
+        self._counts: Optional[tuple[int, int, int, int]] = None
+        self._file_mtime = 0.0
+
+        # Gerenderde overzichten per (weergave, bestand mtime)
+        self._render_cache: dict[tuple[str, float], QImage] = {}
+        self._pending_key: Optional[tuple[str, float]] = None
+        # Zonder parent: de taak houdt de signalen vast en kan dus nog emitten als
+        # deze viewer al gesloten is; de verbinding vervalt dan met de viewer
+        self._render_signals = _SummaryRenderSignals()
+        self._render_signals.renderReady.connect(self._on_render_ready)
+
+        # Twee pixmap buffers die om beurten getoond worden
+        self._pix_pool = [QPixmap(*_SUMMARY_SIZE), QPixmap(*_SUMMARY_SIZE)]
+        self._pix_idx = 0
 
         self._setup_ui()
 
@@ -794,13 +953,16 @@ class IFCViewer(QWidget):
         self._info_label.setAlignment(Qt.AlignCenter)
         self._info_label.setStyleSheet("color: #666; font-size: 11pt;")
 
-    def open_file(self, file_path: str) -> bool:
+    def load(self, file_path: str) -> bool:
         """Open een IFC bestand"""
         try:
-            import ifcopenshell
-            import ifcopenshell.geom
+            summary = _scan_ifc_summary(file_path)
+            if summary is None:
+                summary = self._read_summary(file_path)
+            self._project_name, self._building_name, self._counts = summary
 
-            self._model = ifcopenshell.open(file_path)
+            self._file_mtime = Path(file_path).stat().st_mtime
+            self._render_cache.clear()
             self._render_view()
             return True
         except ImportError:
@@ -811,88 +973,176 @@ class IFCViewer(QWidget):
             QMessageBox.critical(self, "Fout", f"Kan IFC niet openen:\n{str(e)}")
             return False
 
+    @staticmethod
+    def _read_summary(file_path: str) -> tuple:
+        """Lees het overzicht via ifcopenshell (volledig model parsen)"""
+        import ifcopenshell
+
+        model = ifcopenshell.open(file_path)
+
+        project = model.by_type("IfcProject")
+        buildings = model.by_type("IfcBuilding")
+        counts = (
+            len(model.by_type("IfcWall")),
+            len(model.by_type("IfcSlab")),
+            len(model.by_type("IfcWindow")),
+            len(model.by_type("IfcDoor")),
+        )
+        return (
+            (project[0].Name or 'Onbekend') if project else None,
+            (buildings[0].Name or 'Onbekend') if buildings else None,
+            counts,
+        )
+
     def _render_view(self):
-        """Render het IFC model"""
-        if not self._model:
-            return
+        """Render het IFC model voor de huidige weergave"""
+        self._on_view_changed(self._view_combo.currentText())
+
+    def _render_view_data(self) -> dict:
+        """Verzamel de overzichtsgegevens voor het tekenen (draait in worker)"""
+        return {
+            "project": self._project_name,
+            "building": self._building_name,
+            "elements": tuple(zip(self._labels, self._counts)),
+        }
+
+    @staticmethod
+    def _render_view_paint(data: dict) -> QImage:
+        """Teken het overzicht in een QImage (thread-safe, in tegenstelling tot QPixmap)"""
+        image = QImage(*_SUMMARY_SIZE, QImage.Format_ARGB32_Premultiplied)
+        image.fill(QColor(240, 240, 240))
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        try:
-            # Verzamel project info
-            project = self._model.by_type("IfcProject")
-            buildings = self._model.by_type("IfcBuilding")
-            walls = self._model.by_type("IfcWall")
-            slabs = self._model.by_type("IfcSlab")
-            windows = self._model.by_type("IfcWindow")
-            doors = self._model.by_type("IfcDoor")
-
-            # Maak info weergave
-            pixmap = QPixmap(500, 400)
-            pixmap.fill(QColor(240, 240, 240))
-
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-
-            # Header
-            painter.setPen(QColor(41, 98, 255))
-            font = QFont("Arial", 14, QFont.Bold)
-            painter.setFont(font)
-            painter.drawText(20, 35, "IFC Model Overzicht")
-
-            # Lijn
-            painter.setPen(QPen(QColor(41, 98, 255), 2))
-            painter.drawLine(20, 45, 480, 45)
-
-            # Info
-            painter.setPen(Qt.black)
-            font = QFont("Arial", 11)
-            painter.setFont(font)
-
-            y = 80
-            line_height = 28
-
-            if project:
-                painter.drawText(30, y, f"Project: {project[0].Name or 'Onbekend'}")
-                y += line_height
-
-            if buildings:
-                painter.drawText(30, y, f"Gebouw: {buildings[0].Name or 'Onbekend'}")
-                y += line_height
-
-            y += 10
-            painter.drawText(30, y, f"Elementen:")
+        # Header
+        painter.setPen(QColor(41, 98, 255))
+        font = QFont("Arial", 14, QFont.Bold)
+        painter.setFont(font)
+        painter.drawText(20, 35, "IFC Model Overzicht")
+
+        # Lijn
+        painter.setPen(QPen(QColor(41, 98, 255), 2))
+        painter.drawLine(20, 45, 480, 45)
+
+        # Info
+        painter.setPen(Qt.black)
+        font = QFont("Arial", 11)
+        painter.setFont(font)
+
+        y = 80
+        line_height = 28
+
+        if data["project"] is not None:
+            painter.drawText(30, y, f"Project: {data['project']}")
             y += line_height
 
-            # Element tellingen
-            painter.setPen(QColor(80, 80, 80))
-            elements = [
-                (f"Muren: {len(walls)}", walls),
-                (f"Vloeren/Daken: {len(slabs)}", slabs),
-                (f"Ramen: {len(windows)}", windows),
-                (f"Deuren: {len(doors)}", doors),
-            ]
+        if data["building"] is not None:
+            painter.drawText(30, y, f"Gebouw: {data['building']}")
+            y += line_height
 
-            for text, items in elements:
-                painter.drawText(50, y, text)
-                y += 25
+        y += 10
+        painter.drawText(30, y, f"Elementen:")
+        y += line_height
 
-            # Hint
-            y += 20
-            painter.setPen(QColor(150, 150, 150))
-            font = QFont("Arial", 9)
-            painter.setFont(font)
-            painter.drawText(30, y, "Tip: Gebruik Bonsai in Blender voor volledige 3D weergave")
+        # Element tellingen
+        painter.setPen(QColor(80, 80, 80))
+        for label, count in data["elements"]:
+            painter.drawText(50, y, f"{label}: {count}")
+            y += 25
 
-            painter.end()
+        # Hint
+        y += 20
+        painter.setPen(QColor(150, 150, 150))
+        font = QFont("Arial", 9)
+        painter.setFont(font)
+        painter.drawText(30, y, "Tip: Gebruik Bonsai in Blender voor volledige 3D weergave")
 
-            self._view.set_pixmap(pixmap)
+        painter.end()
 
-        except Exception as e:
-            print(f"IFC render error: {e}")
+        return image
+
+    def _show_image(self, image: QImage):
+        """Toon een overzicht via de pixmap pool i.p.v. een nieuwe QPixmap"""
+        pixmap = self._pix_pool[self._pix_idx]
+        if pixmap.size() != image.size():
+            pixmap = QPixmap(image.size())
+            self._pix_pool[self._pix_idx] = pixmap
+        self._pix_idx ^= 1
+
+        pixmap.convertFromImage(image)
+        self._view.set_pixmap(pixmap)
+
+    def _on_render_ready(self, key, image: QImage):
+        """Verwerk een gerenderd overzicht uit de worker thread"""
+        self._render_cache[key] = image
+        if key == self._pending_key:
+            self._show_image(image)
 
     def _on_view_changed(self, view_type: str):
         """Verwerk view wijziging"""
+        if self._counts is None:
+            return
+
         # In de toekomst: verschillende projecties renderen
-        self._render_view()
+        key = (view_type, self._file_mtime)
+        self._pending_key = key
+
+        image = self._render_cache.get(key)
+        if image is not None:
+            self._show_image(image)
+            return
+
+        QThreadPool.globalInstance().start(_SummaryRenderTask(
+            key, self._render_view_data, self._render_view_paint, self._render_signals
+        ))
+
+
+# Stylesheets voor het documentpaneel (eenmalig opgebouwd, gedeeld door alle instanties)
+_HEADER_QSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f0f0f0, stop:1 #e0e0e0);
+        border-bottom: 1px solid #ccc;
+    }
+"""
+
+_OPEN_BTN_QSS = """
+    QToolButton {
+        font-size: 14pt;
+        font-weight: bold;
+        border: 1px solid #ccc;
+        border-radius: 3px;
+        background: #fff;
+    }
+    QToolButton:hover {
+        background: #e0e0e0;
+    }
+"""
+
+_TABS_QSS = """
+    QTabWidget::pane {
+        border: none;
+        background: #f5f5f5;
+    }
+    QTabBar::tab {
+        background: #e0e0e0;
+        border: 1px solid #ccc;
+        border-bottom: none;
+        padding: 6px 12px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background: #f5f5f5;
+        border-bottom: 1px solid #f5f5f5;
+    }
+"""
+
+_PLACEHOLDER_QSS = """
+    color: #999;
+    font-size: 11pt;
+    padding: 40px;
+"""
 
 
 class DocumentViewerPanel(QWidget):
@@ -913,13 +1163,7 @@ class DocumentViewerPanel(QWidget):
         # Header met titel en knoppen
         header = QFrame()
         header.setFrameShape(QFrame.NoFrame)
-        header.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f0f0f0, stop:1 #e0e0e0);
-                border-bottom: 1px solid #ccc;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(8, 4, 8, 4)
 
@@ -934,18 +1178,7 @@ class DocumentViewerPanel(QWidget):
         self._open_btn.setText("+")
         self._open_btn.setToolTip("Document openen")
         self._open_btn.setFixedSize(24, 24)
-        self._open_btn.setStyleSheet("""
-            QToolButton {
-                font-size: 14pt;
-                font-weight: bold;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                background: #fff;
-            }
-            QToolButton:hover {
-                background: #e0e0e0;
-            }
-        """)
+        self._open_btn.setStyleSheet(_OPEN_BTN_QSS)
         self._open_btn.clicked.connect(self._open_document)
         header_layout.addWidget(self._open_btn)
 
@@ -955,33 +1188,13 @@ class DocumentViewerPanel(QWidget):
         self._tabs = QTabWidget()
         self._tabs.setTabsClosable(True)
         self._tabs.tabCloseRequested.connect(self._close_tab)
-        self._tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background: #f5f5f5;
-            }
-            QTabBar::tab {
-                background: #e0e0e0;
-                border: 1px solid #ccc;
-                border-bottom: none;
-                padding: 6px 12px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: #f5f5f5;
-                border-bottom: 1px solid #f5f5f5;
-            }
-        """)
+        self._tabs.setStyleSheet(_TABS_QSS)
         layout.addWidget(self._tabs)
 
         # Placeholder wanneer geen documenten open zijn
         self._placeholder = QLabel("Sleep documenten hierheen\nof klik + om te openen")
         self._placeholder.setAlignment(Qt.AlignCenter)
-        self._placeholder.setStyleSheet("""
-            color: #999;
-            font-size: 11pt;
-            padding: 40px;
-        """)
+        self._placeholder.setStyleSheet(_PLACEHOLDER_QSS)
         layout.addWidget(self._placeholder)
 
         self._update_placeholder()
@@ -993,8 +1206,8 @@ class DocumentViewerPanel(QWidget):
         self._placeholder.setVisible(not has_tabs)
 
     def _open_document(self):
-        """Open een document via dialoog"""
-        file_path, _ = QFileDialog.getOpenFileName(
+        """Open een of meer documenten via dialoog"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Document Openen",
             "",
@@ -1005,44 +1218,52 @@ class DocumentViewerPanel(QWidget):
             "Alle Bestanden (*.*)"
         )
 
-        if file_path:
-            self.open_file(file_path)
+        if file_paths:
+            self.open_files(file_paths)
 
     def open_file(self, file_path: str) -> bool:
         """Open een bestand in de juiste viewer"""
         path = Path(file_path)
-        suffix = path.suffix.lower()
-
-        viewer = None
-        if suffix == ".pdf":
-            viewer = PDFViewer()
-        elif suffix == ".ifc":
-            # Gebruik de echte 3D viewer voor IFC bestanden
-            global IFC3DViewer
-            if IFC3DViewer is None:
-                from .ifc_3d_viewer import IFC3DViewer as _IFC3DViewer
-                IFC3DViewer = _IFC3DViewer
-            viewer = IFC3DViewer()
-        elif suffix in (".dxf", ".dwg"):
-            viewer = DXFViewer()
-        else:
+        suffix = path.suffix.casefold()
+
+        if suffix not in _VIEWER_IMPORTS:
             QMessageBox.warning(self, "Onbekend formaat",
                                 f"Bestandsformaat '{suffix}' wordt niet ondersteund.")
             return False
 
-        # IFC3DViewer gebruikt load_file i.p.v. open_file
-        if suffix == ".ifc":
-            viewer.load_file(file_path)
-            index = self._tabs.addTab(viewer, f"🏗️ {path.name}")
-            self._tabs.setCurrentIndex(index)
-            self._update_placeholder()
-            return True
-        elif viewer.open_file(file_path):
-            index = self._tabs.addTab(viewer, path.name)
+        viewer = _load_viewer(suffix)()
+        if not viewer.load(file_path):
+            return False
+
+        with self._batched_tab_changes():
+            index = self._tabs.addTab(viewer, viewer.tab_title.format(name=path.name))
             self._tabs.setCurrentIndex(index)
             self._update_placeholder()
-            return True
-        return False
+        return True
+
+    def open_files(self, file_paths: Iterable[str]) -> int:
+        """
+        Open meerdere bestanden tegelijk (bijv. bij slepen en neerzetten).
+
+        Returns:
+            Aantal succesvol geopende bestanden
+        """
+        with self._batched_tab_changes():
+            return sum(1 for file_path in file_paths if self.open_file(file_path))
+
+    @contextmanager
+    def _batched_tab_changes(self):
+        """Bundel tab wijzigingen tot één relayout en repaint aan het einde"""
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        signals_blocked = self._tabs.blockSignals(True)
+        try:
+            yield
+        finally:
+            self._tabs.blockSignals(signals_blocked)
+            if updates_enabled:
+                self.setUpdatesEnabled(True)
+                self.update()
 
     def open_pdf(self):
         """Open specifiek een PDF via dialoog"""
@@ -1078,13 +1299,19 @@ class DocumentViewerPanel(QWidget):
 
     def _close_tab(self, index: int):
         """Sluit een document tab"""
+        viewer = self._tabs.widget(index)
         self._tabs.removeTab(index)
         self._update_placeholder()
 
+        # removeTab verwijdert de viewer niet; close() geeft hem de kans
+        # herbruikbare onderdelen (zoals de 3D viewer pagina) af te staan
+        viewer.close()
+        viewer.deleteLater()
+
     def set_measuring(self, enabled: bool):
         """Schakel maatvoering in/uit voor huidige viewer"""
         current = self._tabs.currentWidget()
-        if current and hasattr(current, 'set_measuring'):
+        if type(current) in _MEASURING_CAPABLE:
             current.set_measuring(enabled)
 
     def current_viewer(self):
@@ -2,17 +2,649 @@
 Icons - 3D-stijl iconen genereren voor de ribbon toolbar
 """
 
-from PySide6.QtGui import QIcon, QPixmap, QImage, QPainter, QColor, QLinearGradient, QPen, QBrush, QFont, QPainterPath
-from PySide6.QtCore import Qt, QRect, QRectF, QPointF
-import math
+from PySide6.QtGui import (
+    QIcon, QPixmap, QPixmapCache, QImage, QPainter, QPicture, QColor,
+    QLinearGradient, QPen, QBrush, QFont, QFontMetricsF, QPainterPath, QPolygonF
+)
+from PySide6.QtCore import (
+    Qt, QLine, QRect, QRectF, QPointF, QStandardPaths,
+    QRunnable, QThreadPool, QMutex, QMutexLocker
+)
+import hashlib
+from functools import lru_cache, wraps
+from pathlib import Path
+
+# Vaste kleuren en pennen, één keer aangemaakt en gedeeld door alle iconen
+_COLOR_WHITE = QColor(255, 255, 255)
+_COLOR_GREY_DARK = QColor(50, 50, 50)
+_COLOR_GREY = QColor(100, 100, 100)
+_COLOR_GREY_MEDIUM = QColor(150, 150, 150)
+_COLOR_ORANGE = QColor(255, 152, 0)
+_COLOR_ORANGE_LIGHT = QColor(255, 183, 77)
+_COLOR_AMBER = QColor(255, 193, 7)
+_COLOR_RED = QColor(244, 67, 54)
+_COLOR_RED_DARK = QColor(211, 47, 47)
+_COLOR_GREEN = QColor(76, 175, 80)
+_COLOR_BLUE = QColor(33, 150, 243)
+_COLOR_BLUE_MEDIUM = QColor(30, 136, 229)
+_COLOR_BLUE_LIGHT = QColor(66, 165, 245)
+_COLOR_BLUE_SKY = QColor(100, 181, 246)
+_COLOR_BLUE_SOFT = QColor(187, 222, 251)
+_COLOR_BLUE_PALE = QColor(227, 242, 253)
+_COLOR_PURPLE = QColor(103, 58, 183)
+_COLOR_TEAL = QColor(0, 150, 136)
+_COLOR_TEAL_DARK = QColor(0, 121, 107)
+_COLOR_SHADOW = QColor(0, 0, 0, 50)
+_COLOR_BACKGROUND = QColor(240, 240, 240)
+
+_PEN_AMBER_DARK = QPen(QColor(180, 80, 0), 1)
+_PEN_BLACK = QPen(QColor(0, 0, 0), 1)
+_PEN_BLACK_SOFT = QPen(QColor(20, 20, 20), 1)
+_PEN_BLUE_DARK = QPen(QColor(21, 101, 192), 1)
+_PEN_BLUE_DARK_2 = QPen(QColor(21, 101, 192), 2)
+_PEN_BLUE_LIGHT = QPen(_COLOR_BLUE_LIGHT, 1)
+_PEN_BLUE_LIGHT_2 = QPen(_COLOR_BLUE_LIGHT, 2)
+_PEN_BLUE_MEDIUM_2 = QPen(_COLOR_BLUE_MEDIUM, 2)
+_PEN_BORDER = QPen(QColor(180, 180, 180), 1)
+_PEN_BROWN_DARK = QPen(QColor(93, 64, 55), 1)
+_PEN_CSV_ORANGE = QPen(QColor(194, 65, 12), 1)
+_PEN_EXCEL_GREEN = QPen(QColor(20, 70, 45), 1)
+_PEN_FOLDER = QPen(QColor(245, 127, 23), 1)
+_PEN_GREEN_DARK = QPen(QColor(56, 142, 60), 1)
+_PEN_GREEN_DARK_2 = QPen(QColor(46, 125, 50), 2)
+_PEN_GREY = QPen(_COLOR_GREY, 1)
+_PEN_GREY_2 = QPen(_COLOR_GREY, 2)
+_PEN_GREY_DARK = QPen(QColor(60, 60, 60), 1)
+_PEN_GREY_DARK_2 = QPen(_COLOR_GREY_DARK, 2)
+_PEN_GREY_OUTLINE = QPen(QColor(120, 120, 120), 1)
+_PEN_INDIGO_DARK = QPen(QColor(40, 53, 147), 1)
+_PEN_LINE_LIGHT = QPen(QColor(200, 200, 200), 1)
+_PEN_NAVY = QPen(QColor(0, 60, 120), 1)
+_PEN_ODS_GREEN = QPen(QColor(21, 128, 61), 1)
+_PEN_ORANGE_DARK = QPen(QColor(245, 124, 0), 1)
+_PEN_ORANGE_DEEP = QPen(QColor(230, 81, 0), 1)
+_PEN_PURPLE_DARK = QPen(QColor(69, 39, 160), 1)
+_PEN_RED_DARK = QPen(QColor(183, 28, 28), 1)
+_PEN_SLATE_2 = QPen(QColor(75, 85, 99), 2)
+_PEN_TEAL_DARK = QPen(QColor(0, 105, 92), 1)
+_PEN_TREE_BOX = QPen(QColor(130, 130, 130), 1)
+_PEN_TREE_SIGN = QPen(QColor(80, 80, 80), 2)
+_PEN_WHITE = QPen(_COLOR_WHITE, 1)
+_PEN_WHITE_TRANSLUCENT = QPen(QColor(255, 255, 255, 150), 1)
+_PEN_LENS_HANDLE = QPen(_COLOR_GREY, 3, Qt.SolidLine, Qt.RoundCap)
+
+_FONT_CACHE: dict[tuple[int, bool, bool], QFont] = {}
+
+
+def _get_font(point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """Haal een gedeeld Arial font op, één instantie per combinatie"""
+    key = (point_size, bold, italic)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont("Arial", point_size, QFont.Bold if bold else QFont.Normal)
+        font.setItalic(italic)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Kleurverlopen (begin, eind) die door meerdere iconen gedeeld worden
+_GRADIENT_STOPS = {
+    "red_button": (_COLOR_RED, _COLOR_RED_DARK),
+    "red_bin": (QColor(239, 83, 80), _COLOR_RED_DARK),
+    "blue_button": (_COLOR_BLUE_LIGHT, _COLOR_BLUE_MEDIUM),
+    "blue_arrow": (_COLOR_BLUE_SKY, _COLOR_BLUE),
+    "lens": (_COLOR_BLUE_PALE, _COLOR_BLUE_SOFT),
+    "folder_back": (_COLOR_AMBER, _COLOR_ORANGE),
+    "folder_front": (QColor(255, 213, 79), _COLOR_ORANGE_LIGHT),
+    "green_arrow": (QColor(102, 187, 106), QColor(67, 160, 71)),
+    "writer_blue": (QColor(0, 102, 204), QColor(0, 76, 153)),
+}
+
+
+@lru_cache(maxsize=64)
+def _brush(key: str, x1: int, y1: int, x2: int, y2: int) -> QBrush:
+    """Gedeelde gradient brush voor een kleurverloop tussen twee punten"""
+    start, end = _GRADIENT_STOPS[key]
+    gradient = QLinearGradient(x1, y1, x2, y2)
+    gradient.setColorAt(0, start)
+    gradient.setColorAt(1, end)
+    return QBrush(gradient)
+
+
+# Versie van de icoon-tekeningen; verhoog bij wijzigingen zodat de PNG cache en de bake vervallen
+_ICON_CACHE_VERSION = 6
+
+# Grootte waarvoor de tekeningen ontworpen zijn (vaste pixel-marges)
+_MASTER_SIZE = 32
+
+# Groottes die create_icons.py als PNG in het Qt resource systeem bakt
+_BAKED_SIZES = (_MASTER_SIZE, 48)
+
+try:
+    from . import icons_rc  # gegenereerd door create_icons.py, registreert de resources
+except ImportError:
+    icons_rc = None
+# Een bake van oudere tekeningen niet gebruiken; de iconen worden dan opnieuw getekend
+_HAS_BAKED_ICONS = getattr(icons_rc, "ICON_CACHE_VERSION", None) == _ICON_CACHE_VERSION
+if icons_rc is not None and not _HAS_BAKED_ICONS:
+    icons_rc.qCleanupResources()
+
+
+@lru_cache(maxsize=1)
+def _icon_cache_dir() -> Path | None:
+    """Map voor gecachte icoon PNG's, of None als er geen schrijfbare locatie is"""
+    location = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    if not location:
+        return None
+    return Path(location) / "iconcache"
+
+
+def _render_image(paint_fn, size: int, image: QImage | None = None) -> QImage:
+    """
+    Teken een icoon op een transparante QImage.
+
+    Puur CPU raster werk zonder platform-integratie, dus ook veilig buiten
+    de GUI thread. Premultiplied ARGB is het formaat waarin Qt composeert.
+    Teken-functies mogen antialiasing uitzetten voor rechte vlakken en
+    lijnen op hele pixels; dat scheelt de dekkingsberekening per pixel.
+    Een meegegeven image wordt leeggemaakt en hergebruikt.
+    """
+    if image is None:
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    paint_fn(painter, size)
+    painter.end()
+    return image
+
+
+# Herbruikbare tekenbuffers per grootte voor _render. QPixmap.fromImage kopieert
+# de pixels, dus de buffer is direct weer vrij; alleen vanuit de GUI thread.
+_scratch_images: dict[int, QImage] = {}
+
+
+def _render(paint_fn, size: int) -> QPixmap:
+    """Teken een icoon en zet het pas aan het eind om naar een QPixmap"""
+    image = _scratch_images.get(size)
+    if image is None:
+        image = _scratch_images[size] = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    return QPixmap.fromImage(_render_image(paint_fn, size, image))
+
+
+def _cache_path(name: str, size: int) -> Path | None:
+    """Pad van een icoon in de PNG cache"""
+    cache_dir = _icon_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.md5(f"{name}:{size}:{_ICON_CACHE_VERSION}".encode()).hexdigest()
+    return cache_dir / f"{digest}.png"
+
+
+def _load_or_render(name: str, size: int, paint_fn) -> QPixmap:
+    """
+    Laad een icoon uit de PNG cache op schijf, of teken het en sla het op.
+
+    Een PNG decoderen is veel goedkoper dan de tientallen QPainter
+    aanroepen per icoon, dus alleen de eerste start betaalt het tekenen.
+    """
+    path = _cache_path(name, size)
+    if path is not None:
+        pixmap = QPixmap()
+        if pixmap.load(str(path), "PNG"):
+            return pixmap
+
+    pixmap = _render(paint_fn, size)
+    if path is None:
+        return pixmap
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pixmap.save(str(path), "PNG")
+    except OSError:
+        pass  # Cache is optioneel; volgende start tekent gewoon opnieuw
+    return pixmap
+
+
+# Teken-functies per icoonnaam, in registratievolgorde
+_PAINTERS: dict[str, object] = {}
+
+_prerender_pool: QThreadPool | None = None
+_prerender_lock = QMutex()
+_prerendered: dict[str, QImage] = {}
+_prerender_pending = False
+
+
+class _IconRenderJob(QRunnable):
+    """Tekent één icoon als QImage in een worker thread"""
+
+    def __init__(self, name: str, paint_fn):
+        super().__init__()
+        self._name = name
+        self._paint_fn = paint_fn
+
+    def run(self):
+        image = _render_image(self._paint_fn, _MASTER_SIZE)
+        with QMutexLocker(_prerender_lock):
+            _prerendered[self._name] = image
+
+
+def start_icon_prerender():
+    """
+    Start het tekenen van alle iconen op de achtergrond.
+
+    Aanroepen direct na het aanmaken van de QApplication; het tekenen
+    overlapt dan met het opbouwen van het hoofdvenster. Zijn de iconen
+    gebakken of staat de atlas al in de PNG cache, dan is er niets te doen.
+    """
+    global _prerender_pool, _prerender_pending
+    if _HAS_BAKED_ICONS:
+        return
+    path = _atlas_path()
+    if path is not None and path.exists():
+        return
+
+    if _prerender_pool is None:
+        # Eigen pool, zodat wachten niet afhangt van andere achtergrondtaken
+        _prerender_pool = QThreadPool()
+
+    for name, paint_fn in _PAINTERS.items():
+        _prerender_pool.start(_IconRenderJob(name, paint_fn))
+    _prerender_pending = True
+
+
+def _take_prerendered() -> dict[str, QImage]:
+    """Haal alle voorgerenderde iconen op; wacht zo nodig op de workers"""
+    global _prerender_pending
+    if not _prerender_pending:
+        return {}
+    _prerender_pool.waitForDone()
+    _prerender_pending = False
+    with QMutexLocker(_prerender_lock):
+        images = dict(_prerendered)
+        _prerendered.clear()
+    return images
+
+
+# Alle iconen op master-grootte staan in één sprite sheet: één QPainter
+# pass bij de eerste start en één PNG om te laden bij volgende starts.
+_ATLAS_COLUMNS = 8
+_atlas: QPixmap | None = None
+_atlas_rects: dict[str, QRect] = {}
+
+
+def _atlas_path() -> Path | None:
+    """Pad van de atlas in de PNG cache; de naamlijst zit in de hash"""
+    return _cache_path("atlas:" + ",".join(_PAINTERS), _MASTER_SIZE)
+
+
+def _build_atlas() -> QPixmap:
+    """Laad de icoon-atlas uit de cache, of teken alle iconen in één pass"""
+    size = _MASTER_SIZE
+    for index, name in enumerate(_PAINTERS):
+        row, col = divmod(index, _ATLAS_COLUMNS)
+        _atlas_rects[name] = QRect(col * size, row * size, size, size)
+
+    path = _atlas_path()
+    atlas = QPixmap()
+    if path is not None and atlas.load(str(path), "PNG"):
+        return atlas
+
+    rows = -(-len(_PAINTERS) // _ATLAS_COLUMNS)
+    sheet = QImage(_ATLAS_COLUMNS * size, rows * size, QImage.Format_ARGB32_Premultiplied)
+    sheet.fill(Qt.transparent)
+
+    prerendered = _take_prerendered()
+    painter = QPainter(sheet)
+    painter.setRenderHint(QPainter.Antialiasing)
+    for name, paint_fn in _PAINTERS.items():
+        rect = _atlas_rects[name]
+        icon_image = prerendered.get(name)
+        if icon_image is not None:
+            painter.drawImage(rect.topLeft(), icon_image)
+            continue
+        painter.save()
+        painter.translate(rect.topLeft())
+        painter.setClipRect(0, 0, size, size)
+        paint_fn(painter, size)
+        painter.restore()
+    painter.end()
+    atlas = QPixmap.fromImage(sheet)
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atlas.save(str(path), "PNG")
+        except OSError:
+            pass
+    return atlas
+
+
+def _baked_pixmap(name: str, size: int) -> QPixmap | None:
+    """Gebakken icoon uit het Qt resource systeem, indien aanwezig"""
+    if not _HAS_BAKED_ICONS or size not in _BAKED_SIZES:
+        return None
+    pixmap = QPixmap(f":/icons/{name}_{size}.png")
+    return None if pixmap.isNull() else pixmap
+
+
+def _atlas_pixmap(name: str) -> QPixmap:
+    """Uitsnede van één icoon uit de atlas"""
+    global _atlas
+    if _atlas is None:
+        _atlas = _build_atlas()
+    return _atlas.copy(_atlas_rects[name])
+
+
+def _icon_factory(name: str):
+    """
+    Decorator die een teken-functie (painter, size) omzet in een
+    factory (size) -> QIcon. Pixmaps worden gedeeld via de globale
+    QPixmapCache; daaronder komen ze uit de gebakken resources
+    (create_icons.py), de atlas (master-grootte) of de PNG cache op
+    schijf (grotere maten).
+
+    Kleinere maten dan _MASTER_SIZE delen één master-rendering; QIcon
+    schaalt die zelf af, zodat elk icoon in de praktijk één keer getekend wordt.
+    """
+    def decorator(paint_fn):
+        _PAINTERS[name] = paint_fn
+
+        def build(render_size: int) -> QIcon:
+            key = f"opencalc:{name}:{render_size}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None or pixmap.isNull():
+                pixmap = _baked_pixmap(name, render_size)
+                if pixmap is None:
+                    if render_size == _MASTER_SIZE:
+                        pixmap = _atlas_pixmap(name)
+                    else:
+                        pixmap = _load_or_render(name, render_size, paint_fn)
+                QPixmapCache.insert(key, pixmap)
+            return QIcon(pixmap)
+
+        @wraps(paint_fn)
+        def factory(size: int = 32) -> QIcon:
+            return build(max(size, _MASTER_SIZE))
+        return factory
+    return decorator
+
+
+def _recorded(paint_fn):
+    """
+    Decorator die de tekenopdrachten van een icoon per grootte één keer
+    opneemt in een QPicture; daarna is tekenen één drawPicture aanroep.
+    """
+    @lru_cache(maxsize=8)
+    def picture(size: int) -> QPicture:
+        recording = QPicture()
+        painter = QPainter(recording)
+        painter.setRenderHint(QPainter.Antialiasing)
+        paint_fn(painter, size)
+        painter.end()
+        return recording
+
+    @wraps(paint_fn)
+    def replay(painter: QPainter, size: int):
+        painter.drawPicture(0, 0, picture(size))
+    return replay
+
+
+def _polygon_path(*points) -> QPainterPath:
+    """Bouw een gesloten QPainterPath uit (x, y) punten"""
+    path = QPainterPath()
+    path.addPolygon(QPolygonF([QPointF(x, y) for x, y in points]))
+    path.closeSubpath()
+    return path
+
+
+# Vaste vormen worden per grootte één keer opgebouwd. De maten gebruiken
+# vaste pixel-marges, dus ze zijn niet als eenheidsvorm te schalen.
+
+@lru_cache(maxsize=8)
+def _folder_back_path(size: int) -> QPainterPath:
+    """Achterkant van de map met tab"""
+    margin = 3
+    return _polygon_path(
+        (margin, margin + 6),
+        (margin + 8, margin + 6),
+        (margin + 10, margin + 2),
+        (size - margin, margin + 2),
+        (size - margin, size - margin - 2),
+        (margin, size - margin - 2),
+    )
+
+
+@lru_cache(maxsize=8)
+def _trash_body_path(size: int) -> QPainterPath:
+    """Bak van de prullenbak"""
+    margin = 4
+    return _polygon_path(
+        (margin + 2, margin + 8),
+        (margin + 4, size - margin),
+        (size - margin - 4, size - margin),
+        (size - margin - 2, margin + 8),
+    )
+
+
+@lru_cache(maxsize=8)
+def _cube_paths(size: int) -> tuple[QPainterPath, QPainterPath, QPainterPath]:
+    """Boven-, linker- en rechterkant van de IFC kubus"""
+    margin = 3
+    half = size // 2
+    top = _polygon_path(
+        (half, margin),
+        (size - margin, margin + 8),
+        (half, margin + 16),
+        (margin, margin + 8),
+    )
+    left = _polygon_path(
+        (margin, margin + 8),
+        (half, margin + 16),
+        (half, size - margin),
+        (margin, size - margin - 8),
+    )
+    right = _polygon_path(
+        (size - margin, margin + 8),
+        (half, margin + 16),
+        (half, size - margin),
+        (size - margin, size - margin - 8),
+    )
+    return top, left, right
+
+
+@lru_cache(maxsize=8)
+def _arrow_up_path(size: int) -> QPainterPath:
+    """Pijl omhoog"""
+    center = size // 2
+    return _polygon_path(
+        (center, 4),
+        (size - 6, center + 2),
+        (center + 4, center + 2),
+        (center + 4, size - 4),
+        (center - 4, size - 4),
+        (center - 4, center + 2),
+        (6, center + 2),
+    )
+
+
+@lru_cache(maxsize=8)
+def _arrow_down_path(size: int) -> QPainterPath:
+    """Pijl omlaag"""
+    center = size // 2
+    return _polygon_path(
+        (center, size - 4),
+        (size - 6, center - 2),
+        (center + 4, center - 2),
+        (center + 4, 4),
+        (center - 4, 4),
+        (center - 4, center - 2),
+        (6, center - 2),
+    )
+
+
+@lru_cache(maxsize=32)
+def _rounded_square_path(size: int, margin: int, radius: int) -> QPainterPath:
+    """Afgerond vierkant met een vaste marge rondom, de achtergrond van veel iconen"""
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(margin, margin, size - 2*margin, size - 2*margin), radius, radius)
+    return path
+
+
+@lru_cache(maxsize=8)
+def _undo_paths(size: int) -> tuple[QPainterPath, QPainterPath]:
+    """Boog en pijlpunt van de ongedaan maken pijl (naar links)"""
+    center = size // 2
+    margin = 4
+    arc = QPainterPath()
+    arc.moveTo(margin + 6, center - 2)
+    arc.arcTo(margin + 4, margin + 4, size - 2*margin - 8, size - 2*margin - 4, 180, -180)
+    head = _polygon_path(
+        (margin + 2, center - 2),
+        (margin + 10, center - 8),
+        (margin + 10, center + 4),
+    )
+    return arc, head
+
+
+@lru_cache(maxsize=8)
+def _redo_paths(size: int) -> tuple[QPainterPath, QPainterPath]:
+    """Boog en pijlpunt van de opnieuw pijl (naar rechts)"""
+    center = size // 2
+    margin = 4
+    arc = QPainterPath()
+    arc.moveTo(size - margin - 6, center - 2)
+    arc.arcTo(margin + 4, margin + 4, size - 2*margin - 8, size - 2*margin - 4, 0, 180)
+    head = _polygon_path(
+        (size - margin - 2, center - 2),
+        (size - margin - 10, center - 8),
+        (size - margin - 10, center + 4),
+    )
+    return arc, head
+
+
+# Opcodes voor icoon-beschrijvingen als data. Een op is een tuple
+# (opcode, geometrie, brush, pen); None betekent geen brush/pen.
+_ROUND_RECT, _PATH, _ELLIPSE, _LINES = range(4)
+
+
+def _play(painter: QPainter, ops: tuple):
+    """Speel een reeks icoon-opcodes af op de painter"""
+    for op, geometry, brush, pen in ops:
+        painter.setBrush(Qt.NoBrush if brush is None else brush)
+        painter.setPen(Qt.NoPen if pen is None else pen)
+        if op == _ROUND_RECT:
+            painter.drawRoundedRect(*geometry)
+        elif op == _PATH:
+            painter.drawPath(geometry)
+        elif op == _ELLIPSE:
+            painter.drawEllipse(*geometry)
+        elif op == _LINES:
+            painter.drawLines(geometry)
+
+
+@lru_cache(maxsize=8)
+def _folder_ops(size: int) -> tuple:
+    """Map: achterkant met tab en voorkant"""
+    margin = 3
+    return (
+        (_PATH, _folder_back_path(size), _brush("folder_back", 0, 0, 0, size), _PEN_FOLDER),
+        (_ROUND_RECT, (margin, margin + 8, size - 2*margin, size - margin - 10, 2, 2),
+         _brush("folder_front", 0, size//2, 0, size), _PEN_FOLDER),
+    )
+
+
+@lru_cache(maxsize=16)
+def _zoom_ops(size: int, plus: bool) -> tuple:
+    """Vergrootglas met handvat en een plus- of minteken"""
+    sign = [QLine(9, 13, 17, 13)]
+    if plus:
+        sign.append(QLine(13, 9, 13, 17))
+    return (
+        (_ELLIPSE, (4, 4, 18, 18), _brush("lens", 4, 4, 20, 20), _PEN_BLUE_MEDIUM_2),
+        (_LINES, [QLine(19, 19, size - 4, size - 4)], None, _PEN_LENS_HANDLE),
+        (_LINES, sign, None, _PEN_BLUE_MEDIUM_2),
+    )
+
+
+@lru_cache(maxsize=64)
+def _glyph_path(text: str, point_size: int, bold: bool = False,
+                italic: bool = False) -> tuple[QPainterPath, float, float]:
+    """Tekst als QPainterPath met de regel bovenaan op y=0, plus breedte en regelhoogte"""
+    font = _get_font(point_size, bold, italic)
+    metrics = QFontMetricsF(font)
+    path = QPainterPath()
+    path.addText(0, metrics.ascent(), font, text)
+    return path, metrics.horizontalAdvance(text), metrics.ascent() + metrics.descent()
+
+
+def _draw_text_path(painter: QPainter, size: int, text: str, color: QColor,
+                    point_size: int, bold: bool = False, italic: bool = False,
+                    dy: int = 0):
+    """Teken tekst gecentreerd in het icoon, zoals drawText met AlignCenter"""
+    path, width, height = _glyph_path(text, point_size, bold, italic)
+    painter.fillPath(path.translated((size - width) / 2, (size - height) / 2 + dy), color)
 
 
+@lru_cache(maxsize=8)
+def _calc_button_rects(size: int) -> list[QRect]:
+    """Knoppenraster van de calculator"""
+    margin = 3
+    button_size = (size - 2*margin - 8) // 3
+    button_y_start = margin + 3 + size // 4 + 2
+    return [
+        QRect(margin + 3 + col * (button_size + 1),
+              button_y_start + row * (button_size + 1),
+              button_size - 1, button_size - 1)
+        for row in range(3)
+        for col in range(3)
+    ]
+
+
+@lru_cache(maxsize=8)
+def _bg_template(size: int) -> QImage:
+    """
+    Lichtgrijze afgeronde achtergrond met rand, gedeeld door de tekst-iconen.
+
+    Een QImage en geen QPixmap, zodat de pre-render workers hem ook kunnen
+    gebruiken; na de eerste keer is de achtergrond één drawImage aanroep.
+    """
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setBrush(_COLOR_BACKGROUND)
+    painter.setPen(_PEN_BORDER)
+    painter.drawPath(_rounded_square_path(size, 2, 4))
+    painter.end()
+    return image
+
+
+@lru_cache(maxsize=4)
+def _tree_box_template(size: int) -> QImage:
+    """Wit vierkant met rand, gedeeld door de tree expand/collapse iconen"""
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    margin = 2
+    box_size = size - 2 * margin
+    painter.setBrush(_COLOR_WHITE)
+    painter.setPen(_PEN_TREE_BOX)
+    painter.drawRect(margin, margin, box_size, box_size)
+    painter.end()
+    return image
+
+
+@lru_cache(maxsize=8)
 def create_gradient_icon(size: int, colors: tuple, shape: str = "rect") -> QPixmap:
     """Maak een basis icoon met gradient"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
 
-    painter = QPainter(pixmap)
+    painter = QPainter(image)
     painter.setRenderHint(QPainter.Antialiasing)
 
     # Gradient
@@ -32,131 +664,71 @@ def create_gradient_icon(size: int, colors: tuple, shape: str = "rect") -> QPixm
         painter.drawEllipse(rect)
 
     painter.end()
-    return pixmap
+    return QPixmap.fromImage(image)
 
 
-def create_3d_document_icon(size: int = 32) -> QIcon:
+@_icon_factory("document")
+def create_3d_document_icon(painter: QPainter, size: int):
     """Maak een 3D document icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Document met schaduw effect
     shadow_offset = 2
     margin = 4
 
     # Schaduw
-    painter.setBrush(QColor(0, 0, 0, 50))
+    painter.setBrush(_COLOR_SHADOW)
     painter.setPen(Qt.NoPen)
     painter.drawRoundedRect(margin + shadow_offset, margin + shadow_offset,
                             size - 2*margin, size - 2*margin, 2, 2)
 
     # Document achtergrond
     gradient = QLinearGradient(margin, margin, size - margin, size - margin)
-    gradient.setColorAt(0, QColor(255, 255, 255))
+    gradient.setColorAt(0, _COLOR_WHITE)
     gradient.setColorAt(1, QColor(230, 230, 230))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
+    painter.setPen(_PEN_BORDER)
     painter.drawRoundedRect(margin, margin, size - 2*margin - shadow_offset,
                             size - 2*margin - shadow_offset, 2, 2)
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Lijnen op document
-    painter.setPen(QPen(QColor(200, 200, 200), 1))
+    painter.setPen(_PEN_LINE_LIGHT)
     line_start = margin + 4
     line_end = size - margin - shadow_offset - 4
-    for i in range(3):
-        y = margin + 8 + i * 5
-        painter.drawLine(line_start, y, line_end, y)
-
-    painter.end()
-    return QIcon(pixmap)
+    painter.drawLines([QLine(line_start, y, line_end, y)
+                       for y in range(margin + 8, margin + 23, 5)])
 
 
-def create_3d_folder_icon(size: int = 32) -> QIcon:
+@_icon_factory("folder")
+@_recorded
+def create_3d_folder_icon(painter: QPainter, size: int):
     """Maak een 3D map icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    margin = 3
-
-    # Map achterkant
-    gradient_back = QLinearGradient(0, 0, 0, size)
-    gradient_back.setColorAt(0, QColor(255, 193, 7))
-    gradient_back.setColorAt(1, QColor(255, 152, 0))
-
-    painter.setBrush(QBrush(gradient_back))
-    painter.setPen(QPen(QColor(245, 127, 23), 1))
-
-    path = QPainterPath()
-    path.moveTo(margin, margin + 6)
-    path.lineTo(margin + 8, margin + 6)
-    path.lineTo(margin + 10, margin + 2)
-    path.lineTo(size - margin, margin + 2)
-    path.lineTo(size - margin, size - margin - 2)
-    path.lineTo(margin, size - margin - 2)
-    path.closeSubpath()
-    painter.drawPath(path)
+    _play(painter, _folder_ops(size))
 
-    # Map voorkant
-    gradient_front = QLinearGradient(0, size//2, 0, size)
-    gradient_front.setColorAt(0, QColor(255, 213, 79))
-    gradient_front.setColorAt(1, QColor(255, 183, 77))
-
-    painter.setBrush(QBrush(gradient_front))
-    painter.drawRoundedRect(margin, margin + 8, size - 2*margin, size - margin - 10, 2, 2)
-
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_save_icon(size: int = 32) -> QIcon:
+@_icon_factory("save")
+def create_3d_save_icon(painter: QPainter, size: int):
     """Maak een 3D opslaan icoon (diskette)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 4
 
     # Diskette body
-    gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(66, 165, 245))
-    gradient.setColorAt(1, QColor(30, 136, 229))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(21, 101, 192), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setBrush(_brush("blue_button", 0, 0, size, size))
+    painter.setPen(_PEN_BLUE_DARK)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Label
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(Qt.NoPen)
     label_margin = margin + 4
-    painter.drawRect(label_margin, size//2, size - 2*label_margin, size//2 - margin - 2)
+    painter.fillRect(label_margin, size//2, size - 2*label_margin, size//2 - margin - 2, _COLOR_WHITE)
 
     # Metalen schuif
-    painter.setBrush(QColor(180, 180, 180))
     slider_w = 8
-    painter.drawRect(size//2 - slider_w//2, margin + 2, slider_w, 8)
-
-    painter.end()
-    return QIcon(pixmap)
+    painter.fillRect(size//2 - slider_w//2, margin + 2, slider_w, 8, QColor(180, 180, 180))
 
 
-def create_3d_print_icon(size: int = 32) -> QIcon:
+@_icon_factory("print")
+def create_3d_print_icon(painter: QPainter, size: int):
     """Maak een 3D print icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Printer body
@@ -165,32 +737,23 @@ def create_3d_print_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(80, 80, 80))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(60, 60, 60), 1))
+    painter.setPen(_PEN_GREY_DARK)
     painter.drawRoundedRect(margin, size//3, size - 2*margin, size//2, 3, 3)
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Papier invoer
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(QPen(QColor(200, 200, 200), 1))
     paper_margin = margin + 6
-    painter.drawRect(paper_margin, margin, size - 2*paper_margin, size//3)
+    painter.fillRect(paper_margin, margin, size - 2*paper_margin, size//3, _COLOR_WHITE)
 
     # Papier uitvoer
-    painter.drawRect(paper_margin, size - margin - 6, size - 2*paper_margin, 8)
-
-    painter.end()
-    return QIcon(pixmap)
+    painter.fillRect(paper_margin, size - margin - 6, size - 2*paper_margin, 8, _COLOR_WHITE)
 
 
-def create_3d_cut_icon(size: int = 32) -> QIcon:
+@_icon_factory("cut")
+def create_3d_cut_icon(painter: QPainter, size: int):
     """Maak een 3D schaar icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Schaar bladen
-    painter.setPen(QPen(QColor(100, 100, 100), 3, Qt.SolidLine, Qt.RoundCap))
+    painter.setPen(QPen(_COLOR_GREY, 3, Qt.SolidLine, Qt.RoundCap))
 
     center = size // 2
 
@@ -200,12 +763,8 @@ def create_3d_cut_icon(size: int = 32) -> QIcon:
     painter.drawLine(center + 2, center, size - 4, 4)
 
     # Handvatten
-    gradient = QLinearGradient(0, center, 0, size)
-    gradient.setColorAt(0, QColor(244, 67, 54))
-    gradient.setColorAt(1, QColor(211, 47, 47))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(183, 28, 28), 1))
+    painter.setBrush(_brush("red_button", 0, center, 0, size))
+    painter.setPen(_PEN_RED_DARK)
 
     # Linker handvat
     painter.drawEllipse(2, size - 12, 10, 10)
@@ -213,57 +772,40 @@ def create_3d_cut_icon(size: int = 32) -> QIcon:
     painter.drawEllipse(size - 12, size - 12, 10, 10)
 
     # Verbindingspunt
-    painter.setBrush(QColor(150, 150, 150))
+    painter.setBrush(_COLOR_GREY_MEDIUM)
     painter.drawEllipse(center - 3, center - 3, 6, 6)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_copy_icon(size: int = 32) -> QIcon:
+@_icon_factory("copy")
+def create_3d_copy_icon(painter: QPainter, size: int):
     """Maak een 3D kopieer icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Achterste document
     gradient1 = QLinearGradient(8, 8, 24, 24)
     gradient1.setColorAt(0, QColor(200, 200, 200))
     gradient1.setColorAt(1, QColor(160, 160, 160))
 
     painter.setBrush(QBrush(gradient1))
-    painter.setPen(QPen(QColor(120, 120, 120), 1))
+    painter.setPen(_PEN_GREY_OUTLINE)
     painter.drawRoundedRect(8, 2, size - 12, size - 12, 2, 2)
 
     # Voorste document
     gradient2 = QLinearGradient(2, 8, 20, 28)
-    gradient2.setColorAt(0, QColor(255, 255, 255))
-    gradient2.setColorAt(1, QColor(240, 240, 240))
+    gradient2.setColorAt(0, _COLOR_WHITE)
+    gradient2.setColorAt(1, _COLOR_BACKGROUND)
 
     painter.setBrush(QBrush(gradient2))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
+    painter.setPen(_PEN_BORDER)
     painter.drawRoundedRect(2, 8, size - 12, size - 12, 2, 2)
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Lijnen
-    painter.setPen(QPen(QColor(200, 200, 200), 1))
-    for i in range(3):
-        y = 14 + i * 5
-        painter.drawLine(6, y, size - 16, y)
+    painter.setPen(_PEN_LINE_LIGHT)
+    painter.drawLines([QLine(6, y, size - 16, y) for y in (14, 19, 24)])
 
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_paste_icon(size: int = 32) -> QIcon:
+@_icon_factory("paste")
+def create_3d_paste_icon(painter: QPainter, size: int):
     """Maak een 3D plakken icoon (klembord)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 4
 
     # Klembord
@@ -272,94 +814,65 @@ def create_3d_paste_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(121, 85, 72))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(93, 64, 55), 1))
+    painter.setPen(_PEN_BROWN_DARK)
     painter.drawRoundedRect(margin, margin + 4, size - 2*margin, size - margin - 6, 3, 3)
 
     # Clip
-    painter.setBrush(QColor(150, 150, 150))
-    painter.setPen(QPen(QColor(100, 100, 100), 1))
+    painter.setBrush(_COLOR_GREY_MEDIUM)
+    painter.setPen(_PEN_GREY)
     clip_w = 12
     painter.drawRoundedRect(size//2 - clip_w//2, margin, clip_w, 8, 2, 2)
 
     # Papier
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(QPen(QColor(200, 200, 200), 1))
+    painter.setBrush(_COLOR_WHITE)
+    painter.setPen(_PEN_LINE_LIGHT)
     painter.drawRect(margin + 4, margin + 10, size - 2*margin - 8, size - margin - 18)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_chapter_icon(size: int = 32) -> QIcon:
+@_icon_factory("chapter")
+def create_3d_chapter_icon(painter: QPainter, size: int):
     """Maak een 3D hoofdstuk icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Boek
     gradient = QLinearGradient(0, 0, size, 0)
-    gradient.setColorAt(0, QColor(103, 58, 183))
+    gradient.setColorAt(0, _COLOR_PURPLE)
     gradient.setColorAt(0.5, QColor(126, 87, 194))
-    gradient.setColorAt(1, QColor(103, 58, 183))
+    gradient.setColorAt(1, _COLOR_PURPLE)
 
     margin = 4
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(69, 39, 160), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 2, 2)
+    painter.setPen(_PEN_PURPLE_DARK)
+    painter.drawPath(_rounded_square_path(size, margin, 2))
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Pagina's
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(Qt.NoPen)
-    painter.drawRect(margin + 3, margin + 2, size - 2*margin - 6, size - 2*margin - 4)
+    painter.fillRect(margin + 3, margin + 2, size - 2*margin - 6, size - 2*margin - 4, _COLOR_WHITE)
 
     # Lijnen
-    painter.setPen(QPen(QColor(200, 200, 200), 1))
-    for i in range(4):
-        y = margin + 6 + i * 5
-        painter.drawLine(margin + 6, y, size - margin - 6, y)
+    painter.setPen(_PEN_LINE_LIGHT)
+    painter.drawLines([QLine(margin + 6, y, size - margin - 6, y)
+                       for y in range(margin + 6, margin + 26, 5)])
 
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_cost_item_icon(size: int = 32) -> QIcon:
+@_icon_factory("cost_item")
+def create_3d_cost_item_icon(painter: QPainter, size: int):
     """Maak een 3D kostenpost icoon (euro)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Cirkel achtergrond
     gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(76, 175, 80))
+    gradient.setColorAt(0, _COLOR_GREEN)
     gradient.setColorAt(1, QColor(56, 142, 60))
 
     margin = 3
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(46, 125, 50), 2))
+    painter.setPen(_PEN_GREEN_DARK_2)
     painter.drawEllipse(margin, margin, size - 2*margin, size - 2*margin)
 
     # Euro teken
-    painter.setPen(QPen(QColor(255, 255, 255), 3))
-    font = QFont("Arial", size // 2, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "€")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "€", _COLOR_WHITE, size // 2, bold=True)
 
 
-def create_3d_text_row_icon(size: int = 32) -> QIcon:
+@_icon_factory("text_row")
+def create_3d_text_row_icon(painter: QPainter, size: int):
     """Maak een 3D tekstregel icoon (T in vierkant)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Vierkante achtergrond
     gradient = QLinearGradient(0, 0, size, size)
     gradient.setColorAt(0, QColor(156, 163, 175))  # Grijs
@@ -367,45 +880,24 @@ def create_3d_text_row_icon(size: int = 32) -> QIcon:
 
     margin = 3
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(75, 85, 99), 2))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 4, 4)
+    painter.setPen(_PEN_SLATE_2)
+    painter.drawPath(_rounded_square_path(size, margin, 4))
 
     # "T" letter voor tekst
-    painter.setPen(QPen(QColor(255, 255, 255), 3))
-    font = QFont("Arial", size // 2, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "T")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "T", _COLOR_WHITE, size // 2, bold=True)
 
 
-def create_3d_delete_icon(size: int = 32) -> QIcon:
+@_icon_factory("delete")
+def create_3d_delete_icon(painter: QPainter, size: int):
     """Maak een 3D verwijder icoon (prullenbak)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 4
 
     # Prullenbak body
-    gradient = QLinearGradient(0, 0, 0, size)
-    gradient.setColorAt(0, QColor(239, 83, 80))
-    gradient.setColorAt(1, QColor(211, 47, 47))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(183, 28, 28), 1))
+    painter.setBrush(_brush("red_bin", 0, 0, 0, size))
+    painter.setPen(_PEN_RED_DARK)
 
     # Bak
-    path = QPainterPath()
-    path.moveTo(margin + 2, margin + 8)
-    path.lineTo(margin + 4, size - margin)
-    path.lineTo(size - margin - 4, size - margin)
-    path.lineTo(size - margin - 2, margin + 8)
-    path.closeSubpath()
-    painter.drawPath(path)
+    painter.drawPath(_trash_body_path(size))
 
     # Deksel
     painter.drawRoundedRect(margin, margin + 4, size - 2*margin, 4, 1, 1)
@@ -414,143 +906,85 @@ def create_3d_delete_icon(size: int = 32) -> QIcon:
     painter.setBrush(Qt.NoBrush)
     painter.drawRoundedRect(size//2 - 4, margin, 8, 4, 1, 1)
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Lijnen
-    painter.setPen(QPen(QColor(255, 255, 255, 150), 1))
-    for x in [size//3, size//2, 2*size//3]:
-        painter.drawLine(x, margin + 12, x, size - margin - 3)
-
-    painter.end()
-    return QIcon(pixmap)
+    painter.setPen(_PEN_WHITE_TRANSLUCENT)
+    painter.drawLines([QLine(x, margin + 12, x, size - margin - 3)
+                       for x in (size//3, size//2, 2*size//3)])
 
 
-def create_3d_pdf_icon(size: int = 32) -> QIcon:
+@_icon_factory("pdf")
+def create_3d_pdf_icon(painter: QPainter, size: int):
     """Maak een 3D PDF icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Document
-    gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(244, 67, 54))
-    gradient.setColorAt(1, QColor(211, 47, 47))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(183, 28, 28), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setBrush(_brush("red_button", 0, 0, size, size))
+    painter.setPen(_PEN_RED_DARK)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # PDF tekst
-    painter.setPen(QColor(255, 255, 255))
-    font = QFont("Arial", 7, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "PDF")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "PDF", _COLOR_WHITE, 7, bold=True)
 
 
-def create_3d_ifc_icon(size: int = 32) -> QIcon:
+@_icon_factory("ifc")
+@_recorded
+def create_3d_ifc_icon(painter: QPainter, size: int):
     """Maak een 3D IFC icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    margin = 3
-
     # 3D kubus effect
     gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(0, 150, 136))
-    gradient.setColorAt(1, QColor(0, 121, 107))
+    gradient.setColorAt(0, _COLOR_TEAL)
+    gradient.setColorAt(1, _COLOR_TEAL_DARK)
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(0, 105, 92), 1))
+    painter.setPen(_PEN_TEAL_DARK)
 
-    # Kubus bovenkant
-    path_top = QPainterPath()
-    path_top.moveTo(size//2, margin)
-    path_top.lineTo(size - margin, margin + 8)
-    path_top.lineTo(size//2, margin + 16)
-    path_top.lineTo(margin, margin + 8)
-    path_top.closeSubpath()
+    path_top, path_left, path_right = _cube_paths(size)
 
+    # Kubus bovenkant
     painter.setBrush(QColor(0, 188, 170))
     painter.drawPath(path_top)
 
     # Kubus linkerkant
-    path_left = QPainterPath()
-    path_left.moveTo(margin, margin + 8)
-    path_left.lineTo(size//2, margin + 16)
-    path_left.lineTo(size//2, size - margin)
-    path_left.lineTo(margin, size - margin - 8)
-    path_left.closeSubpath()
-
-    painter.setBrush(QColor(0, 150, 136))
+    painter.setBrush(_COLOR_TEAL)
     painter.drawPath(path_left)
 
     # Kubus rechterkant
-    path_right = QPainterPath()
-    path_right.moveTo(size - margin, margin + 8)
-    path_right.lineTo(size//2, margin + 16)
-    path_right.lineTo(size//2, size - margin)
-    path_right.lineTo(size - margin, size - margin - 8)
-    path_right.closeSubpath()
-
-    painter.setBrush(QColor(0, 121, 107))
+    painter.setBrush(_COLOR_TEAL_DARK)
     painter.drawPath(path_right)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_dxf_icon(size: int = 32) -> QIcon:
+@_icon_factory("dxf")
+def create_3d_dxf_icon(painter: QPainter, size: int):
     """Maak een 3D DXF icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Document
     gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(255, 152, 0))
+    gradient.setColorAt(0, _COLOR_ORANGE)
     gradient.setColorAt(1, QColor(245, 124, 0))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(230, 81, 0), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setPen(_PEN_ORANGE_DEEP)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # Technische lijnen
-    painter.setPen(QPen(QColor(255, 255, 255), 1))
+    painter.setPen(_PEN_WHITE)
     painter.drawLine(margin + 6, size//2, size - margin - 6, size//3)
     painter.drawLine(margin + 6, size//2, size//2, size - margin - 6)
     painter.drawLine(size//2, size - margin - 6, size - margin - 6, size//2)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_measure_icon(size: int = 32) -> QIcon:
+@_icon_factory("measure")
+def create_3d_measure_icon(painter: QPainter, size: int):
     """Maak een 3D meetlint icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Meetlint
     gradient = QLinearGradient(0, 0, size, 0)
     gradient.setColorAt(0, QColor(255, 235, 59))
-    gradient.setColorAt(1, QColor(255, 193, 7))
+    gradient.setColorAt(1, _COLOR_AMBER)
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(245, 127, 23), 1))
+    painter.setPen(_PEN_FOLDER)
 
     # Diagonaal lint
     painter.save()
@@ -559,85 +993,32 @@ def create_3d_measure_icon(size: int = 32) -> QIcon:
     painter.drawRoundedRect(-size//2 + 2, -4, size - 4, 10, 2, 2)
 
     # Streepjes
-    painter.setPen(QPen(QColor(0, 0, 0), 1))
-    for i in range(-size//2 + 6, size//2 - 4, 4):
-        h = 3 if i % 8 == 0 else 2
-        painter.drawLine(i, -4, i, -4 + h)
+    painter.setPen(_PEN_BLACK)
+    painter.drawLines([QLine(i, -4, i, -1 if i % 8 == 0 else -2)
+                       for i in range(-size//2 + 6, size//2 - 4, 4)])
 
     painter.restore()
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_zoom_in_icon(size: int = 32) -> QIcon:
+@_icon_factory("zoom_in")
+@_recorded
+def create_3d_zoom_in_icon(painter: QPainter, size: int):
     """Maak een 3D zoom in icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
+    _play(painter, _zoom_ops(size, True))
 
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    # Vergrootglas
-    gradient = QLinearGradient(4, 4, 20, 20)
-    gradient.setColorAt(0, QColor(227, 242, 253))
-    gradient.setColorAt(1, QColor(187, 222, 251))
 
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(30, 136, 229), 2))
-    painter.drawEllipse(4, 4, 18, 18)
-
-    # Handvat
-    painter.setPen(QPen(QColor(100, 100, 100), 3, Qt.SolidLine, Qt.RoundCap))
-    painter.drawLine(19, 19, size - 4, size - 4)
-
-    # Plus
-    painter.setPen(QPen(QColor(30, 136, 229), 2))
-    painter.drawLine(9, 13, 17, 13)
-    painter.drawLine(13, 9, 13, 17)
-
-    painter.end()
-    return QIcon(pixmap)
-
-
-def create_3d_zoom_out_icon(size: int = 32) -> QIcon:
+@_icon_factory("zoom_out")
+@_recorded
+def create_3d_zoom_out_icon(painter: QPainter, size: int):
     """Maak een 3D zoom uit icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    # Vergrootglas
-    gradient = QLinearGradient(4, 4, 20, 20)
-    gradient.setColorAt(0, QColor(227, 242, 253))
-    gradient.setColorAt(1, QColor(187, 222, 251))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(30, 136, 229), 2))
-    painter.drawEllipse(4, 4, 18, 18)
-
-    # Handvat
-    painter.setPen(QPen(QColor(100, 100, 100), 3, Qt.SolidLine, Qt.RoundCap))
-    painter.drawLine(19, 19, size - 4, size - 4)
-
-    # Min
-    painter.setPen(QPen(QColor(30, 136, 229), 2))
-    painter.drawLine(9, 13, 17, 13)
-
-    painter.end()
-    return QIcon(pixmap)
+    _play(painter, _zoom_ops(size, False))
 
 
-def create_3d_fit_icon(size: int = 32) -> QIcon:
+@_icon_factory("fit")
+@_recorded
+def create_3d_fit_icon(painter: QPainter, size: int):
     """Maak een 3D passend maken icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    painter.setPen(QPen(QColor(66, 165, 245), 2))
+    painter.setPen(_PEN_BLUE_LIGHT_2)
 
     margin = 4
     corner_len = 8
@@ -660,9 +1041,8 @@ def create_3d_fit_icon(size: int = 32) -> QIcon:
 
     # Pijlen naar binnen
     center = size // 2
-    arrow_len = 4
 
-    painter.setPen(QPen(QColor(66, 165, 245), 1))
+    painter.setPen(_PEN_BLUE_LIGHT)
     # Naar rechts
     painter.drawLine(margin + 2, center, margin + 6, center)
     # Naar links
@@ -672,19 +1052,11 @@ def create_3d_fit_icon(size: int = 32) -> QIcon:
     # Naar boven
     painter.drawLine(center, size - margin - 2, center, size - margin - 6)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
 
-def create_3d_excel_icon(size: int = 32) -> QIcon:
+@_icon_factory("excel")
+def create_3d_excel_icon(painter: QPainter, size: int):
     """Maak een 3D Excel icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Groene achtergrond
@@ -693,27 +1065,16 @@ def create_3d_excel_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(24, 90, 55))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(20, 70, 45), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setPen(_PEN_EXCEL_GREEN)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # X letter
-    painter.setPen(QPen(QColor(255, 255, 255), 2))
-    font = QFont("Arial", size // 3, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "X")
+    _draw_text_path(painter, size, "X", _COLOR_WHITE, size // 3, bold=True)
 
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_ods_icon(size: int = 32) -> QIcon:
+@_icon_factory("ods")
+def create_3d_ods_icon(painter: QPainter, size: int):
     """Maak een 3D ODS icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Oranje achtergrond
@@ -722,27 +1083,16 @@ def create_3d_ods_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(200, 90, 0))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(180, 80, 0), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setPen(_PEN_AMBER_DARK)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # ODS tekst
-    painter.setPen(QPen(QColor(255, 255, 255), 1))
-    font = QFont("Arial", size // 4, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "ODS")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "ODS", _COLOR_WHITE, size // 4, bold=True)
 
 
-def create_3d_csv_icon(size: int = 32) -> QIcon:
+@_icon_factory("csv")
+def create_3d_csv_icon(painter: QPainter, size: int):
     """Maak een 3D CSV icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Blauwe achtergrond
@@ -751,110 +1101,41 @@ def create_3d_csv_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(48, 63, 159))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(40, 53, 147), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setPen(_PEN_INDIGO_DARK)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # CSV tekst
-    painter.setPen(QPen(QColor(255, 255, 255), 1))
-    font = QFont("Arial", size // 4, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "CSV")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "CSV", _COLOR_WHITE, size // 4, bold=True)
 
 
-def create_3d_up_icon(size: int = 32) -> QIcon:
+@_icon_factory("up")
+@_recorded
+def create_3d_up_icon(painter: QPainter, size: int):
     """Maak een 3D omhoog pijl icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
+    _play(painter, ((_PATH, _arrow_up_path(size), _brush("blue_arrow", 0, 0, 0, size), _PEN_BLUE_DARK),))
 
-    center = size // 2
-
-    # Pijl
-    gradient = QLinearGradient(0, size, 0, 0)
-    gradient.setColorAt(0, QColor(33, 150, 243))
-    gradient.setColorAt(1, QColor(100, 181, 246))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(21, 101, 192), 1))
-
-    path = QPainterPath()
-    path.moveTo(center, 4)
-    path.lineTo(size - 6, center + 2)
-    path.lineTo(center + 4, center + 2)
-    path.lineTo(center + 4, size - 4)
-    path.lineTo(center - 4, size - 4)
-    path.lineTo(center - 4, center + 2)
-    path.lineTo(6, center + 2)
-    path.closeSubpath()
-
-    painter.drawPath(path)
-
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_down_icon(size: int = 32) -> QIcon:
+@_icon_factory("down")
+@_recorded
+def create_3d_down_icon(painter: QPainter, size: int):
     """Maak een 3D omlaag pijl icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    center = size // 2
-
-    # Pijl
-    gradient = QLinearGradient(0, 0, 0, size)
-    gradient.setColorAt(0, QColor(100, 181, 246))
-    gradient.setColorAt(1, QColor(33, 150, 243))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(21, 101, 192), 1))
-
-    path = QPainterPath()
-    path.moveTo(center, size - 4)
-    path.lineTo(size - 6, center - 2)
-    path.lineTo(center + 4, center - 2)
-    path.lineTo(center + 4, 4)
-    path.lineTo(center - 4, 4)
-    path.lineTo(center - 4, center - 2)
-    path.lineTo(6, center - 2)
-    path.closeSubpath()
-
-    painter.drawPath(path)
-
-    painter.end()
-    return QIcon(pixmap)
+    _play(painter, ((_PATH, _arrow_down_path(size), _brush("blue_arrow", 0, 0, 0, size), _PEN_BLUE_DARK),))
 
 
-def create_3d_indent_in_icon(size: int = 32) -> QIcon:
+@_icon_factory("indent_in")
+def create_3d_indent_in_icon(painter: QPainter, size: int):
     """Maak een 3D inspringen icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Lijnen
-    painter.setPen(QPen(QColor(100, 100, 100), 2))
-    y_start = 6
-    for i in range(4):
-        y = y_start + i * 6
-        x_start = 8 if i > 0 else 4
-        painter.drawLine(x_start, y, size - 4, y)
+    painter.setPen(_PEN_GREY_2)
+    painter.drawLines([QLine(8 if y > 6 else 4, y, size - 4, y) for y in (6, 12, 18, 24)])
 
     # Pijl naar rechts
     gradient = QLinearGradient(0, 0, size // 2, 0)
-    gradient.setColorAt(0, QColor(76, 175, 80))
+    gradient.setColorAt(0, _COLOR_GREEN)
     gradient.setColorAt(1, QColor(129, 199, 132))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(56, 142, 60), 1))
+    painter.setPen(_PEN_GREEN_DARK)
 
     path = QPainterPath()
     center_y = size // 2 + 4
@@ -865,33 +1146,21 @@ def create_3d_indent_in_icon(size: int = 32) -> QIcon:
 
     painter.drawPath(path)
 
-    painter.end()
-    return QIcon(pixmap)
 
-
-def create_3d_indent_out_icon(size: int = 32) -> QIcon:
+@_icon_factory("indent_out")
+def create_3d_indent_out_icon(painter: QPainter, size: int):
     """Maak een 3D uitspringen icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Lijnen
-    painter.setPen(QPen(QColor(100, 100, 100), 2))
-    y_start = 6
-    for i in range(4):
-        y = y_start + i * 6
-        x_start = 4 if i > 0 else 8
-        painter.drawLine(x_start, y, size - 4, y)
+    painter.setPen(_PEN_GREY_2)
+    painter.drawLines([QLine(4 if y > 6 else 8, y, size - 4, y) for y in (6, 12, 18, 24)])
 
     # Pijl naar links
     gradient = QLinearGradient(size // 2, 0, 0, 0)
-    gradient.setColorAt(0, QColor(255, 152, 0))
-    gradient.setColorAt(1, QColor(255, 183, 77))
+    gradient.setColorAt(0, _COLOR_ORANGE)
+    gradient.setColorAt(1, _COLOR_ORANGE_LIGHT)
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(245, 124, 0), 1))
+    painter.setPen(_PEN_ORANGE_DARK)
 
     path = QPainterPath()
     center_y = size // 2 + 4
@@ -902,18 +1171,11 @@ def create_3d_indent_out_icon(size: int = 32) -> QIcon:
 
     painter.drawPath(path)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_calculator_icon(size: int = 32) -> QIcon:
+@_icon_factory("calculator")
+@_recorded
+def create_3d_calculator_icon(painter: QPainter, size: int):
     """Maak een 3D calculator icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Calculator body
@@ -922,37 +1184,22 @@ def create_3d_calculator_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(33, 33, 33))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(20, 20, 20), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setPen(_PEN_BLACK_SOFT)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
+    painter.setRenderHint(QPainter.Antialiasing, False)
     # Display
-    painter.setBrush(QColor(200, 230, 200))
-    painter.setPen(Qt.NoPen)
-    painter.drawRect(margin + 3, margin + 3, size - 2*margin - 6, size // 4)
+    painter.fillRect(margin + 3, margin + 3, size - 2*margin - 6, size // 4, QColor(200, 230, 200))
 
     # Knoppen (3x4 grid)
-    button_size = (size - 2*margin - 8) // 3
-    button_y_start = margin + 3 + size // 4 + 2
-
-    painter.setBrush(QColor(100, 100, 100))
-    for row in range(3):
-        for col in range(3):
-            x = margin + 3 + col * (button_size + 1)
-            y = button_y_start + row * (button_size + 1)
-            painter.drawRect(x, y, button_size - 1, button_size - 1)
-
-    painter.end()
-    return QIcon(pixmap)
+    painter.setBrush(_COLOR_GREY)
+    painter.setPen(Qt.NoPen)
+    painter.drawRects(_calc_button_rects(size))
 
 
-def create_3d_expand_icon(size: int = 32) -> QIcon:
+@_icon_factory("expand")
+def create_3d_expand_icon(painter: QPainter, size: int):
     """Maak een expand/uitklappen icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = size // 6
     center = size // 2
 
@@ -962,14 +1209,13 @@ def create_3d_expand_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(22, 163, 74))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(21, 128, 61), 1))
+    painter.setPen(_PEN_ODS_GREEN)
     painter.drawEllipse(margin, margin, size - 2*margin, size - 2*margin)
 
     # Plus/expand symbool (pijlen naar buiten)
-    painter.setPen(QPen(QColor(255, 255, 255), max(2, size // 10)))
+    painter.setPen(QPen(_COLOR_WHITE, max(2, size // 10)))
 
     # Horizontale pijlen
-    arrow_size = size // 5
     painter.drawLine(margin + 4, center, center - 2, center)
     painter.drawLine(center + 2, center, size - margin - 4, center)
 
@@ -977,18 +1223,10 @@ def create_3d_expand_icon(size: int = 32) -> QIcon:
     painter.drawLine(center, margin + 4, center, center - 2)
     painter.drawLine(center, center + 2, center, size - margin - 4)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_collapse_icon(size: int = 32) -> QIcon:
+@_icon_factory("collapse")
+def create_3d_collapse_icon(painter: QPainter, size: int):
     """Maak een collapse/inklappen icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = size // 6
     center = size // 2
 
@@ -998,350 +1236,289 @@ def create_3d_collapse_icon(size: int = 32) -> QIcon:
     gradient.setColorAt(1, QColor(234, 88, 12))
 
     painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(194, 65, 12), 1))
+    painter.setPen(_PEN_CSV_ORANGE)
     painter.drawEllipse(margin, margin, size - 2*margin, size - 2*margin)
 
     # Minus symbool (horizontale lijn)
-    painter.setPen(QPen(QColor(255, 255, 255), max(2, size // 8)))
+    painter.setPen(QPen(_COLOR_WHITE, max(2, size // 8)))
     painter.drawLine(margin + 6, center, size - margin - 6, center)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_bold_icon(size: int = 32) -> QIcon:
+@_icon_factory("bold")
+def create_3d_bold_icon(painter: QPainter, size: int):
     """Maak een vet (bold) icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Achtergrond
-    painter.setBrush(QColor(240, 240, 240))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
-    painter.drawRoundedRect(2, 2, size - 4, size - 4, 4, 4)
+    painter.drawImage(0, 0, _bg_template(size))
 
     # B letter
-    painter.setPen(QColor(50, 50, 50))
-    font = QFont("Arial", size // 2, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "B")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "B", _COLOR_GREY_DARK, size // 2, bold=True)
 
 
-def create_3d_italic_icon(size: int = 32) -> QIcon:
+@_icon_factory("italic")
+def create_3d_italic_icon(painter: QPainter, size: int):
     """Maak een cursief (italic) icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Achtergrond
-    painter.setBrush(QColor(240, 240, 240))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
-    painter.drawRoundedRect(2, 2, size - 4, size - 4, 4, 4)
+    painter.drawImage(0, 0, _bg_template(size))
 
     # I letter (cursief)
-    painter.setPen(QColor(50, 50, 50))
-    font = QFont("Arial", size // 2)
-    font.setItalic(True)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "I")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "I", _COLOR_GREY_DARK, size // 2, italic=True)
 
 
-def create_3d_underline_icon(size: int = 32) -> QIcon:
+@_icon_factory("underline")
+def create_3d_underline_icon(painter: QPainter, size: int):
     """Maak een onderstrepen icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Achtergrond
-    painter.setBrush(QColor(240, 240, 240))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
-    painter.drawRoundedRect(2, 2, size - 4, size - 4, 4, 4)
+    painter.drawImage(0, 0, _bg_template(size))
 
     # U letter
-    painter.setPen(QColor(50, 50, 50))
-    font = QFont("Arial", size // 2)
-    painter.setFont(font)
-    painter.drawText(QRect(0, -2, size, size), Qt.AlignCenter, "U")
+    _draw_text_path(painter, size, "U", _COLOR_GREY_DARK, size // 2, dy=-2)
 
     # Onderstreep lijn
-    painter.setPen(QPen(QColor(50, 50, 50), 2))
+    painter.setPen(_PEN_GREY_DARK_2)
     painter.drawLine(size // 4, size - 6, size - size // 4, size - 6)
 
-    painter.end()
-    return QIcon(pixmap)
-
 
-def create_3d_color_icon(size: int = 32) -> QIcon:
+@_icon_factory("color")
+def create_3d_color_icon(painter: QPainter, size: int):
     """Maak een tekstkleur icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     # Achtergrond
-    painter.setBrush(QColor(240, 240, 240))
-    painter.setPen(QPen(QColor(180, 180, 180), 1))
-    painter.drawRoundedRect(2, 2, size - 4, size - 4, 4, 4)
+    painter.drawImage(0, 0, _bg_template(size))
 
     # A letter
-    painter.setPen(QColor(50, 50, 50))
-    font = QFont("Arial", size // 2, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, -2, size, size), Qt.AlignCenter, "A")
+    _draw_text_path(painter, size, "A", _COLOR_GREY_DARK, size // 2, bold=True, dy=-2)
 
-    # Kleur balk onderaan
-    painter.setBrush(QColor(231, 76, 60))  # Rood
-    painter.setPen(Qt.NoPen)
-    painter.drawRect(4, size - 8, size - 8, 4)
-
-    painter.end()
-    return QIcon(pixmap)
+    # Kleur balk onderaan (rood)
+    painter.fillRect(4, size - 8, size - 8, 4, QColor(231, 76, 60))
 
 
-def create_3d_odt_icon(size: int = 32) -> QIcon:
+@_icon_factory("odt")
+def create_3d_odt_icon(painter: QPainter, size: int):
     """Maak een 3D ODT icoon"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
     margin = 3
 
     # Blauwe achtergrond (LibreOffice Writer)
-    gradient = QLinearGradient(0, 0, size, size)
-    gradient.setColorAt(0, QColor(0, 102, 204))
-    gradient.setColorAt(1, QColor(0, 76, 153))
-
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(0, 60, 120), 1))
-    painter.drawRoundedRect(margin, margin, size - 2*margin, size - 2*margin, 3, 3)
+    painter.setBrush(_brush("writer_blue", 0, 0, size, size))
+    painter.setPen(_PEN_NAVY)
+    painter.drawPath(_rounded_square_path(size, margin, 3))
 
     # ODT tekst
-    painter.setPen(QPen(QColor(255, 255, 255), 1))
-    font = QFont("Arial", size // 4, QFont.Bold)
-    painter.setFont(font)
-    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, "ODT")
-
-    painter.end()
-    return QIcon(pixmap)
+    _draw_text_path(painter, size, "ODT", _COLOR_WHITE, size // 4, bold=True)
 
 
-def create_3d_undo_icon(size: int = 32) -> QIcon:
+@_icon_factory("undo")
+def create_3d_undo_icon(painter: QPainter, size: int):
     """Maak een 3D ongedaan maken icoon (gebogen pijl naar links)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
-
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-
-    center = size // 2
-    margin = 4
+    arc, head = _undo_paths(size)
 
     # Gebogen pijl naar links
-    gradient = QLinearGradient(0, 0, size, 0)
-    gradient.setColorAt(0, QColor(66, 165, 245))
-    gradient.setColorAt(1, QColor(30, 136, 229))
+    painter.setPen(_PEN_BLUE_DARK_2)
+    painter.setBrush(Qt.NoBrush)
+    painter.drawPath(arc)
 
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(21, 101, 192), 2))
+    # Pijlpunt
+    painter.setBrush(_brush("blue_button", 0, 0, size, 0))
+    painter.drawPath(head)
 
-    # Boog tekenen
-    path = QPainterPath()
-    path.moveTo(margin + 6, center - 2)
-    path.arcTo(margin + 4, margin + 4, size - 2*margin - 8, size - 2*margin - 4, 180, -180)
 
+@_icon_factory("redo")
+def create_3d_redo_icon(painter: QPainter, size: int):
+    """Maak een 3D opnieuw icoon (gebogen pijl naar rechts)"""
+    arc, head = _redo_paths(size)
+
+    # Gebogen pijl naar rechts
+    painter.setPen(_PEN_GREEN_DARK_2)
     painter.setBrush(Qt.NoBrush)
-    painter.drawPath(path)
+    painter.drawPath(arc)
 
     # Pijlpunt
-    painter.setBrush(QBrush(gradient))
-    arrow_path = QPainterPath()
-    arrow_path.moveTo(margin + 2, center - 2)
-    arrow_path.lineTo(margin + 10, center - 8)
-    arrow_path.lineTo(margin + 10, center + 4)
-    arrow_path.closeSubpath()
-    painter.drawPath(arrow_path)
+    painter.setBrush(_brush("green_arrow", size, 0, 0, 0))
+    painter.drawPath(head)
 
-    painter.end()
-    return QIcon(pixmap)
 
+# Kleuren van de IFC categorie iconen in de model structuur van de 3D viewer
+_IFC_CATEGORY_COLORS = {
+    "ifc_wall": QColor(161, 136, 127),
+    "ifc_slab": _COLOR_GREY_MEDIUM,
+    "ifc_door": QColor(141, 110, 99),
+    "ifc_window": _COLOR_BLUE_SKY,
+    "ifc_column": _COLOR_GREY,
+    "ifc_beam": _COLOR_ORANGE,
+    "ifc_roof": _COLOR_RED_DARK,
+}
 
-def create_3d_redo_icon(size: int = 32) -> QIcon:
-    """Maak een 3D opnieuw icoon (gebogen pijl naar rechts)"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
 
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
+def _category_painter(color: QColor):
+    """Teken-functie voor een gekleurd vierkant categorie icoon"""
+    pen = QPen(color.darker(130), 1)
 
-    center = size // 2
-    margin = 4
+    def paint(painter: QPainter, size: int):
+        painter.setBrush(color)
+        painter.setPen(pen)
+        painter.drawPath(_rounded_square_path(size, 6, 3))
+    return paint
 
-    # Gebogen pijl naar rechts
-    gradient = QLinearGradient(size, 0, 0, 0)
-    gradient.setColorAt(0, QColor(102, 187, 106))
-    gradient.setColorAt(1, QColor(67, 160, 71))
 
-    painter.setBrush(QBrush(gradient))
-    painter.setPen(QPen(QColor(46, 125, 50), 2))
+# Categorie iconen als vervanging van emoji (geen kleurfont fallback nodig)
+_IFC_CATEGORY_ICONS = {
+    name: _icon_factory(name)(_category_painter(color))
+    for name, color in _IFC_CATEGORY_COLORS.items()
+}
 
-    # Boog tekenen
-    path = QPainterPath()
-    path.moveTo(size - margin - 6, center - 2)
-    path.arcTo(margin + 4, margin + 4, size - 2*margin - 8, size - 2*margin - 4, 0, 180)
-
-    painter.setBrush(Qt.NoBrush)
-    painter.drawPath(path)
 
-    # Pijlpunt
-    painter.setBrush(QBrush(gradient))
-    arrow_path = QPainterPath()
-    arrow_path.moveTo(size - margin - 2, center - 2)
-    arrow_path.lineTo(size - margin - 10, center - 8)
-    arrow_path.lineTo(size - margin - 10, center + 4)
-    arrow_path.closeSubpath()
-    painter.drawPath(arrow_path)
+# Map met de vooraf opgeslagen tree iconen (ook gebruikt door de stylesheet in cost_table)
+_ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
 
-    painter.end()
-    return QIcon(pixmap)
+# Grootte waarop save_tree_icons de PNG's opslaat
+_TREE_ICON_SIZE = 12
 
 
-def create_tree_expand_icon(size: int = 16) -> QPixmap:
-    """Maak een + icoon voor tree expand"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
+def _paint_tree_expand(size: int) -> QImage:
+    """Teken een + icoon voor tree expand"""
+    # Vierkant met border uit het gedeelde sjabloon
+    image = _tree_box_template(size).copy()
 
-    painter = QPainter(pixmap)
+    painter = QPainter(image)
     painter.setRenderHint(QPainter.Antialiasing)
 
-    margin = 2
-    box_size = size - 2 * margin
-
-    # Vierkant met border
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(QPen(QColor(130, 130, 130), 1))
-    painter.drawRect(margin, margin, box_size, box_size)
-
     # Plus teken
-    painter.setPen(QPen(QColor(80, 80, 80), 2))
+    painter.setPen(_PEN_TREE_SIGN)
     center = size // 2
     line_margin = 4
     painter.drawLine(line_margin, center, size - line_margin, center)  # Horizontaal
     painter.drawLine(center, line_margin, center, size - line_margin)  # Verticaal
 
     painter.end()
-    return pixmap
+    return image
 
 
-def create_tree_collapse_icon(size: int = 16) -> QPixmap:
-    """Maak een - icoon voor tree collapse"""
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.transparent)
+def _paint_tree_collapse(size: int) -> QImage:
+    """Teken een - icoon voor tree collapse"""
+    # Vierkant met border uit het gedeelde sjabloon
+    image = _tree_box_template(size).copy()
 
-    painter = QPainter(pixmap)
+    painter = QPainter(image)
     painter.setRenderHint(QPainter.Antialiasing)
 
-    margin = 2
-    box_size = size - 2 * margin
-
-    # Vierkant met border
-    painter.setBrush(QColor(255, 255, 255))
-    painter.setPen(QPen(QColor(130, 130, 130), 1))
-    painter.drawRect(margin, margin, box_size, box_size)
-
     # Min teken
-    painter.setPen(QPen(QColor(80, 80, 80), 2))
+    painter.setPen(_PEN_TREE_SIGN)
     center = size // 2
     line_margin = 4
     painter.drawLine(line_margin, center, size - line_margin, center)  # Horizontaal
 
     painter.end()
-    return pixmap
+    return image
 
 
-def save_tree_icons():
-    """Sla tree expand/collapse iconen op naar assets folder"""
-    import os
-    from pathlib import Path
+@lru_cache(maxsize=8)
+def _tree_icon(name: str, size: int) -> QPixmap:
+    """
+    Tree icoon uit de assets PNG, per grootte één keer geschaald.
 
-    assets_dir = Path(__file__).parent.parent.parent / "assets"
-    assets_dir.mkdir(exist_ok=True)
+    Ontbreekt de PNG dan wordt hij eerst opgeslagen; lukt ook dat niet
+    dan wordt het icoon direct getekend.
+    """
+    path = _ASSETS_DIR / f"tree_{name}.png"
+    if not path.exists():
+        try:
+            save_tree_icons()
+        except OSError:
+            pass
 
-    expand_icon = create_tree_expand_icon(12)
-    expand_icon.save(str(assets_dir / "tree_expand.png"))
+    pixmap = QPixmap(str(path))
+    if pixmap.isNull():
+        paint = _paint_tree_expand if name == "expand" else _paint_tree_collapse
+        return QPixmap.fromImage(paint(size))
+    if pixmap.width() == size:
+        return pixmap
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
-    collapse_icon = create_tree_collapse_icon(12)
-    collapse_icon.save(str(assets_dir / "tree_collapse.png"))
+
+def create_tree_expand_icon(size: int = 16) -> QPixmap:
+    """Maak een + icoon voor tree expand"""
+    return _tree_icon("expand", size)
+
+
+def create_tree_collapse_icon(size: int = 16) -> QPixmap:
+    """Maak een - icoon voor tree collapse"""
+    return _tree_icon("collapse", size)
+
+
+def save_tree_icons():
+    """Sla tree expand/collapse iconen op naar assets folder"""
+    _ASSETS_DIR.mkdir(exist_ok=True)
+
+    _paint_tree_expand(_TREE_ICON_SIZE).save(str(_ASSETS_DIR / "tree_expand.png"))
+    _paint_tree_collapse(_TREE_ICON_SIZE).save(str(_ASSETS_DIR / "tree_collapse.png"))
+
+
+# Icoon namen zoals de UI ze opvraagt
+_ICON_CREATORS = {
+    "new": create_3d_document_icon,
+    "open": create_3d_folder_icon,
+    "save": create_3d_save_icon,
+    "print": create_3d_print_icon,
+    "cut": create_3d_cut_icon,
+    "copy": create_3d_copy_icon,
+    "paste": create_3d_paste_icon,
+    "chapter": create_3d_chapter_icon,
+    "cost_item": create_3d_cost_item_icon,
+    "text_row": create_3d_text_row_icon,
+    "delete": create_3d_delete_icon,
+    "pdf": create_3d_pdf_icon,
+    "ifc": create_3d_ifc_icon,
+    "dxf": create_3d_dxf_icon,
+    "measure": create_3d_measure_icon,
+    "zoom_in": create_3d_zoom_in_icon,
+    "zoom_out": create_3d_zoom_out_icon,
+    "fit": create_3d_fit_icon,
+    "excel": create_3d_excel_icon,
+    "ods": create_3d_ods_icon,
+    "csv": create_3d_csv_icon,
+    "up": create_3d_up_icon,
+    "down": create_3d_down_icon,
+    "indent_in": create_3d_indent_in_icon,
+    "indent_out": create_3d_indent_out_icon,
+    "calculator": create_3d_calculator_icon,
+    "expand": create_3d_expand_icon,
+    "collapse": create_3d_collapse_icon,
+    "undo": create_3d_undo_icon,
+    "redo": create_3d_redo_icon,
+    "bold": create_3d_bold_icon,
+    "italic": create_3d_italic_icon,
+    "underline": create_3d_underline_icon,
+    "color": create_3d_color_icon,
+    "odt": create_3d_odt_icon,
+    **_IFC_CATEGORY_ICONS,
+}
+
+# Groottes die de UI opvraagt; worden bij de eerste aanvraag in één keer gevuld
+_WARM_SIZES = (16, 24, 32)
+
+_icons_warmed = False
+
+
+def _warm_icon_cache():
+    """Maak alle iconen aan voor de gangbare groottes"""
+    for name in _ICON_CREATORS:
+        for size in _WARM_SIZES:
+            get_icon(name, size)
+
+
+@lru_cache(maxsize=256)
+def get_icon(name: str, size: int = 32) -> QIcon:
+    """Haal een icoon op bij naam"""
+    global _icons_warmed
+    if not _icons_warmed:
+        # Eerste aanvraag: de QApplication bestaat nu, dus alles in één keer
+        _icons_warmed = True
+        _warm_icon_cache()
+
+    creator = _ICON_CREATORS.get(name)
+    # Fallback: leeg icoon
+    return creator(size) if creator else QIcon()
 
 
 class IconProvider:
     """Provider voor alle applicatie iconen"""
 
-    _icons = {}
-    _tree_icons_saved = False
-
-    @classmethod
-    def get_icon(cls, name: str, size: int = 32) -> QIcon:
-        """Haal een icoon op bij naam"""
-        key = f"{name}_{size}"
-
-        if key not in cls._icons:
-            icon_creators = {
-                "new": create_3d_document_icon,
-                "open": create_3d_folder_icon,
-                "save": create_3d_save_icon,
-                "print": create_3d_print_icon,
-                "cut": create_3d_cut_icon,
-                "copy": create_3d_copy_icon,
-                "paste": create_3d_paste_icon,
-                "chapter": create_3d_chapter_icon,
-                "cost_item": create_3d_cost_item_icon,
-                "text_row": create_3d_text_row_icon,
-                "delete": create_3d_delete_icon,
-                "pdf": create_3d_pdf_icon,
-                "ifc": create_3d_ifc_icon,
-                "dxf": create_3d_dxf_icon,
-                "measure": create_3d_measure_icon,
-                "zoom_in": create_3d_zoom_in_icon,
-                "zoom_out": create_3d_zoom_out_icon,
-                "fit": create_3d_fit_icon,
-                "excel": create_3d_excel_icon,
-                "ods": create_3d_ods_icon,
-                "csv": create_3d_csv_icon,
-                "up": create_3d_up_icon,
-                "down": create_3d_down_icon,
-                "indent_in": create_3d_indent_in_icon,
-                "indent_out": create_3d_indent_out_icon,
-                "calculator": create_3d_calculator_icon,
-                "expand": create_3d_expand_icon,
-                "collapse": create_3d_collapse_icon,
-                "undo": create_3d_undo_icon,
-                "redo": create_3d_redo_icon,
-                "bold": create_3d_bold_icon,
-                "italic": create_3d_italic_icon,
-                "underline": create_3d_underline_icon,
-                "color": create_3d_color_icon,
-                "odt": create_3d_odt_icon,
-            }
-
-            if name in icon_creators:
-                cls._icons[key] = icon_creators[name](size)
-            else:
-                # Fallback: leeg icoon
-                cls._icons[key] = QIcon()
-
-        return cls._icons[key]
+    get_icon = staticmethod(get_icon)
@@ -7,15 +7,233 @@ from PySide6.QtWidgets import (
     QLabel, QFileDialog, QMessageBox, QSplitter, QTreeWidget,
     QTreeWidgetItem, QFrame, QSizePolicy
 )
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEnginePage
-from PySide6.QtWebChannel import QWebChannel
-from PySide6.QtCore import Qt, Signal, Slot, QObject, QUrl, QFile, QIODevice
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QUrl, QFile, QIODevice, QCoreApplication
+)
 from PySide6.QtGui import QColor
 
+from functools import lru_cache
 from pathlib import Path
-import base64
 import json
+import os
+
+from .icons import get_icon
+
+
+# URL scheme waarmee de viewer pagina IFC bestanden als ruwe bytes ophaalt
+_IFC_SCHEME = b"opencalc-ifc"
+
+# Omgevingsvariabelen voor de WebGL viewer; alleen als standaard, de gebruiker kan ze overschrijven
+_WEBENGINE_ENVIRONMENT = {
+    "QTWEBENGINE_CHROMIUM_FLAGS": "--enable-gpu-rasterization --enable-zero-copy --ignore-gpu-blocklist",
+    "QSG_RENDER_LOOP": "threaded",
+}
+
+
+def configure_webengine():
+    """
+    Stel Chromium en de Qt render loop in voor de 3D viewer.
+
+    Moet aangeroepen worden vóór het aanmaken van de QApplication; daarna
+    heeft QtWebEngine de vlaggen al gelezen. QtWebEngine wordt pas bij de
+    eerste viewer geïmporteerd, dus het gedeelde OpenGL context attribuut
+    dat die import anders zelf zet, wordt hier vooraf gezet.
+    """
+    for key, value in _WEBENGINE_ENVIRONMENT.items():
+        os.environ.setdefault(key, value)
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
+    # Eigen URL schemes moeten vóór de QApplication geregistreerd zijn. Dit laadt
+    # de QtWebEngineCore bibliotheek, maar start Chromium zelf nog niet.
+    from PySide6.QtWebEngineCore import QWebEngineUrlScheme
+
+    scheme = QWebEngineUrlScheme(_IFC_SCHEME)
+    flags = QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.CorsEnabled
+    if hasattr(QWebEngineUrlScheme, "FetchApiAllowed"):  # Qt 6.6+
+        flags |= QWebEngineUrlScheme.FetchApiAllowed
+    scheme.setFlags(flags)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+@lru_cache(maxsize=1)
+def _ifc_scheme_handler():
+    """
+    Gedeelde handler die IFC bestanden als ruwe bytes via opencalc-ifc: levert.
+
+    Chromium leest het bestand zelf in blokken van schijf, zonder base64 of
+    een volledige kopie in Python. De klasse wordt pas bij het eerste
+    gebruik gemaakt, zodat QtWebEngineCore lazy geladen blijft.
+    """
+    from PySide6.QtWebEngineCore import QWebEngineUrlSchemeHandler
+
+    class IFCSchemeHandler(QWebEngineUrlSchemeHandler):
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self._files: dict[str, str] = {}
+            self._next_token = 0
+
+        def stage_path(self, file_path: str) -> str:
+            """Zet een bestand klaar en geef de URL terug waarmee JavaScript het ophaalt"""
+            self._next_token += 1
+            token = str(self._next_token)
+            # Alleen het laatste bestand bewaren; eerdere URL's zijn al gebruikt of vervangen
+            self._files = {token: file_path}
+            return f"{_IFC_SCHEME.decode()}:{token}"
+
+        def requestStarted(self, job):
+            file_path = self._files.pop(job.requestUrl().path(), None)
+            if file_path is None:
+                job.fail(job.UrlNotFound)
+                return
+
+            # Ongebufferd: Chromium leest direct uit de page cache, zonder tussenbuffer van QFile
+            file = QFile(file_path, job)
+            if not file.open(QIODevice.ReadOnly | QIODevice.Unbuffered):
+                job.fail(job.RequestFailed)
+                return
+            job.reply(b"application/octet-stream", file)
+
+    return IFCSchemeHandler(QCoreApplication.instance())
+
+
+# Standaard categorieën in de model structuur (label, IFC type, icoon naam)
+_MODEL_CATEGORIES = (
+    ("Muren", "IfcWall", "ifc_wall"),
+    ("Vloeren", "IfcSlab", "ifc_slab"),
+    ("Deuren", "IfcDoor", "ifc_door"),
+    ("Ramen", "IfcWindow", "ifc_window"),
+    ("Kolommen", "IfcColumn", "ifc_column"),
+    ("Balken", "IfcBeam", "ifc_beam"),
+    ("Daken", "IfcRoof", "ifc_roof"),
+)
+
+
+# Camera presets; de posities zelf staan in window.setView van de viewer HTML
+_VIEW_COMMANDS = {
+    view: f'window.setView("{view}")'
+    for view in ("top", "front", "right", "iso")
+}
+
+
+def _resolve_viewer_path() -> Path | None:
+    """Zoek het HTML bestand van de viewer - de simpele versie is stabieler"""
+    viewer_dir = Path(__file__).parent.parent.parent / "resources" / "viewer"
+    for name in ("ifc_viewer_simple.html", "ifc_viewer.html"):
+        path = viewer_dir / name
+        if path.exists():
+            return path
+    return None
+
+
+# Eenmalig bepaald bij het importeren; None als er geen viewer bestand is
+_VIEWER_PATH = _resolve_viewer_path()
+
+# Fallback HTML als het viewer bestand niet gevonden is
+_FALLBACK_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body {
+            margin: 0;
+            padding: 40px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+            background: #1a1a2e;
+            color: #fff;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            height: 100vh;
+            text-align: center;
+        }
+        .container {
+            max-width: 400px;
+        }
+        h2 { color: #2962ff; }
+        p { color: #888; line-height: 1.6; }
+        .icon { font-size: 64px; margin-bottom: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="icon">🏗️</div>
+        <h2>IFC 3D Viewer</h2>
+        <p>De 3D viewer vereist een internetverbinding voor het laden van de That Open Company bibliotheken.</p>
+        <p>Sleep een IFC bestand hierheen om te bekijken.</p>
+    </div>
+</body>
+</html>
+"""
+
+
+# Stylesheets van de 3D viewer (eenmalig opgebouwd, gedeeld door alle instanties)
+_TOOLBAR_QSS = """
+    QToolBar {
+        background: #f5f5f5;
+        border-bottom: 1px solid #ddd;
+        padding: 4px;
+        spacing: 4px;
+    }
+    QToolButton {
+        padding: 6px 10px;
+        border-radius: 4px;
+        border: none;
+    }
+    QToolButton:hover {
+        background: #e0e0e0;
+    }
+    QToolButton:pressed {
+        background: #d0d0d0;
+    }
+"""
+
+_PROPS_HEADER_QSS = "font-weight: bold; padding: 8px; background: #f0f0f0;"
+
+_TREE_QSS = """
+    QTreeWidget {
+        border: none;
+        background: white;
+    }
+    QTreeWidget::item {
+        padding: 4px;
+    }
+    QTreeWidget::item:hover {
+        background: #e3f2fd;
+    }
+    QTreeWidget::item:selected {
+        background: #2962ff;
+        color: white;
+    }
+"""
+
+_STATUS_QSS = """
+    padding: 6px 10px;
+    background: #f8f9fa;
+    border-top: 1px solid #ddd;
+    color: #666;
+"""
+
+_HEADER_QSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f0f0f0, stop:1 #e0e0e0);
+        border-bottom: 1px solid #ccc;
+    }
+"""
+
+_TITLE_QSS = "font-weight: bold; font-size: 10pt;"
+
+_CLOSE_BTN_QSS = """
+    QToolButton {
+        border: none;
+        font-size: 16px;
+        padding: 2px 6px;
+    }
+    QToolButton:hover {
+        background: #ddd;
+        border-radius: 3px;
+    }
+"""
 
 
 class IFCViewerBridge(QObject):
@@ -48,21 +266,97 @@ class IFCViewerBridge(QObject):
         self.viewerReady.emit()
 
 
+class _ViewerPage:
+    """WebEngine view met WebChannel en bridge, herbruikbaar via _viewer_pool"""
+
+    def __init__(self):
+        # Chromium pas laden als er echt een 3D viewer nodig is
+        from PySide6.QtWebEngineWidgets import QWebEngineView
+        from PySide6.QtWebEngineCore import QWebEngineSettings
+        from PySide6.QtWebChannel import QWebChannel
+
+        self.view = QWebEngineView()
+        self.ready = False  # viewerReady van de huidige pagina al ontvangen
+
+        # WebEngine settings
+        settings = self.view.settings()
+        settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
+        settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
+        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
+        settings.setAttribute(QWebEngineSettings.WebGLEnabled, True)
+
+        # Qt-JS bridge; leeft net zo lang als de view
+        self.bridge = IFCViewerBridge(self.view)
+        self.channel = QWebChannel(self.view)
+        self.channel.registerObject("qt", self.bridge)
+        self.view.page().setWebChannel(self.channel)
+        self.bridge.viewerReady.connect(self._on_ready)
+
+        # IFC bestanden komen via opencalc-ifc:; het (gedeelde) profiel krijgt de handler één keer
+        profile = self.view.page().profile()
+        if profile.urlSchemeHandler(_IFC_SCHEME) is None:
+            profile.installUrlSchemeHandler(_IFC_SCHEME, _ifc_scheme_handler())
+
+        # Laad de HTML viewer
+        if _VIEWER_PATH is not None:
+            self.view.setUrl(QUrl.fromLocalFile(str(_VIEWER_PATH)))
+        else:
+            self.view.setHtml(_FALLBACK_HTML)
+
+    def _on_ready(self):
+        self.ready = True
+
+    def reset(self):
+        """Herlaad de pagina zodat het vorige model uit de scene verdwijnt"""
+        self.ready = False
+        self.view.reload()
+
+
+# Pagina's van gesloten viewers; een nieuwe viewer hergebruikt de al geladen pagina
+_viewer_pool: list[_ViewerPage] = []
+
+# Elke pagina in de pool houdt een Chromium renderer vast; één warme pagina is genoeg
+_VIEWER_POOL_SIZE = 1
+
+
+def _acquire_page() -> _ViewerPage:
+    """Neem een warme pagina uit de pool, of maak een nieuwe aan"""
+    return _viewer_pool.pop() if _viewer_pool else _ViewerPage()
+
+
+def warmup_ifc_viewer():
+    """
+    Laad alvast een verborgen viewer pagina in de pool.
+
+    Chromium starten en de viewer HTML laden kost honderden milliseconden;
+    vooraf gedaan opent het eerste IFC model zonder die wachttijd.
+    """
+    if not _viewer_pool:
+        _viewer_pool.append(_ViewerPage())
+
+
 class IFC3DViewer(QWidget):
     """3D IFC Viewer widget met That Open Company engine"""
 
     modelLoaded = Signal(str)
     elementSelected = Signal(dict)
 
+    tab_title = "🏗️ {name}"
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._current_file = None
-        self._viewer_ready = False
+
+        self._page = _acquire_page()
 
         self._setup_ui()
         self._setup_bridge()
-        self._load_viewer()
+
+        # Een pagina uit de pool kan al klaar zijn; viewerReady komt dan niet meer
+        self._viewer_ready = self._page.ready
+        if self._viewer_ready:
+            self._status.setText("Viewer gereed")
 
     def _setup_ui(self):
         """Setup de UI componenten"""
@@ -72,25 +366,7 @@ class IFC3DViewer(QWidget):
 
         # Toolbar
         self._toolbar = QToolBar()
-        self._toolbar.setStyleSheet("""
-            QToolBar {
-                background: #f5f5f5;
-                border-bottom: 1px solid #ddd;
-                padding: 4px;
-                spacing: 4px;
-            }
-            QToolButton {
-                padding: 6px 10px;
-                border-radius: 4px;
-                border: none;
-            }
-            QToolButton:hover {
-                background: #e0e0e0;
-            }
-            QToolButton:pressed {
-                background: #d0d0d0;
-            }
-        """)
+        self._toolbar.setStyleSheet(_TOOLBAR_QSS)
 
         # Open knop
         self._open_btn = QToolButton()
@@ -131,19 +407,11 @@ class IFC3DViewer(QWidget):
         # Splitter voor viewer en properties
         self._splitter = QSplitter(Qt.Horizontal)
 
-        # WebEngine viewer
-        self._web_view = QWebEngineView()
+        # WebEngine viewer (uit de pool, mogelijk al geladen)
+        self._web_view = self._page.view
         self._web_view.setMinimumSize(400, 300)
-
-        # WebEngine settings
-        settings = self._web_view.settings()
-        settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
-        settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
-        settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebGLEnabled, True)
-        settings.setAttribute(QWebEngineSettings.Accelerated2dCanvasEnabled, True)
-
         self._splitter.addWidget(self._web_view)
+        self._web_view.show()
 
         # Properties panel
         self._props_panel = QFrame()
@@ -154,27 +422,12 @@ class IFC3DViewer(QWidget):
         props_layout = QVBoxLayout(self._props_panel)
 
         props_header = QLabel("Model Structuur")
-        props_header.setStyleSheet("font-weight: bold; padding: 8px; background: #f0f0f0;")
+        props_header.setStyleSheet(_PROPS_HEADER_QSS)
         props_layout.addWidget(props_header)
 
         self._tree_widget = QTreeWidget()
         self._tree_widget.setHeaderHidden(True)
-        self._tree_widget.setStyleSheet("""
-            QTreeWidget {
-                border: none;
-                background: white;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:hover {
-                background: #e3f2fd;
-            }
-            QTreeWidget::item:selected {
-                background: #2962ff;
-                color: white;
-            }
-        """)
+        self._tree_widget.setStyleSheet(_TREE_QSS)
         props_layout.addWidget(self._tree_widget)
 
         self._splitter.addWidget(self._props_panel)
@@ -184,78 +437,40 @@ class IFC3DViewer(QWidget):
 
         # Status bar
         self._status = QLabel("Gereed - Sleep een IFC bestand of klik Openen")
-        self._status.setStyleSheet("""
-            padding: 6px 10px;
-            background: #f8f9fa;
-            border-top: 1px solid #ddd;
-            color: #666;
-        """)
+        self._status.setStyleSheet(_STATUS_QSS)
         layout.addWidget(self._status)
 
     def _setup_bridge(self):
-        """Setup de Qt-JS bridge"""
-        self._bridge = IFCViewerBridge(self)
-        self._channel = QWebChannel()
-        self._channel.registerObject("qt", self._bridge)
-        self._web_view.page().setWebChannel(self._channel)
+        """Koppel de Qt-JS bridge van de pagina aan deze viewer"""
+        self._bridge = self._page.bridge
 
         # Connect signals
         self._bridge.modelLoaded.connect(self._on_model_loaded)
         self._bridge.elementSelected.connect(self._on_element_selected)
         self._bridge.viewerReady.connect(self._on_viewer_ready)
 
-    def _load_viewer(self):
-        """Laad de HTML viewer"""
-        # Zoek het HTML bestand - gebruik de simpele versie die stabieler is
-        viewer_path = Path(__file__).parent.parent.parent / "resources" / "viewer" / "ifc_viewer_simple.html"
+    def _release_page(self):
+        """Geef de WebEngine pagina terug aan de pool"""
+        if self._page is None:
+            return
 
-        # Fallback naar originele viewer als simpele niet bestaat
-        if not viewer_path.exists():
-            viewer_path = Path(__file__).parent.parent.parent / "resources" / "viewer" / "ifc_viewer.html"
+        self._bridge.modelLoaded.disconnect(self._on_model_loaded)
+        self._bridge.elementSelected.disconnect(self._on_element_selected)
+        self._bridge.viewerReady.disconnect(self._on_viewer_ready)
 
-        if viewer_path.exists():
-            self._web_view.setUrl(QUrl.fromLocalFile(str(viewer_path)))
+        if len(_viewer_pool) >= _VIEWER_POOL_SIZE:
+            self._web_view.deleteLater()  # Pool vol: pagina met de viewer opruimen
         else:
-            # Fallback: inline HTML
-            self._web_view.setHtml(self._get_fallback_html())
-
-    def _get_fallback_html(self) -> str:
-        """Fallback HTML als viewer bestand niet gevonden"""
-        return """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {
-                    margin: 0;
-                    padding: 40px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    background: #1a1a2e;
-                    color: #fff;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    height: 100vh;
-                    text-align: center;
-                }
-                .container {
-                    max-width: 400px;
-                }
-                h2 { color: #2962ff; }
-                p { color: #888; line-height: 1.6; }
-                .icon { font-size: 64px; margin-bottom: 20px; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="icon">🏗️</div>
-                <h2>IFC 3D Viewer</h2>
-                <p>De 3D viewer vereist een internetverbinding voor het laden van de That Open Company bibliotheken.</p>
-                <p>Sleep een IFC bestand hierheen om te bekijken.</p>
-            </div>
-        </body>
-        </html>
-        """
+            # Loskoppelen zodat de view het verwijderen van deze viewer overleeft
+            self._web_view.setParent(None)
+            self._page.reset()
+            _viewer_pool.append(self._page)
+        self._page = None
+
+    def closeEvent(self, event):
+        """Bewaar de geladen pagina voor de volgende viewer"""
+        self._release_page()
+        super().closeEvent(event)
 
     def _open_file(self):
         """Open een IFC bestand via dialoog"""
@@ -269,33 +484,29 @@ class IFC3DViewer(QWidget):
         if file_path:
             self.load_file(file_path)
 
-    def load_file(self, file_path: str):
+    def load_file(self, file_path: str) -> bool:
         """Laad een IFC bestand in de viewer"""
+        if self._page is None:
+            return False  # Pagina al teruggegeven aan de pool; niet in de volgende viewer laden
+
         path = Path(file_path)
 
         if not path.exists():
             QMessageBox.warning(self, "Bestand niet gevonden",
                                 f"Kan bestand niet vinden:\n{file_path}")
-            return
+            return False
 
         self._current_file = str(path)
         self._status.setText(f"Laden: {path.name}...")
 
-        try:
-            # Lees bestand en converteer naar base64
-            with open(path, 'rb') as f:
-                data = f.read()
-
-            base64_data = base64.b64encode(data).decode('utf-8')
-
-            # Stuur naar JavaScript
-            js_code = f'window.loadIFCBuffer("{base64_data}", "{path.name}")'
-            self._web_view.page().runJavaScript(js_code)
+        # JavaScript haalt de ruwe bytes zelf op; Chromium leest het bestand in blokken
+        url = _ifc_scheme_handler().stage_path(self._current_file)
+        args = ", ".join(json.dumps(arg) for arg in (url, path.name))
+        self._web_view.page().runJavaScript(f"window.loadIFCFromUrl({args})")
+        return True
 
-        except Exception as e:
-            QMessageBox.critical(self, "Laadfout",
-                                 f"Fout bij laden van IFC:\n{str(e)}")
-            self._status.setText("Fout bij laden")
+    # Uniform laad-protocol van de document viewers
+    load = load_file
 
     def _fit_view(self):
         """Pas weergave aan zodat model past"""
@@ -303,44 +514,36 @@ class IFC3DViewer(QWidget):
 
     def _set_view(self, view_type: str):
         """Stel camera view in"""
-        views = {
-            "top": "world.camera.controls.setLookAt(0, 50, 0, 0, 0, 0, true)",
-            "front": "world.camera.controls.setLookAt(0, 10, 50, 0, 0, 0, true)",
-            "right": "world.camera.controls.setLookAt(50, 10, 0, 0, 0, 0, true)",
-            "iso": "world.camera.controls.setLookAt(30, 30, 30, 0, 0, 0, true)"
-        }
-
-        if view_type in views:
-            self._web_view.page().runJavaScript(views[view_type])
+        js_code = _VIEW_COMMANDS.get(view_type)
+        if js_code:
+            self._web_view.page().runJavaScript(js_code)
 
     def _on_model_loaded(self, filename: str):
         """Callback wanneer model geladen is"""
         self._status.setText(f"Geladen: {filename}")
         self.modelLoaded.emit(filename)
 
-        # Update tree widget met basis structuur
-        self._tree_widget.clear()
-
-        root = QTreeWidgetItem(["📁 " + filename])
-        self._tree_widget.addTopLevelItem(root)
+        # Update tree widget met basis structuur, zonder tussentijdse repaints
+        self._tree_widget.setUpdatesEnabled(False)
+        try:
+            self._tree_widget.clear()
 
-        # Voeg standaard categorieën toe
-        categories = [
-            ("🧱 Muren", "IfcWall"),
-            ("⬜ Vloeren", "IfcSlab"),
-            ("🚪 Deuren", "IfcDoor"),
-            ("🪟 Ramen", "IfcWindow"),
-            ("📐 Kolommen", "IfcColumn"),
-            ("📏 Balken", "IfcBeam"),
-            ("🏠 Daken", "IfcRoof"),
-        ]
+            root = QTreeWidgetItem([filename])
+            root.setIcon(0, get_icon("open", 16))
 
-        for name, ifc_type in categories:
-            item = QTreeWidgetItem([name])
-            item.setData(0, Qt.UserRole, ifc_type)
-            root.addChild(item)
+            # Standaard categorieën in één keer toevoegen
+            items = []
+            for name, ifc_type, icon_name in _MODEL_CATEGORIES:
+                item = QTreeWidgetItem([name])
+                item.setIcon(0, get_icon(icon_name, 16))
+                item.setData(0, Qt.UserRole, ifc_type)
+                items.append(item)
+            root.addChildren(items)
 
-        root.setExpanded(True)
+            self._tree_widget.addTopLevelItem(root)
+            root.setExpanded(True)
+        finally:
+            self._tree_widget.setUpdatesEnabled(True)
 
     def _on_element_selected(self, data: dict):
         """Callback wanneer element geselecteerd is"""
@@ -368,18 +571,12 @@ class IFC3DViewerPanel(QWidget):
 
         # Header
         header = QFrame()
-        header.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f0f0f0, stop:1 #e0e0e0);
-                border-bottom: 1px solid #ccc;
-            }
-        """)
+        header.setStyleSheet(_HEADER_QSS)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(8, 4, 8, 4)
 
         title = QLabel("🏗️ IFC 3D Viewer")
-        title.setStyleSheet("font-weight: bold; font-size: 10pt;")
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
 
         header_layout.addStretch()
@@ -387,17 +584,7 @@ class IFC3DViewerPanel(QWidget):
         # Close knop
         close_btn = QToolButton()
         close_btn.setText("×")
-        close_btn.setStyleSheet("""
-            QToolButton {
-                border: none;
-                font-size: 16px;
-                padding: 2px 6px;
-            }
-            QToolButton:hover {
-                background: #ddd;
-                border-radius: 3px;
-            }
-        """)
+        close_btn.setStyleSheet(_CLOSE_BTN_QSS)
         close_btn.clicked.connect(self.hide)
         header_layout.addWidget(close_btn)
 
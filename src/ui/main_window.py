@@ -5,27 +5,540 @@ MainWindow - Hoofdvenster van de OpenCalc applicatie
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QMenuBar, QMenu, QToolBar, QStatusBar, QFileDialog, QMessageBox,
-    QLabel, QFrame, QTabWidget, QDockWidget, QApplication
+    QLabel, QFrame, QTabWidget, QDockWidget, QApplication, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QAction, QKeySequence, QClipboard
-
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker, QUrl
+)
+from PySide6.QtGui import QAction, QKeySequence, QClipboard, QDesktopServices
+
+from collections import deque
+import csv
+from dataclasses import dataclass
+import time
+from functools import lru_cache, partial
+from importlib.util import find_spec
+import logging
+from operator import attrgetter
+import mmap
+import os
+import pickle
+import re
+import subprocess
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from ..models import CostSchedule, CostItem
 from ..ifc import IFCHandler, CostAPI
+from ..services import PrintService, ExportService
 from .cost_table import CostTableView
 from .properties_panel import PropertiesPanel
 from .ribbon import OpenCalcRibbon
 from .document_viewer import DocumentViewerPanel
-from .ifc_3d_viewer import IFC3DViewerPanel
+from .ifc_3d_viewer import IFC3DViewerPanel, warmup_ifc_viewer
 from .surcharges_panel import SurchargesPanel
 from .project_panel import ProjectPanel
 from .report_panel import ReportPanel
 from .quotation_panel import QuotationPanel
 
 
+logger = logging.getLogger(__name__)
+
+
+_STABU_EXAMPLE_PATH = (
+    Path(__file__).resolve().parent.parent.parent / "voorbeelden" / "woning_stabu_begroting.ifc"
+)
+
+
+@lru_cache(maxsize=1)
+def _stabu_example_exists() -> bool:
+    """Of de STABU voorbeeldbegroting aanwezig is (één keer per proces gecontroleerd)"""
+    return _STABU_EXAMPLE_PATH.is_file()
+
+
+# Subtabs die pas bij het eerste bekijken gebouwd worden: index -> (attribuut, label, klasse).
+# Index 1 is de Begroting tab; die is de starttab en wordt altijd direct gebouwd.
+_LAZY_SUBTABS = {
+    0: ("project_panel", "Projectgegevens", ProjectPanel),
+    2: ("surcharges_panel", "Opslagen", SurchargesPanel),
+    3: ("report_panel", "Rapport", ReportPanel),
+    4: ("quotation_panel", "Offerte", QuotationPanel),
+}
+
+
+_MAIN_TABS_QSS = """
+    QTabWidget#documentTabs::pane {
+        border: none;
+        background: white;
+    }
+    QTabWidget#documentTabs > QTabBar::tab {
+        background: #e2e8f0;
+        border: 1px solid #cbd5e1;
+        border-bottom: none;
+        padding: 6px 16px;
+        margin-right: 2px;
+        font-size: 9pt;
+    }
+    QTabWidget#documentTabs > QTabBar::tab:selected {
+        background: white;
+        border-top: 2px solid #0ea5e9;
+    }
+    QTabWidget#documentTabs > QTabBar::tab:hover:!selected {
+        background: #f1f5f9;
+    }
+    QTabWidget#documentTabs > QTabBar::close-button {
+        image: url(close.png);
+        subcontrol-position: right;
+    }
+"""
+
+_SUB_TABS_QSS = """
+    QTabWidget#docSubTabs::pane {
+        border: none;
+        background: white;
+    }
+    QTabWidget#docSubTabs > QTabBar::tab {
+        background: #f1f5f9;
+        border: 1px solid #cbd5e1;
+        border-bottom: none;
+        padding: 8px 20px;
+        margin-right: 2px;
+        font-weight: 500;
+        font-size: 10pt;
+    }
+    QTabWidget#docSubTabs > QTabBar::tab:selected {
+        background: white;
+        border-top: 3px solid #0ea5e9;
+    }
+    QTabWidget#docSubTabs > QTabBar::tab:hover:!selected {
+        background: #e2e8f0;
+    }
+"""
+
+
+# Dark mode thema, één keer opgebouwd bij het laden van de module
+_DARK_QSS = """
+    /* ===== NEXT LEVEL DARK MODE ===== */
+    * { color: #e2e8f0; }
+
+    QMainWindow { background-color: #0a0f1a; }
+    QWidget { background-color: #111827; color: #e2e8f0; }
+
+    /* Menu */
+    QMenuBar {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #1f2937, stop:1 #111827);
+        color: #e2e8f0; border-bottom: 1px solid #374151;
+    }
+    QMenuBar::item:selected { background: #374151; border-radius: 4px; }
+    QMenu { background: #1f2937; border: 1px solid #4b5563; border-radius: 8px; padding: 4px; }
+    QMenu::item { padding: 8px 20px; border-radius: 4px; }
+    QMenu::item:selected { background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0ea5e9, stop:1 #06b6d4); }
+
+    /* Tabs */
+    QTabWidget::pane { background: #111827; border: none; border-top: 2px solid #0ea5e9; }
+    QTabBar::tab { background: transparent; color: #9ca3af; padding: 10px 20px; font-weight: 500; }
+    QTabBar::tab:selected { color: #0ea5e9; border-bottom: 3px solid #0ea5e9; background: #1f2937; }
+    QTabBar::tab:hover:!selected { background: #1f2937; color: #e2e8f0; }
+
+    /* Tree/Table Views */
+    QTreeView, QTableView, QTableWidget, QListView {
+        background: #0a0f1a; color: #e2e8f0; border: 1px solid #374151;
+        border-radius: 8px; alternate-background-color: #111827;
+        gridline-color: #1f2937;
+    }
+    QTreeView::item, QTableView::item { padding: 8px; border-bottom: 1px solid #1f2937; }
+    QTreeView::item:selected, QTableView::item:selected {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0369a1, stop:1 #0ea5e9);
+        color: white;
+    }
+    QTreeView::item:hover:!selected { background: #1e3a5f; }
+    QHeaderView::section {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #374151, stop:1 #1f2937);
+        color: #9ca3af; border: none; border-right: 1px solid #4b5563;
+        border-bottom: 1px solid #4b5563; padding: 10px; font-weight: 600;
+    }
+
+    /* Inputs */
+    QLineEdit, QTextEdit, QPlainTextEdit, QTextBrowser {
+        background: #0a0f1a; color: #e2e8f0; border: 2px solid #374151;
+        border-radius: 8px; padding: 10px;
+    }
+    QLineEdit:focus, QTextEdit:focus { border: 2px solid #0ea5e9; background: #111827; }
+    QSpinBox, QDoubleSpinBox, QDateEdit, QComboBox {
+        background: #0a0f1a; color: #e2e8f0; border: 2px solid #374151;
+        border-radius: 8px; padding: 8px;
+    }
+    QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus, QComboBox:focus { border: 2px solid #0ea5e9; }
+    QComboBox::drop-down { border: none; background: #374151; width: 30px; border-radius: 0 6px 6px 0; }
+    QComboBox QAbstractItemView { background: #1f2937; border: 1px solid #4b5563; border-radius: 8px; }
+
+    /* Buttons */
+    QPushButton {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #4b5563, stop:1 #374151);
+        color: #e2e8f0; border: 1px solid #6b7280; border-radius: 8px; padding: 10px 18px; font-weight: 500;
+    }
+    QPushButton:hover { background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #6b7280, stop:1 #4b5563); }
+    QPushButton:pressed { background: #1f2937; border: 1px solid #0ea5e9; }
+    QToolButton { background: transparent; color: #e2e8f0; border-radius: 6px; padding: 6px; }
+    QToolButton:hover { background: #374151; }
+    QToolButton:checked { background: #0ea5e9; color: white; }
+
+    /* GroupBox */
+    QGroupBox {
+        background: #1f2937; border: 1px solid #374151; border-radius: 12px;
+        margin-top: 20px; padding: 20px; padding-top: 28px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin; left: 16px; padding: 0 10px;
+        color: #0ea5e9; background: #1f2937; font-weight: 600;
+    }
+
+    /* Checkbox/Radio */
+    QCheckBox, QRadioButton { color: #e2e8f0; spacing: 10px; }
+    QCheckBox::indicator, QRadioButton::indicator {
+        width: 22px; height: 22px; border: 2px solid #4b5563; border-radius: 6px; background: #0a0f1a;
+    }
+    QRadioButton::indicator { border-radius: 11px; }
+    QCheckBox::indicator:checked, QRadioButton::indicator:checked { background: #0ea5e9; border-color: #0ea5e9; }
+    QCheckBox::indicator:hover { border-color: #0ea5e9; }
+
+    /* Scrollbars */
+    QScrollBar:vertical { background: #0a0f1a; width: 14px; border-radius: 7px; }
+    QScrollBar::handle:vertical {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #4b5563, stop:1 #6b7280);
+        border-radius: 6px; min-height: 30px; margin: 2px;
+    }
+    QScrollBar::handle:vertical:hover { background: #0ea5e9; }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+    QScrollBar:horizontal { background: #0a0f1a; height: 14px; border-radius: 7px; }
+    QScrollBar::handle:horizontal {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #4b5563, stop:1 #6b7280);
+        border-radius: 6px; min-width: 30px; margin: 2px;
+    }
+    QScrollBar::handle:horizontal:hover { background: #0ea5e9; }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
+
+    /* Status & Dock */
+    QStatusBar { background: #0a0f1a; color: #9ca3af; border-top: 1px solid #374151; }
+    QDockWidget { color: #e2e8f0; }
+    QDockWidget::title {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #374151, stop:1 #1f2937);
+        color: #0ea5e9; padding: 12px; border-bottom: 2px solid #0ea5e9; font-weight: 600;
+    }
+
+    /* Misc */
+    QLabel { color: #e2e8f0; background: transparent; }
+    QFrame { border-color: #374151; }
+    QSplitter::handle { background: #374151; }
+    QSplitter::handle:hover { background: #0ea5e9; }
+    QToolTip { background: #1f2937; color: #e2e8f0; border: 1px solid #0ea5e9; border-radius: 6px; padding: 8px; }
+    QScrollArea { background: transparent; border: none; }
+    QDialog { background: #1f2937; }
+"""
+
+# Regexes voor het verwijderen van HTML opmaak uit de naam
+_COLOR_SPAN_RE = re.compile(r'<span style="color:[^"]*">(.*?)</span>')
+_TAG_RES = {tag: re.compile(f'<{tag}>(.*?)</{tag}>') for tag in ("b", "i", "u")}
+
+
+# Velden van een CostItem die undo/redo bijhoudt
+_UNDO_FIELDS = (
+    "name", "html_name", "identification", "quantity", "unit_price", "sfb_code", "is_text_only",
+)
+
+
+# Aantal niveaus dat bij openen direct geladen wordt; de rest volgt in porties
+_EAGER_LOAD_DEPTH = 2
+_LOAD_SLICE_SECONDS = 0.03
+
+# Bits voor de uitgestelde UI updates
+_UI_REFRESH, _UI_TOTALS, _UI_TITLE = 1, 2, 4
+
+# Velden zonder invloed op de totalen
+_COSMETIC_FIELDS = frozenset({"html_name", "description"})
+
+# Huidige waarden van de bijgehouden velden als tuple, zonder Python lus per veld
+_undo_fields = attrgetter(*_UNDO_FIELDS)
+
+# Vooraf opgemaakte volgnummers ("01", "02", ...) voor het nummeren van items
+_ID_STRINGS = tuple(f"{i:02d}" for i in range(1000))
+
+
+def _identification(number: int) -> str:
+    """Volgnummer als identificatie met minimaal twee cijfers"""
+    if number < len(_ID_STRINGS):
+        return _ID_STRINGS[number]
+    return f"{number:02d}"
+
+
+def _ifc_item_edit(item: CostItem) -> dict:
+    """Gewijzigde attributen en properties van een item voor CostAPI.edit_cost_items_bulk"""
+    dirty = item.dirty_fields
+
+    attributes = {}
+    if "name" in dirty:
+        attributes["Name"] = item.name
+    if "identification" in dirty:
+        attributes["Identification"] = item.identification
+    if "description" in dirty:
+        attributes["Description"] = item.description
+
+    formatting = {}
+    if "html_name" in dirty and item.html_name:
+        formatting["HtmlName"] = item.html_name
+    if "is_text_only" in dirty and item.is_text_only:
+        formatting["IsTextOnly"] = "true"
+
+    psets = {}
+    if "sfb_code" in dirty and item.sfb_code:
+        psets["Pset_CostClassification"] = {"SFB_Code": item.sfb_code}
+    if formatting:
+        psets["Pset_CostFormatting"] = formatting
+
+    return {"attributes": attributes, "psets": psets}
+
+
+def _root_of(item: CostItem) -> CostItem:
+    """Het hoofdstuk (root item) waar een item onder valt"""
+    while item.parent:
+        item = item.parent
+    return item
+
+
+def _paste_specs(root: CostItem) -> tuple:
+    """Items van een boom in pre-order plus de specs voor CostAPI.add_cost_items_bulk"""
+    items, specs = [], []
+    stack = [(root, None)]
+    while stack:
+        item, parent_index = stack.pop()
+        specs.append({
+            "parent": parent_index,
+            "name": item.name,
+            "identification": item.identification,
+        })
+        items.append(item)
+        index = len(items) - 1
+        stack.extend((child, index) for child in reversed(item.children))
+    return items, specs
+
+
+# openpyxl (met lxml) is zwaar: pas bij de eerste Excel import geladen, in de worker thread
+_openpyxl = None
+
+
+def _get_openpyxl():
+    """Geef de openpyxl module; importeert hem bij het eerste gebruik"""
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl
+        _openpyxl = openpyxl
+    return _openpyxl
+
+
+def _count_excel_rows(file_path: str) -> int:
+    """Tel de regels met een code in het actieve werkblad (streamend, zonder opmaak)"""
+    wb = _get_openpyxl().load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return sum(1 for row in wb.active.iter_rows(min_row=2, values_only=True) if row and row[0])
+    finally:
+        wb.close()
+
+
+# Bytes waarbij csv.reader anders telt dan regels splitsen: quotes (regeleinden in
+# velden), losse CR regeleinden en niet-ASCII (UTF-8 controle en BOM)
+_CSV_SLOW_PATH_RE = re.compile(rb'["\r\x80-\xff]')
+
+
+def _count_csv_rows(file_path: str) -> int:
+    """Tel de niet-lege regels na de kopregel van een CSV bestand"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _CSV_SLOW_PATH_RE.search(mm) is None:
+                # Elke niet-lege regel is een rij; tellen zonder decoderen. Net als
+                # csv.reader geldt de eerste regel als kopregel, ook als die leeg is
+                lines = iter(mm.readline, b"")
+                next(lines)
+                return sum(1 for line in lines if line != b"\n")
+
+    # Velden tussen quotes kunnen regeleinden bevatten: volledig parsen
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f, delimiter=';')
+        next(reader, None)  # Sla de kopregel over
+        return sum(1 for row in reader if row)
+
+
+def _create_ifc_items(cost_api: CostAPI, root: CostItem, parent: Optional[CostItem],
+                      schedule: Optional[CostSchedule]):
+    """Maak IFC kostenposten voor een item en al zijn kinderen onder de IFC parent"""
+    items, specs = _paste_specs(root)
+    if parent is not None:
+        if parent.ifc_cost_item is None:
+            return
+        ifc_items = cost_api.add_cost_items_bulk(parent.ifc_cost_item, specs)
+    else:
+        if schedule is None or schedule.ifc_cost_schedule is None:
+            return
+        ifc_root = cost_api.add_cost_item(
+            cost_schedule=schedule.ifc_cost_schedule,
+            name=root.name,
+            identification=root.identification
+        )
+        # De kinderen hangen onder de nieuwe root: indices schuiven één plaats op
+        child_specs = [
+            {**spec, "parent": None if spec["parent"] == 0 else spec["parent"] - 1}
+            for spec in specs[1:]
+        ]
+        ifc_items = [ifc_root] + cost_api.add_cost_items_bulk(ifc_root, child_specs)
+    for item, ifc_item in zip(items, ifc_items):
+        item.ifc_cost_item = ifc_item
+        item.mark_all_dirty()  # Opmaak en SFB-code volgen bij de volgende sync
+
+    # Nieuwe posten komen achteraan in IFC: terugzetten vóór de volgende broer
+    siblings = parent.children if parent is not None else schedule.items
+    position = next(i for i, sibling in enumerate(siblings) if sibling is root)
+    before = next((sibling.ifc_cost_item for sibling in siblings[position + 1:]
+                   if sibling.ifc_cost_item is not None), None)
+    cost_api.move_cost_item(root.ifc_cost_item, before)
+
+
+def _remove_ifc_items(cost_api: CostAPI, root: CostItem):
+    """Verwijder de IFC kostenposten van een item; geneste posten gaan mee"""
+    if root.ifc_cost_item is not None:
+        cost_api.remove_cost_item(root.ifc_cost_item)
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        item.ifc_cost_item = None
+        stack.extend(item.children)
+
+
+@dataclass
+class EditCommand:
+    """Wijziging van één veld van een item"""
+    item: CostItem
+    field: str
+    old: Any
+    new: Any
+
+    def undo(self):
+        setattr(self.item, self.field, self.old)
+
+    def redo(self):
+        setattr(self.item, self.field, self.new)
+
+
+def _pack_fields(items: list) -> bytes:
+    """Bijgehouden velden van veel items als één binaire snapshot"""
+    return pickle.dumps([_undo_fields(item) for item in items], protocol=5)
+
+
+@dataclass
+class SnapshotCommand:
+    """Bulkwijziging van veel items, bewaard als twee binaire snapshots i.p.v. losse commando's"""
+    items: list
+    before: bytes
+    after: bytes
+
+    def _restore(self, blob: bytes):
+        for item, values in zip(self.items, pickle.loads(blob)):
+            for field, value in zip(_UNDO_FIELDS, values):
+                setattr(item, field, value)
+
+    def undo(self):
+        self._restore(self.before)
+
+    def redo(self):
+        self._restore(self.after)
+
+
+@dataclass
+class StructureCommand:
+    """
+    Toevoegen (added=True) of verwijderen van een item op een vaste positie.
+
+    Met een cost_api worden de IFC kostenposten van het item meegenomen:
+    verwijderd bij het weghalen en opnieuw aangemaakt bij het terugzetten.
+    """
+    item: CostItem
+    parent: Optional[CostItem]  # None: hoofdniveau van de begroting
+    schedule: Optional[CostSchedule]
+    index: int
+    added: bool
+    cost_api: Optional[CostAPI] = None
+
+    def _insert(self):
+        if self.parent is not None:
+            self.parent.insert_child(self.index, self.item)
+        elif self.schedule is not None:
+            self.schedule.insert_item(self.index, self.item)
+        if self.cost_api is not None and self.item.ifc_cost_item is None:
+            _create_ifc_items(self.cost_api, self.item, self.parent, self.schedule)
+
+    def _remove(self):
+        if self.parent is not None:
+            self.parent.remove_child(self.item)
+        elif self.schedule is not None:
+            self.schedule.remove_item(self.item)
+        if self.cost_api is not None:
+            _remove_ifc_items(self.cost_api, self.item)
+
+    def undo(self):
+        self._remove() if self.added else self._insert()
+
+    def redo(self):
+        self._insert() if self.added else self._remove()
+
+
+class _FileJobSignals(QObject):
+    """Signalen van een achtergrond taak voor het lezen of schrijven van een bestand"""
+
+    finished = Signal(object)  # resultaat van de taak
+    failed = Signal(str)       # foutmelding
+
+
+class _FileJobTask(QRunnable):
+    """Voer bestands I/O uit in een worker thread"""
+
+    def __init__(self, job: Callable, signals: _FileJobSignals):
+        super().__init__()
+        self._job = job
+        self._signals = signals
+
+    def run(self):
+        try:
+            result = self._job()
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.finished.emit(result)
+
+
+class _LazyPanel:
+    """
+    Plaatshouder voor een subtab paneel dat nog niet gebouwd is.
+
+    set_* aanroepen worden onthouden (de laatste per methode) en na het
+    bouwen opnieuw uitgevoerd; elke andere toegang bouwt het paneel direct.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._pending: dict[str, tuple] = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("set_"):
+            return lambda *args: self._pending.__setitem__(name, args)
+        return getattr(self._build(), name)
+
+    def replay(self, panel):
+        """Voer de onthouden set_* aanroepen uit op het echte paneel"""
+        for name, args in self._pending.items():
+            getattr(panel, name)(*args)
+
+
 class MainWindow(QMainWindow):
     """Hoofdvenster van de OpenCalc applicatie"""
 
@@ -39,12 +552,34 @@ class MainWindow(QMainWindow):
         self._cost_api: Optional[CostAPI] = None
         self._schedule: Optional[CostSchedule] = None
 
-        # Undo/Redo stacks
-        self._undo_stack = []
-        self._redo_stack = []
+        # Undo/Redo stacks; elk element is de lijst commando's van één actie
+        self._undo_stack: list[list] = []
+        self._redo_stack: list[list] = []
         self._max_undo_levels = 50
+        self._item_snapshot: Optional[tuple] = None
+
+        self._ifc_viewer_warmed = False
+        self._is_dark_mode = False
+        self._updating_item = False  # Re-entry guard van _on_item_changed
+        self._file_job_active = False
+        self._job_progress: Optional[QProgressDialog] = None
+        self._active_doc_widget: Optional[QWidget] = None
+        self._deferred_loads: deque = deque()  # (ifc_item, parent, diepte) die nog geladen moeten worden
+        self._connected_table_view: Optional[CostTableView] = None
+
+        # Verzamel refreshes en titel/totalen updates binnen één event loop
+        # iteratie tot één update per soort
+        self._ui_dirty = 0
+        # Print/export services per begroting, geldig tot de volgende wijziging
+        self._service_cache: dict = {}
+        self._last_title: Optional[str] = None
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(0)
+        self._ui_update_timer.timeout.connect(self._flush_pending_ui)
 
         self._setup_ui()
+        self._actions = self._build_shared_actions()
         self._setup_menu()
         self._setup_statusbar()
         self._connect_signals()
@@ -53,12 +588,16 @@ class MainWindow(QMainWindow):
         if initial_file and Path(initial_file).exists():
             self._open_file_path(initial_file)
         else:
-            # Probeer de STABU voorbeeldbegroting te openen
-            stabu_example = Path(__file__).parent.parent.parent / "voorbeelden" / "woning_stabu_begroting.ifc"
-            if stabu_example.exists():
-                self._open_file_path(str(stabu_example))
-            else:
-                self._new_file()
+            # Start met een lege begroting zodat het venster direct kan tekenen;
+            # het voorbeeld wordt in de volgende event loop iteratie geladen
+            self._new_file()
+            if _stabu_example_exists():
+                QTimer.singleShot(0, partial(self._open_example_file, str(_STABU_EXAMPLE_PATH)))
+
+    def _open_example_file(self, file_path: str):
+        """Open het voorbeeldbestand, tenzij er intussen al een bestand geopend is"""
+        if self._ifc_handler.file_path is None:
+            self._open_file_path(file_path)
 
     def _setup_ui(self):
         """Stel de UI componenten in"""
@@ -103,31 +642,10 @@ class MainWindow(QMainWindow):
         self._document_tabs.setMovable(True)
         self._document_tabs.tabCloseRequested.connect(self._close_document_tab)
         self._document_tabs.currentChanged.connect(self._on_document_tab_changed)
-        self._document_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background: white;
-            }
-            QTabBar::tab {
-                background: #e2e8f0;
-                border: 1px solid #cbd5e1;
-                border-bottom: none;
-                padding: 6px 16px;
-                margin-right: 2px;
-                font-size: 9pt;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                border-top: 2px solid #0ea5e9;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #f1f5f9;
-            }
-            QTabBar::close-button {
-                image: url(close.png);
-                subcontrol-position: right;
-            }
-        """)
+        # Eén stylesheet voor de document tabs en (via #docSubTabs) alle subtabs,
+        # zodat Qt die niet per nieuw document opnieuw hoeft te parsen
+        self._document_tabs.setObjectName("documentTabs")
+        self._document_tabs.setStyleSheet(_MAIN_TABS_QSS + _SUB_TABS_QSS)
 
         # Eerste document tab (wordt gevuld bij openen)
         self._create_document_tab()
@@ -147,14 +665,17 @@ class MainWindow(QMainWindow):
         # Properties dock widget (links of rechts)
         self._properties_dock = QDockWidget("Eigenschappen", self)
         self._properties_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        self._properties_panel = PropertiesPanel()
-        self._properties_dock.setWidget(self._properties_panel)
+        # Het echte paneel wordt pas gebouwd als de dock voor het eerst zichtbaar wordt
+        self._properties_panel: Optional[PropertiesPanel] = None
+        self._properties_dock.setWidget(QWidget())
+        self._properties_dock.visibilityChanged.connect(self._on_properties_visibility_changed)
         self._properties_dock.setMinimumWidth(300)
         self.addDockWidget(Qt.RightDockWidgetArea, self._properties_dock)
         self._properties_dock.hide()  # Start verborgen
 
         # Clipboard voor kopiëren/plakken
-        self._clipboard_item: Optional[CostItem] = None
+        # Geserialiseerde kopie (CostItem.to_tuple), houdt geen levende items vast
+        self._clipboard_blob: Optional[bytes] = None
 
     def _create_document_tab(self, name: str = "Nieuwe Begroting") -> QWidget:
         """Maak een nieuwe document tab met alle subtabs"""
@@ -165,32 +686,7 @@ class MainWindow(QMainWindow):
 
         # Subtabs voor alle onderdelen
         sub_tabs = QTabWidget()
-        sub_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background: white;
-            }
-            QTabBar::tab {
-                background: #f1f5f9;
-                border: 1px solid #cbd5e1;
-                border-bottom: none;
-                padding: 8px 20px;
-                margin-right: 2px;
-                font-weight: 500;
-                font-size: 10pt;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                border-top: 3px solid #0ea5e9;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #e2e8f0;
-            }
-        """)
-
-        # Tab 1: Projectgegevens
-        project_panel = ProjectPanel()
-        sub_tabs.addTab(project_panel, "Projectgegevens")
+        sub_tabs.setObjectName("docSubTabs")  # Gestyled via _SUB_TABS_QSS
 
         # Tab 2: Begroting (tabel)
         budget_tab = QWidget()
@@ -201,31 +697,24 @@ class MainWindow(QMainWindow):
         table_view = CostTableView()
         budget_tab_layout.addWidget(table_view)
 
-        sub_tabs.addTab(budget_tab, "Begroting")
-
-        # Tab 3: Opslagen
-        surcharges_panel = SurchargesPanel()
-        sub_tabs.addTab(surcharges_panel, "Opslagen")
-
-        # Tab 4: Rapport
-        report_panel = ReportPanel()
-        sub_tabs.addTab(report_panel, "Rapport")
-
-        # Tab 5: Offerte (inclusief preview)
-        quotation_panel = QuotationPanel()
-        sub_tabs.addTab(quotation_panel, "Offerte")
+        # Projectgegevens, Opslagen, Rapport en Offerte krijgen een lege
+        # plaatshouder; het echte paneel wordt pas bij het eerste bekijken gebouwd
+        for index in range(len(_LAZY_SUBTABS) + 1):
+            if index == 1:
+                sub_tabs.addTab(budget_tab, "Begroting")
+                continue
+            attr, label, _ = _LAZY_SUBTABS[index]
+            sub_tabs.addTab(QWidget(), label)
+            setattr(doc_widget, attr, _LazyPanel(partial(self._materialize_subtab, doc_widget, index)))
 
         # Start op de Begroting tab (index 1)
         sub_tabs.setCurrentIndex(1)
+        sub_tabs.currentChanged.connect(partial(self._on_subtab_changed, doc_widget))
 
         doc_layout.addWidget(sub_tabs)
 
         # Sla referenties op in het widget
         doc_widget.table_view = table_view
-        doc_widget.project_panel = project_panel
-        doc_widget.surcharges_panel = surcharges_panel
-        doc_widget.report_panel = report_panel
-        doc_widget.quotation_panel = quotation_panel
         doc_widget.sub_tabs = sub_tabs
         doc_widget.schedule = None
         doc_widget.file_path = None
@@ -236,6 +725,37 @@ class MainWindow(QMainWindow):
 
         return doc_widget
 
+    def _on_subtab_changed(self, doc_widget: QWidget, index: int):
+        """Bouw een subtab paneel zodra het voor het eerst bekeken wordt"""
+        if index in _LAZY_SUBTABS:
+            self._materialize_subtab(doc_widget, index)
+
+    def _materialize_subtab(self, doc_widget: QWidget, index: int) -> QWidget:
+        """Vervang de plaatshouder van een subtab door het echte paneel"""
+        attr, label, panel_cls = _LAZY_SUBTABS[index]
+        placeholder = getattr(doc_widget, attr)
+        if not isinstance(placeholder, _LazyPanel):
+            return placeholder  # Al gebouwd
+
+        panel = panel_cls()
+        sub_tabs = doc_widget.sub_tabs
+        current = sub_tabs.currentIndex()
+        blocked = sub_tabs.blockSignals(True)
+        try:
+            stub = sub_tabs.widget(index)
+            sub_tabs.removeTab(index)
+            sub_tabs.insertTab(index, panel, label)
+            sub_tabs.setCurrentIndex(current)
+        finally:
+            sub_tabs.blockSignals(blocked)
+        stub.deleteLater()
+
+        setattr(doc_widget, attr, panel)
+        if getattr(self, "_surcharges_panel", None) is placeholder:
+            self._surcharges_panel = panel
+        placeholder.replay(panel)
+        return panel
+
     def _close_document_tab(self, index: int):
         """Sluit een document tab"""
         if self._document_tabs.count() <= 1:
@@ -255,7 +775,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Cancel:
                 return
             elif reply == QMessageBox.Save:
-                self._save_file()
+                self._save_file_now()
 
         self._document_tabs.removeTab(index)
 
@@ -265,11 +785,30 @@ class MainWindow(QMainWindow):
             return
 
         doc_widget = self._document_tabs.widget(index)
+        if doc_widget is self._active_doc_widget:
+            return  # Zelfde document, bijv. na het verslepen van tabs
+
         if doc_widget and hasattr(doc_widget, 'schedule'):
+            self._active_doc_widget = doc_widget
             self._schedule = doc_widget.schedule
-            self._table_view = doc_widget.table_view
+            self._bind_table_view(doc_widget.table_view)
             self._surcharges_panel = doc_widget.surcharges_panel
-            self._update_title()
+            self._mark_dirty(_UI_TITLE)
+
+    def _bind_table_view(self, table_view: CostTableView):
+        """Verbind de selectie- en wijzigingssignalen met de tabel van het actieve document"""
+        old_view = self._connected_table_view
+        if old_view is table_view:
+            return
+        if old_view is not None:
+            old_view.itemSelected.disconnect(self._on_item_selected)
+            old_view.itemChanged.disconnect(self._on_item_changed)
+
+        self._table_view = table_view
+        self._connected_table_view = table_view
+        with QSignalBlocker(table_view):
+            table_view.itemSelected.connect(self._on_item_selected)
+            table_view.itemChanged.connect(self._on_item_changed)
 
     @property
     def _current_doc_widget(self):
@@ -279,31 +818,44 @@ class MainWindow(QMainWindow):
     # Clipboard operaties
     def _cut_item(self):
         """Knip het geselecteerde item"""
+        self._finish_deferred_loads()
         item = self._table_view.get_selected_item()
         if item:
-            self._clipboard_item = item
+            self._clipboard_blob = pickle.dumps(item.to_tuple(), protocol=5)
+            chapter = _root_of(item.parent) if item.parent else None
             # Verwijder item
             if item.parent:
-                item.parent.remove_child(item)
+                command = StructureCommand(item, item.parent, self._schedule,
+                                           item.parent.get_child_index(item), added=False,
+                                           cost_api=self._cost_api)
             elif self._schedule:
-                self._schedule.remove_item(item)
-            self._ifc_handler.mark_modified()
-            self._table_view.refresh()
-            self._update_title()
-            self._update_totals()
+                command = StructureCommand(item, None, self._schedule,
+                                           self._schedule.get_item_index(item), added=False,
+                                           cost_api=self._cost_api)
+            else:
+                return
+            command.redo()  # Haalt het item en zijn IFC kostenposten weg
+            self._push_commands([command])
+            self._mark_modified()
+            self._mark_dirty(_UI_REFRESH | _UI_TITLE)
+            if chapter is not None:
+                self._add_totals_delta(-item.subtotal, chapter)
+            else:
+                self._mark_dirty(_UI_TOTALS)  # Heel hoofdstuk weg: tabel opnieuw opbouwen
             self._statusbar.showMessage("Item geknipt")
 
     def _copy_item(self):
         """Kopieer het geselecteerde item"""
+        self._finish_deferred_loads()
         item = self._table_view.get_selected_item()
         if item:
-            # Maak een kopie van het item
-            self._clipboard_item = item.copy()
+            # Bewaar een geserialiseerde kopie van het item
+            self._clipboard_blob = pickle.dumps(item.to_tuple(), protocol=5)
             self._statusbar.showMessage("Item gekopieerd")
 
     def _paste_item(self):
         """Plak het gekopieerde item"""
-        if not self._clipboard_item or not self._schedule:
+        if not self._clipboard_blob or not self._schedule:
             return
 
         # Bepaal parent
@@ -319,23 +871,24 @@ class MainWindow(QMainWindow):
             return
 
         # Maak kopie en voeg toe
-        new_item = self._clipboard_item.copy()
-        new_item.identification = f"{len(parent.children) + 1:02d}"
+        new_item = CostItem.from_tuple(pickle.loads(self._clipboard_blob))
+        new_item.identification = _identification(len(parent.children) + 1)
         parent.add_child(new_item)
+        self._push_commands([StructureCommand(
+            new_item, parent, self._schedule, parent.get_child_index(new_item), added=True,
+            cost_api=self._cost_api
+        )])
 
-        # Maak IFC item
+        # Maak IFC items voor het geplakte item en al zijn kinderen in één keer
         if self._cost_api and parent.ifc_cost_item:
-            ifc_item = self._cost_api.add_cost_item(
-                cost_item=parent.ifc_cost_item,
-                name=new_item.name,
-                identification=new_item.identification
-            )
-            new_item.ifc_cost_item = ifc_item
-
-        self._ifc_handler.mark_modified()
-        self._table_view.refresh()
-        self._update_title()
-        self._update_totals()
+            items, specs = _paste_specs(new_item)
+            ifc_items = self._cost_api.add_cost_items_bulk(parent.ifc_cost_item, specs)
+            for item, ifc_item in zip(items, ifc_items):
+                item.ifc_cost_item = ifc_item
+
+        self._mark_modified()
+        self._mark_dirty(_UI_REFRESH | _UI_TITLE)
+        self._add_totals_delta(new_item.subtotal, _root_of(parent))
         self._statusbar.showMessage("Item geplakt")
 
     # Tekst opmaak operaties
@@ -368,21 +921,19 @@ class MainWindow(QMainWindow):
 
         # Verwijder bestaande kleur span en voeg nieuwe toe
         html = item.html_name or item.name
-        import re
         # Verwijder bestaande color span
-        html = re.sub(r'<span style="color:[^"]*">(.*?)</span>', r'\1', html)
+        if "<span" in html:
+            html = _COLOR_SPAN_RE.sub(r'\1', html)
         # Voeg nieuwe kleur toe
         color_hex = color.name()
         item.html_name = f'<span style="color:{color_hex}">{html}</span>'
 
         self._on_item_changed(item)
-        self._table_view.refresh()
+        self._mark_dirty(_UI_REFRESH)
         self._statusbar.showMessage(f"Tekstkleur ingesteld: {color_hex}")
 
     def _apply_html_format(self, item: CostItem, tag: str, apply: bool):
         """Pas HTML opmaak toe op een item"""
-        import re
-
         # Gebruik html_name als die bestaat, anders de naam
         html = item.html_name or item.name
 
@@ -390,43 +941,39 @@ class MainWindow(QMainWindow):
             # Voeg tag toe als die nog niet bestaat
             if f"<{tag}>" not in html:
                 html = f"<{tag}>{html}</{tag}>"
-        else:
+        elif f"<{tag}>" in html:
             # Verwijder de tag
-            html = re.sub(f'<{tag}>(.*?)</{tag}>', r'\1', html)
+            html = _TAG_RES[tag].sub(r'\1', html)
 
         item.html_name = html
         self._on_item_changed(item)
-        self._table_view.refresh()
+        self._mark_dirty(_UI_REFRESH)
 
     # Undo/Redo operaties
-    def _save_undo_state(self, description: str = ""):
-        """Sla huidige staat op voor undo"""
-        if not self._schedule:
-            return
-
-        import copy
-        # Maak een diepe kopie van de schedule data
-        state = {
-            'description': description,
-            'schedule_data': self._schedule.to_dict() if hasattr(self._schedule, 'to_dict') else None
-        }
-
-        # Simpele state: bewaar item data
-        if state['schedule_data'] is None:
-            state['items_backup'] = []
-            for item in self._schedule.get_all_items():
-                state['items_backup'].append({
-                    'id': id(item),
-                    'name': item.name,
-                    'html_name': item.html_name,
-                    'identification': item.identification,
-                    'quantity': item.quantity,
-                    'unit_price': item.unit_price,
-                    'sfb_code': item.sfb_code,
-                    'is_text_only': item.is_text_only,
-                })
-
-        self._undo_stack.append(state)
+    def _snapshot_item(self, item: Optional[CostItem]):
+        """Onthoud de bijgehouden velden van een item als basis voor de volgende wijziging"""
+        self._item_snapshot = (item, _undo_fields(item)) if item else None
+
+    def _record_item_changes(self, item: CostItem) -> Optional[set]:
+        """Leg de gewijzigde velden van een item vast als één undo stap en geef ze terug"""
+        snapshot = self._item_snapshot
+        new_values = _undo_fields(item)
+        self._item_snapshot = (item, new_values)
+        if snapshot is None or snapshot[0] is not item:
+            return None  # Geen basis bekend; alleen de nieuwe waarden onthouden
+
+        commands = [
+            EditCommand(item, field, old, new)
+            for field, old, new in zip(_UNDO_FIELDS, snapshot[1], new_values)
+            if old != new
+        ]
+        if commands:
+            self._push_commands(commands)
+        return {command.field for command in commands}
+
+    def _push_commands(self, commands: list):
+        """Zet de commando's van één actie op de undo stack"""
+        self._undo_stack.append(commands)
 
         # Beperk stack grootte
         if len(self._undo_stack) > self._max_undo_levels:
@@ -441,43 +988,11 @@ class MainWindow(QMainWindow):
             self._statusbar.showMessage("Niets om ongedaan te maken")
             return
 
-        # Sla huidige staat op voor redo
-        current_state = {
-            'description': 'redo',
-            'items_backup': []
-        }
-        if self._schedule:
-            for item in self._schedule.get_all_items():
-                current_state['items_backup'].append({
-                    'id': id(item),
-                    'name': item.name,
-                    'html_name': item.html_name,
-                    'identification': item.identification,
-                    'quantity': item.quantity,
-                    'unit_price': item.unit_price,
-                    'sfb_code': item.sfb_code,
-                    'is_text_only': item.is_text_only,
-                })
-        self._redo_stack.append(current_state)
-
-        # Herstel vorige staat
-        state = self._undo_stack.pop()
-
-        if 'items_backup' in state and self._schedule:
-            items_by_id = {id(item): item for item in self._schedule.get_all_items()}
-            for backup in state['items_backup']:
-                if backup['id'] in items_by_id:
-                    item = items_by_id[backup['id']]
-                    item.name = backup['name']
-                    item.html_name = backup.get('html_name', '')
-                    item.identification = backup['identification']
-                    item.quantity = backup['quantity']
-                    item.unit_price = backup['unit_price']
-                    item.sfb_code = backup['sfb_code']
-                    item.is_text_only = backup.get('is_text_only', False)
+        commands = self._undo_stack.pop()
+        self._apply_commands(command.undo for command in reversed(commands))
+        self._redo_stack.append(commands)
 
-        self._table_view.refresh()
-        self._update_totals()
+        self._after_undo_redo()
         self._statusbar.showMessage("Ongedaan gemaakt")
 
     def _redo(self):
@@ -486,72 +1001,73 @@ class MainWindow(QMainWindow):
             self._statusbar.showMessage("Niets om opnieuw te doen")
             return
 
-        # Sla huidige staat op voor undo
-        current_state = {
-            'description': 'undo',
-            'items_backup': []
-        }
-        if self._schedule:
-            for item in self._schedule.get_all_items():
-                current_state['items_backup'].append({
-                    'id': id(item),
-                    'name': item.name,
-                    'html_name': item.html_name,
-                    'identification': item.identification,
-                    'quantity': item.quantity,
-                    'unit_price': item.unit_price,
-                    'sfb_code': item.sfb_code,
-                    'is_text_only': item.is_text_only,
-                })
-        self._undo_stack.append(current_state)
-
-        # Herstel redo staat
-        state = self._redo_stack.pop()
-
-        if 'items_backup' in state and self._schedule:
-            items_by_id = {id(item): item for item in self._schedule.get_all_items()}
-            for backup in state['items_backup']:
-                if backup['id'] in items_by_id:
-                    item = items_by_id[backup['id']]
-                    item.name = backup['name']
-                    item.html_name = backup.get('html_name', '')
-                    item.identification = backup['identification']
-                    item.quantity = backup['quantity']
-                    item.unit_price = backup['unit_price']
-                    item.sfb_code = backup['sfb_code']
-                    item.is_text_only = backup.get('is_text_only', False)
+        commands = self._redo_stack.pop()
+        self._apply_commands(command.redo for command in commands)
+        self._undo_stack.append(commands)
 
-        self._table_view.refresh()
-        self._update_totals()
+        self._after_undo_redo()
         self._statusbar.showMessage("Opnieuw uitgevoerd")
 
+    def _apply_commands(self, steps):
+        """Voer undo/redo stappen uit zonder tussentijdse signalen of repaints"""
+        self._table_view.setUpdatesEnabled(False)
+        try:
+            # De dock widget is het eigenschappen paneel of nog de plaatshouder
+            with QSignalBlocker(self._table_view), QSignalBlocker(self._properties_dock.widget()):
+                for step in steps:
+                    step()
+        finally:
+            self._table_view.setUpdatesEnabled(True)
+
+    def _after_undo_redo(self):
+        """Werk de UI bij na undo of redo"""
+        if self._schedule:
+            self._schedule.mark_modified()
+        if self._item_snapshot:
+            self._snapshot_item(self._item_snapshot[0])
+        self._mark_dirty(_UI_REFRESH | _UI_TOTALS)
+
+    def _build_shared_actions(self) -> dict:
+        """Maak de acties die het menu en de ribbon delen (één sneltoets per actie)"""
+        specs = (
+            ("new", "&Nieuw", QKeySequence.New, self._new_file),
+            ("open", "&Openen...", QKeySequence.Open, self._open_file),
+            ("save", "Op&slaan", QKeySequence.Save, self._save_file),
+            ("save_as", "Opslaan &als...", QKeySequence.SaveAs, self._save_file_as),
+            ("undo", "&Ongedaan maken", QKeySequence.Undo, self._undo),
+            ("redo", "O&pnieuw", QKeySequence.Redo, self._redo),
+            ("cut", "K&nippen", QKeySequence.Cut, self._cut_item),
+            ("copy", "&Kopiëren", QKeySequence.Copy, self._copy_item),
+            ("paste", "&Plakken", QKeySequence.Paste, self._paste_item),
+        )
+        actions = {}
+        for name, text, shortcut, slot in specs:
+            action = QAction(text, self)
+            action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            actions[name] = action
+        return actions
+
     def _setup_menu(self):
         """Stel het menu in (minimaal, ribbon heeft meeste acties)"""
         menubar = self.menuBar()
+        actions = self._actions
 
         # Bestand menu
         file_menu = menubar.addMenu("&Bestand")
 
-        self._new_action = QAction("&Nieuw", self)
-        self._new_action.setShortcut(QKeySequence.New)
-        self._new_action.triggered.connect(self._new_file)
+        self._new_action = actions["new"]
         file_menu.addAction(self._new_action)
 
-        self._open_action = QAction("&Openen...", self)
-        self._open_action.setShortcut(QKeySequence.Open)
-        self._open_action.triggered.connect(self._open_file)
+        self._open_action = actions["open"]
         file_menu.addAction(self._open_action)
 
         file_menu.addSeparator()
 
-        self._save_action = QAction("Op&slaan", self)
-        self._save_action.setShortcut(QKeySequence.Save)
-        self._save_action.triggered.connect(self._save_file)
+        self._save_action = actions["save"]
         file_menu.addAction(self._save_action)
 
-        self._save_as_action = QAction("Opslaan &als...", self)
-        self._save_as_action.setShortcut(QKeySequence.SaveAs)
-        self._save_as_action.triggered.connect(self._save_file_as)
+        self._save_as_action = actions["save_as"]
         file_menu.addAction(self._save_as_action)
 
         file_menu.addSeparator()
@@ -564,31 +1080,21 @@ class MainWindow(QMainWindow):
         # Bewerken menu
         edit_menu = menubar.addMenu("&Bewerken")
 
-        self._undo_action = QAction("&Ongedaan maken", self)
-        self._undo_action.setShortcut(QKeySequence.Undo)
-        self._undo_action.triggered.connect(self._undo)
+        self._undo_action = actions["undo"]
         edit_menu.addAction(self._undo_action)
 
-        self._redo_action = QAction("O&pnieuw", self)
-        self._redo_action.setShortcut(QKeySequence.Redo)
-        self._redo_action.triggered.connect(self._redo)
+        self._redo_action = actions["redo"]
         edit_menu.addAction(self._redo_action)
 
         edit_menu.addSeparator()
 
-        self._cut_action = QAction("K&nippen", self)
-        self._cut_action.setShortcut(QKeySequence.Cut)
-        self._cut_action.triggered.connect(self._cut_item)
+        self._cut_action = actions["cut"]
         edit_menu.addAction(self._cut_action)
 
-        self._copy_action = QAction("&Kopiëren", self)
-        self._copy_action.setShortcut(QKeySequence.Copy)
-        self._copy_action.triggered.connect(self._copy_item)
+        self._copy_action = actions["copy"]
         edit_menu.addAction(self._copy_action)
 
-        self._paste_action = QAction("&Plakken", self)
-        self._paste_action.setShortcut(QKeySequence.Paste)
-        self._paste_action.triggered.connect(self._paste_item)
+        self._paste_action = actions["paste"]
         edit_menu.addAction(self._paste_action)
 
         # Help menu
@@ -606,19 +1112,13 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self):
         """Verbind signalen"""
-        # Tabel signalen voor huidige tab
-        doc_widget = self._current_doc_widget
-        if doc_widget:
-            self._table_view = doc_widget.table_view
-            self._surcharges_panel = doc_widget.surcharges_panel
-            self._table_view.itemSelected.connect(self._on_item_selected)
-            self._table_view.itemChanged.connect(self._on_item_changed)
+        # Tabel signalen voor huidige tab; meestal al verbonden bij het aanmaken van de tab
+        self._on_document_tab_changed(self._document_tabs.currentIndex())
+
+        # Ribbon knoppen voor bestand, undo/redo en klembord voeren de menu acties uit
+        self._ribbon.set_shared_actions(self._actions)
 
         # Ribbon signalen
-        self._ribbon.newFile.connect(self._new_file)
-        self._ribbon.openFile.connect(self._open_file)
-        self._ribbon.saveFile.connect(self._save_file)
-        self._ribbon.saveFileAs.connect(self._save_file_as)
         self._ribbon.printPreview.connect(self._print_preview)
         self._ribbon.printFile.connect(self._print)
         self._ribbon.exportPdf.connect(self._export_pdf)
@@ -631,15 +1131,6 @@ class MainWindow(QMainWindow):
         self._ribbon.addCostItem.connect(self._add_cost_item)
         self._ribbon.addTextRow.connect(self._add_text_row)
 
-        # Undo/Redo signalen
-        self._ribbon.undoAction.connect(self._undo)
-        self._ribbon.redoAction.connect(self._redo)
-
-        # Clipboard signalen
-        self._ribbon.cutItem.connect(self._cut_item)
-        self._ribbon.copyItem.connect(self._copy_item)
-        self._ribbon.pasteItem.connect(self._paste_item)
-
         # Tekst opmaak signalen
         self._ribbon.formatBold.connect(self._toggle_bold)
         self._ribbon.formatItalic.connect(self._toggle_italic)
@@ -648,6 +1139,7 @@ class MainWindow(QMainWindow):
 
         # Document viewer signalen
         self._ribbon.openPdf.connect(self._doc_viewer.open_pdf)
+        self._ribbon.openIfc.connect(self._warmup_ifc_viewer)  # Vóór de bestandsdialoog
         self._ribbon.openIfc.connect(self._doc_viewer.open_ifc)
         self._ribbon.openDxf.connect(self._doc_viewer.open_dxf)
 
@@ -665,9 +1157,6 @@ class MainWindow(QMainWindow):
         # Dark mode signaal
         self._ribbon.toggleDarkMode.connect(self._toggle_dark_mode)
 
-        # Properties panel signaal
-        self._properties_panel.itemChanged.connect(self._on_item_changed)
-
         # Zet documenten toggle standaard uit
         self._ribbon._toggle_docs_btn.setChecked(False)
 
@@ -687,13 +1176,41 @@ class MainWindow(QMainWindow):
             title = f"* {title}"
             tab_title = f"* {tab_title}"
 
-        self.setWindowTitle(title)
+        # Alleen bij een echte wijziging; een titelwijziging kost een window manager roundtrip
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
 
-        # Update huidige tab titel
+        # Update huidige tab titel; tabs kunnen verschoven zijn, dus vergelijk met de tab zelf
         current_idx = self._document_tabs.currentIndex()
-        if current_idx >= 0:
+        if current_idx >= 0 and self._document_tabs.tabText(current_idx) != tab_title:
             self._document_tabs.setTabText(current_idx, tab_title)
 
+    def _refresh_table(self):
+        """Vernieuw de tabel van het actieve document"""
+        self._table_view.refresh()
+
+    def _mark_dirty(self, bits: int):
+        """Plan UI updates in zodra de huidige event afhandeling klaar is"""
+        self._ui_dirty |= bits
+        self._ui_update_timer.start()
+
+    def _flush_pending_ui(self):
+        """Voer de uitgestelde UI updates één keer per soort uit"""
+        dirty, self._ui_dirty = self._ui_dirty, 0
+        if dirty & _UI_REFRESH:
+            self._refresh_table()
+        if dirty & _UI_TOTALS:
+            self._update_totals()
+        if dirty & _UI_TITLE:
+            self._update_title()
+
+    def _add_totals_delta(self, item_total: float, chapter: CostItem):
+        """Werk de totalen incrementeel bij na het toevoegen of verwijderen van een item"""
+        if isinstance(self._surcharges_panel, _LazyPanel):
+            return  # Het paneel rekent bij het bouwen de hele begroting door
+        self._surcharges_panel.add_delta(item_total, chapter)
+
     def _update_totals(self):
         """Update het opslagen paneel"""
         self._surcharges_panel.set_schedule(self._schedule)
@@ -704,7 +1221,7 @@ class MainWindow(QMainWindow):
 
     def _new_file(self):
         """Maak een nieuw bestand"""
-        if not self._check_save():
+        if self._file_job_active or not self._check_save():
             return
 
         # Maak nieuw IFC bestand
@@ -730,13 +1247,12 @@ class MainWindow(QMainWindow):
             self._current_doc_widget.report_panel.set_schedule(self._schedule)
             self._current_doc_widget.quotation_panel.set_schedule(self._schedule)
 
-        self._update_title()
-        self._update_totals()
+        self._mark_dirty(_UI_TOTALS | _UI_TITLE)
         self._statusbar.showMessage("Nieuwe begroting aangemaakt")
 
     def _open_file(self):
         """Open een bestaand bestand via dialoog"""
-        if not self._check_save():
+        if self._file_job_active or not self._check_save():
             return
 
         file_path, _ = QFileDialog.getOpenFileName(
@@ -751,12 +1267,22 @@ class MainWindow(QMainWindow):
 
     def _open_file_path(self, file_path: str):
         """Open een bestand op een specifiek pad"""
+        self._statusbar.showMessage(f"Openen: {file_path}...")
+        # De worker leest in een eigen ifcopenshell.file; de handler blijft van de GUI thread
+        self._start_file_job(
+            partial(IFCHandler.read_file, file_path),
+            partial(self._on_file_opened, file_path),
+            "Fout bij openen", "Kan bestand niet openen"
+        )
+        self._show_job_progress("Openen", f"Openen: {Path(file_path).name}...")
+
+    def _on_file_opened(self, file_path: str, ifc_file):
+        """Werk de begroting bij nadat het bestand in de achtergrond is ingelezen"""
         try:
-            self._ifc_handler.open_file(file_path)
-            self._cost_api = CostAPI(self._ifc_handler.ifc_file)
+            self._ifc_handler.adopt_file(ifc_file, file_path)
+            self._cost_api = CostAPI(ifc_file)
             self._load_schedule_from_ifc()
-            self._update_title()
-            self._update_totals()
+            self._mark_dirty(_UI_TOTALS | _UI_TITLE)
             self._statusbar.showMessage(f"Geopend: {file_path}")
         except Exception as e:
             QMessageBox.critical(
@@ -765,6 +1291,63 @@ class MainWindow(QMainWindow):
                 f"Kan bestand niet openen:\n{str(e)}"
             )
 
+    def _start_file_job(self, job: Callable, on_finished: Callable,
+                        error_title: str, error_message: str):
+        """Start bestands I/O in de thread pool; bestandsacties zijn zolang uitgeschakeld"""
+        if self._file_job_active:
+            return
+
+        self._set_file_job_active(True)
+        signals = _FileJobSignals(self)
+        signals.finished.connect(partial(self._on_file_job_finished, signals, on_finished))
+        signals.failed.connect(
+            partial(self._on_file_job_failed, signals, error_title, error_message)
+        )
+        QThreadPool.globalInstance().start(_FileJobTask(job, signals))
+
+    def _show_job_progress(self, title: str, text: str):
+        """
+        Toon een modale voortgangsdialoog voor de lopende bestands taak.
+
+        Zolang de dialoog open is kan de begroting (en daarmee het
+        ifcopenshell bestand dat de worker gebruikt) niet gewijzigd worden.
+        """
+        progress = QProgressDialog(text, "", 0, 0, self)
+        progress.setCancelButton(None)  # Een half gelezen of geschreven bestand heeft geen zin
+        progress.setWindowTitle(title)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.show()
+        self._job_progress = progress
+
+    def _on_file_job_finished(self, signals: _FileJobSignals, on_finished: Callable, result):
+        """Afhandeling van een geslaagde bestands taak"""
+        signals.deleteLater()
+        self._set_file_job_active(False)
+        on_finished(result)
+
+    def _on_file_job_failed(self, signals: _FileJobSignals, error_title: str,
+                            error_message: str, error: str):
+        """Afhandeling van een mislukte bestands taak"""
+        signals.deleteLater()
+        self._set_file_job_active(False)
+        self._statusbar.showMessage("Gereed")
+        QMessageBox.critical(self, error_title, f"{error_message}:\n{error}")
+
+    def _set_file_job_active(self, active: bool):
+        """Schakel de bestandsacties uit zolang er een bestands taak loopt"""
+        self._file_job_active = active
+        for action in (self._new_action, self._open_action,
+                       self._save_action, self._save_as_action):
+            action.setEnabled(not active)
+        if active:
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+        else:
+            QApplication.restoreOverrideCursor()
+            if self._job_progress is not None:
+                self._job_progress.close()
+                self._job_progress.deleteLater()
+                self._job_progress = None
+
     def _save_file(self):
         """Sla het bestand op"""
         if not self._ifc_handler.file_path:
@@ -774,32 +1357,89 @@ class MainWindow(QMainWindow):
 
     def _save_file_as(self):
         """Sla het bestand op onder een nieuwe naam"""
+        file_path = self._ask_save_path()
+        if file_path:
+            self._do_save(file_path)
+
+    def _ask_save_path(self) -> str:
+        """Vraag een pad om het bestand op te slaan"""
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Begroting Opslaan",
             "",
             "IFC Bestanden (*.ifc)"
         )
-
-        if file_path:
-            self._do_save(file_path)
+        return file_path
 
     def _do_save(self, file_path: Optional[str] = None):
-        """Voer het opslaan uit"""
+        """Voer het opslaan uit; het schrijven gebeurt in de achtergrond"""
+        if self._file_job_active:
+            return
+
+        self._finish_deferred_loads()  # Het bestand moet de hele boom bevatten
         try:
             # Sync model naar IFC
             self._sync_schedule_to_ifc()
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Fout bij opslaan",
+                f"Kan bestand niet opslaan:\n{str(e)}"
+            )
+            return
 
-            # Sla op
+        try:
+            save_path = self._ifc_handler.resolve_save_path(file_path)
+        except ValueError as e:
+            QMessageBox.critical(self, "Fout bij opslaan", f"Kan bestand niet opslaan:\n{str(e)}")
+            return
+
+        self._statusbar.showMessage("Opslaan...")
+        # Wijzigingen na het starten horen niet bij het geschreven bestand
+        schedule = self._schedule
+        version = schedule._version if schedule is not None else None
+        self._start_file_job(
+            partial(IFCHandler.write_file, self._ifc_handler.ifc_file, save_path),
+            partial(self._on_file_written, schedule, version),
+            "Fout bij opslaan", "Kan bestand niet opslaan"
+        )
+        self._show_job_progress("Opslaan", f"Opslaan: {save_path.name}...")
+
+    def _on_file_written(self, schedule: Optional[CostSchedule], version: Optional[int],
+                         saved_path: Path):
+        """Afhandeling van een in de achtergrond geschreven bestand"""
+        self._ifc_handler.mark_saved(saved_path)
+        if self._schedule is not schedule or (schedule is not None and schedule._version != version):
+            self._ifc_handler.mark_modified()
+        self._on_file_saved(saved_path)
+
+    def _save_file_now(self) -> bool:
+        """Sla direct (synchroon) op, voor als het resultaat meteen nodig is zoals bij sluiten"""
+        file_path = None
+        if not self._ifc_handler.file_path:
+            file_path = self._ask_save_path()
+            if not file_path:
+                return False
+
+        self._finish_deferred_loads()
+        try:
+            self._sync_schedule_to_ifc()
             saved_path = self._ifc_handler.save_file(file_path)
-            self._update_title()
-            self._statusbar.showMessage(f"Opgeslagen: {saved_path}")
         except Exception as e:
             QMessageBox.critical(
                 self,
                 "Fout bij opslaan",
                 f"Kan bestand niet opslaan:\n{str(e)}"
             )
+            return False
+
+        self._on_file_saved(saved_path)
+        return True
+
+    def _on_file_saved(self, saved_path):
+        """Werk de UI bij nadat het bestand is opgeslagen"""
+        self._mark_dirty(_UI_TITLE)
+        self._statusbar.showMessage(f"Opgeslagen: {saved_path}")
 
     def _check_save(self) -> bool:
         """Controleer of wijzigingen moeten worden opgeslagen"""
@@ -812,29 +1452,29 @@ class MainWindow(QMainWindow):
                 QMessageBox.Save
             )
             if reply == QMessageBox.Save:
-                self._save_file()
-                return not self._ifc_handler.is_modified
+                return self._save_file_now()
             elif reply == QMessageBox.Cancel:
                 return False
         return True
 
     def _load_schedule_from_ifc(self):
         """Laad de begroting vanuit het IFC bestand"""
+        self._service_cache.clear()
         schedules = self._ifc_handler.get_cost_schedules()
-        print(f"DEBUG: Gevonden schedules: {len(schedules)}")
+        logger.debug("Gevonden schedules: %d", len(schedules))
         if schedules:
             ifc_schedule = schedules[0]
             self._schedule = CostSchedule.from_ifc(ifc_schedule)
-            print(f"DEBUG: Schedule naam: {self._schedule.name}")
+            logger.debug("Schedule naam: %s", self._schedule.name)
 
             # Laad items recursief
             root_items = self._cost_api.get_root_cost_items(ifc_schedule)
-            print(f"DEBUG: Root items: {len(root_items)}")
-            for ifc_item in root_items:
-                item = self._load_cost_item_recursive(ifc_item)
-                self._schedule.add_item(item)
-            print(f"DEBUG: Items na laden: {len(self._schedule.items)}")
-            print(f"DEBUG: Subtotaal: {self._schedule.subtotal}")
+            logger.debug("Root items: %d", len(root_items))
+            self._load_cost_items(root_items)
+            if logger.isEnabledFor(logging.DEBUG):
+                # subtotal doorloopt de hele boom; alleen berekenen als er gelogd wordt
+                logger.debug("Items na laden: %d", len(self._schedule.items))
+                logger.debug("Subtotaal: %s", self._schedule.subtotal)
         else:
             # Maak nieuwe schedule als er geen bestaat
             self._schedule = CostSchedule(name="Nieuwe Begroting")
@@ -856,37 +1496,87 @@ class MainWindow(QMainWindow):
             if project_data:
                 self._current_doc_widget.project_panel.set_project_data(project_data)
 
-        self._update_totals()  # Update totalen balk
+        self._mark_dirty(_UI_TOTALS)  # Update totalen balk
+
+    def _load_cost_items(self, root_ifc_items: list):
+        """
+        Laad de bovenste niveaus direct (breedte-eerst, zonder recursie); diepere
+        niveaus worden daarna in porties vanuit de event loop geladen.
+        """
+        queue = deque((ifc_item, None, 0) for ifc_item in root_ifc_items)
+        deferred = deque()
+        while queue:
+            ifc_item, parent, depth = queue.popleft()
+            item = self._attach_loaded_item(ifc_item, parent)
+            target = queue if depth + 1 < _EAGER_LOAD_DEPTH else deferred
+            target.extend(
+                (ifc_child, item, depth + 1)
+                for ifc_child in self._cost_api.get_nested_cost_items(ifc_item)
+            )
+
+        self._deferred_loads = deferred
+        if deferred:
+            QTimer.singleShot(0, partial(self._load_deferred_items, self._schedule))
+
+    def _load_deferred_items(self, schedule: CostSchedule,
+                             budget: Optional[float] = _LOAD_SLICE_SECONDS):
+        """Laad uitgestelde items tot het tijdsbudget op is (None: alles)"""
+        if schedule is not self._schedule:
+            return  # Intussen een ander bestand geopend
+
+        queue = self._deferred_loads
+        if not queue:
+            return
+        deadline = None if budget is None else time.perf_counter() + budget
+        while queue and (deadline is None or time.perf_counter() < deadline):
+            ifc_item, parent, depth = queue.popleft()
+            item = self._attach_loaded_item(ifc_item, parent)
+            queue.extend(
+                (ifc_child, item, depth + 1)
+                for ifc_child in self._cost_api.get_nested_cost_items(ifc_item)
+            )
+
+        if queue:
+            QTimer.singleShot(0, partial(self._load_deferred_items, schedule))
+            return
 
-    def _load_cost_item_recursive(
-        self,
-        ifc_item,
-        parent: Optional[CostItem] = None
-    ) -> CostItem:
-        """Laad een cost item recursief"""
+        # Alles geladen: tabel en totalen één keer bijwerken
+        self._mark_dirty(_UI_REFRESH | _UI_TOTALS)
+
+    def _finish_deferred_loads(self):
+        """Laad direct alle nog uitgestelde items, voor acties die de hele boom nodig hebben"""
+        self._load_deferred_items(self._schedule, budget=None)
+
+    def _attach_loaded_item(self, ifc_item, parent: Optional[CostItem]) -> CostItem:
+        """Laad één cost item en hang het aan zijn parent of aan de begroting"""
+        item = self._load_cost_item(ifc_item, parent)
+        if parent is None:
+            self._schedule.add_item(item)
+        else:
+            parent.add_child(item)
+        return item
+
+    def _load_cost_item(self, ifc_item, parent: Optional[CostItem] = None) -> CostItem:
+        """Laad één cost item inclusief SFB-code en opmaak uit de IFC properties"""
         item = CostItem.from_ifc(ifc_item, parent)
 
-        # Laad SFB-code uit IFC properties
-        sfb_code = self._cost_api.get_sfb_code(ifc_item)
+        # Eén doorloop over de OpenCalc psets in plaats van één zoektocht per property
+        psets = self._cost_api.get_opencalc_props(ifc_item)
+        classification = psets.get("Pset_CostClassification", {})
+        formatting = psets.get("Pset_CostFormatting", {})
+
+        sfb_code = classification.get("SFB_Code")
         if sfb_code:
-            item.sfb_code = sfb_code
+            item.sfb_code = str(sfb_code)
 
-        # Laad HTML opmaak uit IFC properties
-        html_name = self._cost_api.get_html_name(ifc_item)
+        html_name = formatting.get("HtmlName")
         if html_name:
-            item.html_name = html_name
+            item.html_name = str(html_name)
 
-        # Laad is_text_only markering uit IFC properties
-        is_text_only = self._cost_api.get_is_text_only(ifc_item)
-        if is_text_only:
+        if str(formatting.get("IsTextOnly", "")).lower() == "true":
             item.is_text_only = True
 
-        # Laad kinderen
-        nested = self._cost_api.get_nested_cost_items(ifc_item)
-        for ifc_child in nested:
-            child = self._load_cost_item_recursive(ifc_child, item)
-            item.add_child(child)
-
+        item.clear_dirty()  # Alles komt uit het IFC bestand
         return item
 
     def _sync_schedule_to_ifc(self):
@@ -901,9 +1591,8 @@ class MainWindow(QMainWindow):
                 {"Name": self._schedule.name}
             )
 
-        # Sync alle items recursief (inclusief SFB codes)
-        for item in self._schedule.get_all_items():
-            self._sync_item_to_ifc(item)
+        # Sync alleen gewijzigde items (inclusief SFB codes) in één bulk bewerking
+        self._sync_items_to_ifc(self._schedule.dirty_items())
 
         # Sla projectgegevens op in IFC
         if self._current_doc_widget and hasattr(self._current_doc_widget, 'project_panel'):
@@ -912,30 +1601,20 @@ class MainWindow(QMainWindow):
 
     def _sync_item_to_ifc(self, item: CostItem):
         """Sync een CostItem naar IFC"""
-        if not item.ifc_cost_item or not self._cost_api:
-            return
+        self._sync_items_to_ifc((item,))
 
-        # Update item attributen
-        self._cost_api.edit_cost_item(
-            item.ifc_cost_item,
-            {
-                "Name": item.name,
-                "Identification": item.identification,
-                "Description": item.description
-            }
+    def _sync_items_to_ifc(self, items):
+        """Sync de gewijzigde velden van een reeks items naar IFC in één bulk bewerking"""
+        if not self._cost_api:
+            return
+        items = [item for item in items if item.ifc_cost_item and item.dirty_fields]
+        if not items:
+            return
+        self._cost_api.edit_cost_items_bulk(
+            {item.ifc_cost_item: _ifc_item_edit(item) for item in items}
         )
-
-        # Sla SFB-code op in IFC properties
-        if item.sfb_code:
-            self._cost_api.set_sfb_code(item.ifc_cost_item, item.sfb_code)
-
-        # Sla HTML opmaak op in IFC properties
-        if item.html_name:
-            self._cost_api.set_html_name(item.ifc_cost_item, item.html_name)
-
-        # Sla is_text_only op in IFC properties
-        if item.is_text_only:
-            self._cost_api.set_is_text_only(item.ifc_cost_item, True)
+        for item in items:
+            item.clear_dirty()
 
     # =========================================================================
     # ITEM OPERATIES
@@ -956,23 +1635,32 @@ class MainWindow(QMainWindow):
             while root_item.parent:
                 root_item = root_item.parent
 
-            # Vind de index van dit hoofdstuk
-            if root_item in self._schedule.items:
-                insert_index = self._schedule.items.index(root_item) + 1
+            # Vind de index van dit hoofdstuk (gecached per structuurversie)
+            root_index = self._schedule.get_item_index(root_item)
+            if root_index >= 0:
+                insert_index = root_index + 1
 
         # Maak nieuw hoofdstuk
         chapter = CostItem(
             name="Nieuw Hoofdstuk",
-            identification=f"{insert_index + 1:02d}"
+            identification=_identification(insert_index + 1)
         )
-        chapter.schedule = self._schedule
 
-        # Voeg in op de juiste positie
-        self._schedule.items.insert(insert_index, chapter)
+        # Voeg in op de juiste positie; alleen de hoofdstukken erna schuiven op
+        shifted = self._schedule.items[insert_index:]
+        before = _pack_fields(shifted)
+        self._schedule.insert_item(insert_index, chapter)
 
-        # Hernummer alle hoofdstukken
-        for i, item in enumerate(self._schedule.items):
-            item.identification = f"{i + 1:02d}"
+        # Hernummer de opgeschoven hoofdstukken en schrijf ze in één keer naar IFC
+        for i, item in enumerate(shifted, start=insert_index + 2):
+            item.identification = _identification(i)
+        self._sync_items_to_ifc(shifted)
+
+        self._push_commands([
+            StructureCommand(chapter, None, self._schedule, insert_index, added=True,
+                             cost_api=self._cost_api),
+            SnapshotCommand(shifted, before, _pack_fields(shifted)),
+        ])
 
         # Maak IFC item
         if self._cost_api and self._schedule.ifc_cost_schedule:
@@ -983,11 +1671,10 @@ class MainWindow(QMainWindow):
             )
             chapter.ifc_cost_item = ifc_item
 
-        self._ifc_handler.mark_modified()
-        self._table_view.refresh()
+        self._mark_modified()
+        self._table_view.refresh()  # Direct: de selectie heeft de nieuwe rijen nodig
         self._table_view.select_item(chapter)  # Selecteer het nieuwe hoofdstuk
-        self._update_title()
-        self._update_totals()
+        self._mark_dirty(_UI_TOTALS | _UI_TITLE)
         self._statusbar.showMessage("Hoofdstuk toegevoegd")
 
     def _add_cost_item(self):
@@ -1008,7 +1695,7 @@ class MainWindow(QMainWindow):
 
         item = CostItem(
             name="Nieuwe Post",
-            identification=f"{len(parent.children) + 1:02d}"
+            identification=_identification(len(parent.children) + 1)
         )
         parent.add_child(item)
 
@@ -1021,10 +1708,8 @@ class MainWindow(QMainWindow):
             )
             item.ifc_cost_item = ifc_item
 
-        self._ifc_handler.mark_modified()
-        self._table_view.refresh()
-        self._update_title()
-        self._update_totals()
+        self._mark_modified()
+        self._mark_dirty(_UI_REFRESH | _UI_TOTALS | _UI_TITLE)
         self._statusbar.showMessage("Kostenpost toegevoegd")
 
     def _add_text_row(self):
@@ -1061,53 +1746,55 @@ class MainWindow(QMainWindow):
             # Sla is_text_only op in IFC
             self._cost_api.set_is_text_only(ifc_item, True)
 
-        self._ifc_handler.mark_modified()
-        self._table_view.refresh()
-        self._update_title()
-        self._update_totals()
+        self._mark_modified()
+        self._mark_dirty(_UI_REFRESH | _UI_TOTALS | _UI_TITLE)
         self._statusbar.showMessage("Tekstregel toegevoegd")
 
     def _on_item_selected(self, item: Optional[CostItem]):
         """Afhandeling van item selectie"""
+        # Basis voor undo van wijzigingen aan dit item
+        self._snapshot_item(item)
+
         # Update properties panel
-        self._properties_panel.set_item(item)
+        if self._properties_panel is not None:
+            self._properties_panel.set_item(item)
         self.selectionChanged.emit(item)
 
+    def _on_properties_visibility_changed(self, visible: bool):
+        """Bouw het eigenschappen paneel bij het eerste tonen van de dock"""
+        if not visible or self._properties_panel is not None:
+            return
+
+        self._properties_panel = PropertiesPanel()
+        self._properties_panel.itemChanged.connect(self._on_item_changed)
+        placeholder = self._properties_dock.widget()
+        self._properties_dock.setWidget(self._properties_panel)
+        placeholder.deleteLater()
+        self._properties_panel.set_item(self._table_view.get_selected_item())
+
     def _on_item_changed(self, item: CostItem):
         """Afhandeling van item wijziging"""
         # Prevent re-entry
-        if getattr(self, '_updating_item', False):
+        if self._updating_item:
             return
         self._updating_item = True
 
         try:
+            changed = self._record_item_changes(item)
+            if changed is not None:
+                changed |= item.dirty_fields
+
             # Update IFC
-            if self._cost_api and item.ifc_cost_item:
-                self._cost_api.edit_cost_item(
-                    item.ifc_cost_item,
-                    {
-                        "Name": item.name,
-                        "Identification": item.identification,
-                        "Description": item.description
-                    }
-                )
-                # Sla SFB-code op in IFC properties
-                if item.sfb_code:
-                    self._cost_api.set_sfb_code(item.ifc_cost_item, item.sfb_code)
-
-                # Sla HTML opmaak op in IFC properties
-                if item.html_name:
-                    self._cost_api.set_html_name(item.ifc_cost_item, item.html_name)
-
-                # Sla is_text_only op in IFC properties
-                if item.is_text_only:
-                    self._cost_api.set_is_text_only(item.ifc_cost_item, True)
+            self._sync_item_to_ifc(item)
 
-            self._ifc_handler.mark_modified()
+            self._mark_modified()
             # Don't call refresh() here - it causes infinite loop
             # The model already has the updated data
-            self._update_title()
-            self._update_totals()
+            # Alleen opmaak of omschrijving gewijzigd: de totalen blijven gelijk
+            if changed and changed <= _COSMETIC_FIELDS:
+                self._mark_dirty(_UI_TITLE)
+            else:
+                self._mark_dirty(_UI_TOTALS | _UI_TITLE)
         finally:
             self._updating_item = False
 
@@ -1131,14 +1818,31 @@ class MainWindow(QMainWindow):
     # PRINT EN EXPORT OPERATIES
     # =========================================================================
 
+    def _mark_modified(self):
+        """Markeer bestand en begroting als gewijzigd"""
+        self._ifc_handler.mark_modified()
+        if self._schedule:
+            self._schedule.mark_modified()
+
+    def _get_service(self, service_cls):
+        """Geef de print/export service voor de huidige versie van de begroting"""
+        self._finish_deferred_loads()  # Anders wordt een half geladen boom gecached
+        key = (id(self._schedule), self._schedule._version)
+        cached = self._service_cache.get(service_cls)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        service = service_cls(self._schedule)
+        self._service_cache[service_cls] = (key, service)
+        return service
+
     def _print_preview(self):
         """Toon afdrukvoorbeeld"""
         if not self._schedule:
             QMessageBox.warning(self, "Geen begroting", "Er is geen begroting om af te drukken.")
             return
 
-        from ..services import PrintService
-        print_service = PrintService(self._schedule)
+        self._finish_deferred_loads()  # Subtotalen kloppen alleen over de hele boom
+        print_service = self._get_service(PrintService)
         print_service.print_preview(self)
 
     def _print(self):
@@ -1147,8 +1851,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Geen begroting", "Er is geen begroting om af te drukken.")
             return
 
-        from ..services import PrintService
-        print_service = PrintService(self._schedule)
+        self._finish_deferred_loads()  # Subtotalen kloppen alleen over de hele boom
+        print_service = self._get_service(PrintService)
         if print_service.print_direct(self):
             self._statusbar.showMessage("Afdrukken voltooid")
 
@@ -1169,26 +1873,14 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            from ..services import PrintService
-            print_service = PrintService(self._schedule)
-            if print_service.export_pdf(file_path):
-                self._statusbar.showMessage(f"PDF geëxporteerd: {file_path}")
-                QMessageBox.information(
-                    self,
-                    "Export Succesvol",
-                    f"De begroting is geëxporteerd naar:\n{file_path}"
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Export Mislukt",
-                    "Er is een fout opgetreden bij het exporteren naar PDF."
-                )
+            print_service = self._get_service(PrintService)
+            self._run_export(partial(print_service.export_pdf, file_path), "PDF", file_path)
 
     def _toggle_doc_viewer(self, visible: bool):
         """Toggle de document viewer zichtbaarheid"""
         self._doc_viewer.setVisible(visible)
         if visible:
+            self._warmup_ifc_viewer()
             # Pas splitter verhoudingen aan (2 panelen: doc viewer | tabs)
             sizes = self._main_splitter.sizes()
             total = sum(sizes)
@@ -1197,133 +1889,25 @@ class MainWindow(QMainWindow):
 
     def _toggle_dark_mode(self, enabled: bool):
         """Toggle next-level dark mode thema"""
-        if enabled:
-            dark_style = """
-                /* ===== NEXT LEVEL DARK MODE ===== */
-                * { color: #e2e8f0; }
-
-                QMainWindow { background-color: #0a0f1a; }
-                QWidget { background-color: #111827; color: #e2e8f0; }
-
-                /* Menu */
-                QMenuBar {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #1f2937, stop:1 #111827);
-                    color: #e2e8f0; border-bottom: 1px solid #374151;
-                }
-                QMenuBar::item:selected { background: #374151; border-radius: 4px; }
-                QMenu { background: #1f2937; border: 1px solid #4b5563; border-radius: 8px; padding: 4px; }
-                QMenu::item { padding: 8px 20px; border-radius: 4px; }
-                QMenu::item:selected { background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0ea5e9, stop:1 #06b6d4); }
-
-                /* Tabs */
-                QTabWidget::pane { background: #111827; border: none; border-top: 2px solid #0ea5e9; }
-                QTabBar::tab { background: transparent; color: #9ca3af; padding: 10px 20px; font-weight: 500; }
-                QTabBar::tab:selected { color: #0ea5e9; border-bottom: 3px solid #0ea5e9; background: #1f2937; }
-                QTabBar::tab:hover:!selected { background: #1f2937; color: #e2e8f0; }
-
-                /* Tree/Table Views */
-                QTreeView, QTableView, QTableWidget, QListView {
-                    background: #0a0f1a; color: #e2e8f0; border: 1px solid #374151;
-                    border-radius: 8px; alternate-background-color: #111827;
-                    gridline-color: #1f2937;
-                }
-                QTreeView::item, QTableView::item { padding: 8px; border-bottom: 1px solid #1f2937; }
-                QTreeView::item:selected, QTableView::item:selected {
-                    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0369a1, stop:1 #0ea5e9);
-                    color: white;
-                }
-                QTreeView::item:hover:!selected { background: #1e3a5f; }
-                QHeaderView::section {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #374151, stop:1 #1f2937);
-                    color: #9ca3af; border: none; border-right: 1px solid #4b5563;
-                    border-bottom: 1px solid #4b5563; padding: 10px; font-weight: 600;
-                }
-
-                /* Inputs */
-                QLineEdit, QTextEdit, QPlainTextEdit, QTextBrowser {
-                    background: #0a0f1a; color: #e2e8f0; border: 2px solid #374151;
-                    border-radius: 8px; padding: 10px;
-                }
-                QLineEdit:focus, QTextEdit:focus { border: 2px solid #0ea5e9; background: #111827; }
-                QSpinBox, QDoubleSpinBox, QDateEdit, QComboBox {
-                    background: #0a0f1a; color: #e2e8f0; border: 2px solid #374151;
-                    border-radius: 8px; padding: 8px;
-                }
-                QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus, QComboBox:focus { border: 2px solid #0ea5e9; }
-                QComboBox::drop-down { border: none; background: #374151; width: 30px; border-radius: 0 6px 6px 0; }
-                QComboBox QAbstractItemView { background: #1f2937; border: 1px solid #4b5563; border-radius: 8px; }
-
-                /* Buttons */
-                QPushButton {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #4b5563, stop:1 #374151);
-                    color: #e2e8f0; border: 1px solid #6b7280; border-radius: 8px; padding: 10px 18px; font-weight: 500;
-                }
-                QPushButton:hover { background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #6b7280, stop:1 #4b5563); }
-                QPushButton:pressed { background: #1f2937; border: 1px solid #0ea5e9; }
-                QToolButton { background: transparent; color: #e2e8f0; border-radius: 6px; padding: 6px; }
-                QToolButton:hover { background: #374151; }
-                QToolButton:checked { background: #0ea5e9; color: white; }
-
-                /* GroupBox */
-                QGroupBox {
-                    background: #1f2937; border: 1px solid #374151; border-radius: 12px;
-                    margin-top: 20px; padding: 20px; padding-top: 28px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin; left: 16px; padding: 0 10px;
-                    color: #0ea5e9; background: #1f2937; font-weight: 600;
-                }
-
-                /* Checkbox/Radio */
-                QCheckBox, QRadioButton { color: #e2e8f0; spacing: 10px; }
-                QCheckBox::indicator, QRadioButton::indicator {
-                    width: 22px; height: 22px; border: 2px solid #4b5563; border-radius: 6px; background: #0a0f1a;
-                }
-                QRadioButton::indicator { border-radius: 11px; }
-                QCheckBox::indicator:checked, QRadioButton::indicator:checked { background: #0ea5e9; border-color: #0ea5e9; }
-                QCheckBox::indicator:hover { border-color: #0ea5e9; }
-
-                /* Scrollbars */
-                QScrollBar:vertical { background: #0a0f1a; width: 14px; border-radius: 7px; }
-                QScrollBar::handle:vertical {
-                    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #4b5563, stop:1 #6b7280);
-                    border-radius: 6px; min-height: 30px; margin: 2px;
-                }
-                QScrollBar::handle:vertical:hover { background: #0ea5e9; }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-                QScrollBar:horizontal { background: #0a0f1a; height: 14px; border-radius: 7px; }
-                QScrollBar::handle:horizontal {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #4b5563, stop:1 #6b7280);
-                    border-radius: 6px; min-width: 30px; margin: 2px;
-                }
-                QScrollBar::handle:horizontal:hover { background: #0ea5e9; }
-                QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
-
-                /* Status & Dock */
-                QStatusBar { background: #0a0f1a; color: #9ca3af; border-top: 1px solid #374151; }
-                QDockWidget { color: #e2e8f0; }
-                QDockWidget::title {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #374151, stop:1 #1f2937);
-                    color: #0ea5e9; padding: 12px; border-bottom: 2px solid #0ea5e9; font-weight: 600;
-                }
-
-                /* Misc */
-                QLabel { color: #e2e8f0; background: transparent; }
-                QFrame { border-color: #374151; }
-                QSplitter::handle { background: #374151; }
-                QSplitter::handle:hover { background: #0ea5e9; }
-                QToolTip { background: #1f2937; color: #e2e8f0; border: 1px solid #0ea5e9; border-radius: 6px; padding: 8px; }
-                QScrollArea { background: transparent; border: none; }
-                QDialog { background: #1f2937; }
-            """
-            self.setStyleSheet(dark_style)
-            self._is_dark_mode = True
-        else:
-            self.setStyleSheet("")
-            self._is_dark_mode = False
+        if enabled == self._is_dark_mode:
+            return  # Stylesheet niet opnieuw laten parsen
+        self.setStyleSheet(_DARK_QSS if enabled else "")
+        self._is_dark_mode = enabled
+
+    def _warmup_ifc_viewer(self):
+        """
+        Warm de 3D viewer op bij de eerste IFC gerelateerde actie.
+
+        Chromium start pas als er een IFC model in beeld kan komen; de
+        opstarttijd valt dan samen met het kiezen van een bestand.
+        """
+        if not self._ifc_viewer_warmed:
+            self._ifc_viewer_warmed = True
+            QTimer.singleShot(0, warmup_ifc_viewer)
 
     def _open_ifc_3d(self):
         """Open de IFC 3D viewer in het documenten paneel"""
+        self._warmup_ifc_viewer()
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "IFC 3D Model Openen",
@@ -1361,21 +1945,8 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            from ..services import PrintService
-            print_service = PrintService(self._schedule)
-            if print_service.export_html(file_path):
-                self._statusbar.showMessage(f"HTML geëxporteerd: {file_path}")
-                QMessageBox.information(
-                    self,
-                    "Export Succesvol",
-                    f"De begroting is geëxporteerd naar:\n{file_path}"
-                )
-            else:
-                QMessageBox.critical(
-                    self,
-                    "Export Mislukt",
-                    "Er is een fout opgetreden bij het exporteren naar HTML."
-                )
+            print_service = self._get_service(PrintService)
+            self._run_export(partial(print_service.export_html, file_path), "HTML", file_path)
 
 
     def _export_xls(self):
@@ -1393,14 +1964,10 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            from ..services import ExportService
-            export_service = ExportService(self._schedule)
-            if export_service.export_xlsx(file_path):
-                self._statusbar.showMessage(f"Excel geexporteerd: {file_path}")
-                # Open bestand (cross-platform)
-                self._open_file_external(file_path)
-            else:
-                QMessageBox.critical(self, "Export Mislukt", "Er is een fout opgetreden.")
+            export_service = self._get_service(ExportService)
+            self._run_export(
+                partial(export_service.export_xlsx, file_path), "Excel", file_path, open_file=True
+            )
 
     def _export_ods(self):
         """Exporteer naar ODS"""
@@ -1417,14 +1984,10 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            from ..services import ExportService
-            export_service = ExportService(self._schedule)
-            if export_service.export_ods(file_path):
-                self._statusbar.showMessage(f"ODS geexporteerd: {file_path}")
-                # Open bestand (cross-platform)
-                self._open_file_external(file_path)
-            else:
-                QMessageBox.critical(self, "Export Mislukt", "Er is een fout opgetreden.")
+            export_service = self._get_service(ExportService)
+            self._run_export(
+                partial(export_service.export_ods, file_path), "ODS", file_path, open_file=True
+            )
 
     def _export_odt(self):
         """Exporteer naar ODT (LibreOffice Writer)"""
@@ -1441,14 +2004,48 @@ class MainWindow(QMainWindow):
         )
 
         if file_path:
-            from ..services import ExportService
-            export_service = ExportService(self._schedule)
-            if export_service.export_odt(file_path):
-                self._statusbar.showMessage(f"ODT geexporteerd: {file_path}")
-                # Open bestand in Writer
-                self._open_file_external(file_path)
-            else:
-                QMessageBox.critical(self, "Export Mislukt", "Er is een fout opgetreden.")
+            export_service = self._get_service(ExportService)
+            self._run_export(
+                partial(export_service.export_odt, file_path), "ODT", file_path, open_file=True
+            )
+
+    def _run_export(self, job: Callable, kind: str, file_path: str, open_file: bool = False):
+        """
+        Voer een export uit in de thread pool.
+
+        De modale voortgangsdialoog voorkomt wijzigingen aan de begroting
+        zolang de worker thread die leest.
+        """
+        if self._file_job_active:
+            return
+        # Geen laad-porties meer tijdens het lezen door de worker thread
+        self._finish_deferred_loads()
+        self._start_file_job(
+            job,
+            partial(self._on_export_finished, kind, file_path, open_file),
+            "Export Mislukt", f"Fout bij exporteren naar {kind}"
+        )
+        self._show_job_progress("Exporteren", f"Exporteren naar {kind}...")
+
+    def _on_export_finished(self, kind: str, file_path: str, open_file: bool, ok: bool):
+        """Afhandeling van een voltooide export"""
+        if not ok:
+            QMessageBox.critical(
+                self,
+                "Export Mislukt",
+                f"Er is een fout opgetreden bij het exporteren naar {kind}."
+            )
+            return
+
+        self._statusbar.showMessage(f"{kind} geëxporteerd: {file_path}")
+        if open_file:
+            self._open_file_external(file_path)
+        else:
+            QMessageBox.information(
+                self,
+                "Export Succesvol",
+                f"De begroting is geëxporteerd naar:\n{file_path}"
+            )
 
     def _import_excel(self):
         """Importeer gegevens uit Excel bestand"""
@@ -1459,36 +2056,34 @@ class MainWindow(QMainWindow):
             "Excel Bestanden (*.xlsx *.xls);;Alle Bestanden (*.*)"
         )
 
-        if file_path:
-            try:
-                import openpyxl
-                wb = openpyxl.load_workbook(file_path)
-                ws = wb.active
-
-                # Lees data en voeg toe aan begroting
-                row_count = 0
-                for row in ws.iter_rows(min_row=2, values_only=True):
-                    if row[0]:  # Als er een code is
-                        row_count += 1
-
-                self._statusbar.showMessage(f"Excel geimporteerd: {row_count} regels uit {Path(file_path).name}")
-                QMessageBox.information(
-                    self,
-                    "Import Succesvol",
-                    f"Er zijn {row_count} regels geimporteerd uit:\n{file_path}"
-                )
-            except ImportError:
-                QMessageBox.warning(
-                    self,
-                    "Module niet gevonden",
-                    "openpyxl is niet geinstalleerd.\nInstalleer met: pip install openpyxl"
-                )
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Import Fout",
-                    f"Fout bij importeren:\n{str(e)}"
-                )
+        if not file_path:
+            return
+
+        # Alleen controleren of openpyxl er is; importeren gebeurt in de worker
+        if _openpyxl is None and find_spec("openpyxl") is None:
+            QMessageBox.warning(
+                self,
+                "Module niet gevonden",
+                "openpyxl is niet geinstalleerd.\nInstalleer met: pip install openpyxl"
+            )
+            return
+
+        # Lezen van grote werkbladen gebeurt in de thread pool
+        self._statusbar.showMessage(f"Importeren: {Path(file_path).name}...")
+        self._start_file_job(
+            partial(_count_excel_rows, file_path),
+            partial(self._on_excel_imported, file_path),
+            "Import Fout", "Fout bij importeren"
+        )
+
+    def _on_excel_imported(self, file_path: str, row_count: int):
+        """Afhandeling van een voltooide Excel import"""
+        self._statusbar.showMessage(f"Excel geimporteerd: {row_count} regels uit {Path(file_path).name}")
+        QMessageBox.information(
+            self,
+            "Import Succesvol",
+            f"Er zijn {row_count} regels geimporteerd uit:\n{file_path}"
+        )
 
     def _import_csv(self):
         """Importeer gegevens uit CSV bestand"""
@@ -1499,35 +2094,33 @@ class MainWindow(QMainWindow):
             "CSV Bestanden (*.csv);;Alle Bestanden (*.*)"
         )
 
-        if file_path:
-            try:
-                import csv
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.reader(f, delimiter=';')
-                    header = next(reader, None)  # Skip header
-
-                    row_count = sum(1 for row in reader if row)
-
-                self._statusbar.showMessage(f"CSV geimporteerd: {row_count} regels uit {Path(file_path).name}")
-                QMessageBox.information(
-                    self,
-                    "Import Succesvol",
-                    f"Er zijn {row_count} regels geimporteerd uit:\n{file_path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Import Fout",
-                    f"Fout bij importeren:\n{str(e)}"
-                )
+        if not file_path:
+            return
+
+        self._statusbar.showMessage(f"Importeren: {Path(file_path).name}...")
+        self._start_file_job(
+            partial(_count_csv_rows, file_path),
+            partial(self._on_csv_imported, file_path),
+            "Import Fout", "Fout bij importeren"
+        )
+
+    def _on_csv_imported(self, file_path: str, row_count: int):
+        """Afhandeling van een voltooide CSV import"""
+        self._statusbar.showMessage(f"CSV geimporteerd: {row_count} regels uit {Path(file_path).name}")
+        QMessageBox.information(
+            self,
+            "Import Succesvol",
+            f"Er zijn {row_count} regels geimporteerd uit:\n{file_path}"
+        )
 
     def _open_file_external(self, file_path: str):
         """Open een bestand met de standaard applicatie (cross-platform)"""
-        import subprocess
-        import sys
+        # Via de native API van het platform, zonder extra proces
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)):
+            return
         try:
             if sys.platform == 'win32':
-                subprocess.Popen(['start', '', file_path], shell=True)
+                os.startfile(file_path)
             elif sys.platform == 'darwin':  # macOS
                 subprocess.Popen(['open', file_path])
             else:  # Linux en andere Unix-achtige systemen
@@ -1537,7 +2130,11 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Afhandeling van sluiten"""
-        if self._check_save():
+        if self._file_job_active:
+            # Wacht tot het openen of opslaan in de achtergrond klaar is
+            self._statusbar.showMessage("Even geduld, bestand wordt nog verwerkt...")
+            event.ignore()
+        elif self._check_save():
             event.accept()
         else:
             event.ignore()
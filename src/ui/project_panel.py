@@ -8,17 +8,142 @@ from PySide6.QtWidgets import (
     QPushButton, QComboBox, QMessageBox, QDialog, QDialogButtonBox,
     QFrame
 )
-from PySide6.QtCore import Qt, QDate, Signal
+from PySide6.QtCore import Qt, QDate, Signal, QObject, QRunnable, QThreadPool
+from shiboken6 import isValid
+from functools import partial
+import http.client
 import json
+import threading
 import urllib.request
 import urllib.error
 import urllib.parse
 from pathlib import Path
+from typing import Callable, Optional
 
 # Config bestand pad
 CONFIG_DIR = Path.home() / ".opencalc"
 ERPNEXT_CONFIG_FILE = CONFIG_DIR / "erpnext_settings.json"
 
+# Klantvelden die het paneel gebruikt; opgehaald voor alle klanten van de projectenlijst
+_CUSTOMER_FIELDS = ["name", "customer_name", "email_id", "mobile_no"]
+
+# Fouten waarbij een hergebruikte keep-alive verbinding door de server gesloten is
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _ERPNextClient:
+    """Houdt één keep-alive verbinding met een ERPNext server open voor opeenvolgende API calls"""
+
+    def __init__(self, settings: dict):
+        parts = urllib.parse.urlsplit(settings["url"])
+        self._https = parts.scheme == "https"
+        self._host = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._headers = {
+            "Authorization": f"token {settings.get('api_key', '')}:{settings.get('api_secret', '')}",
+            "Accept": "application/json",
+        }
+        self._connection: Optional[http.client.HTTPConnection] = None
+        # Calls komen uit de thread pool; één verbinding kan één request tegelijk aan
+        self._lock = threading.Lock()
+
+    def get_json(self, path: str, timeout: float = 10):
+        """
+        Voer een GET uit op een API pad en geef de JSON respons terug.
+
+        Netwerkfouten worden als urllib.error.URLError doorgegeven, net als bij urlopen.
+        """
+        with self._lock:
+            return self._get_json(path, timeout)
+
+    def _get_json(self, path: str, timeout: float):
+        """GET zonder lock; zie get_json"""
+        for attempt in range(2):
+            connection = self._connect(timeout)
+            try:
+                connection.request("GET", self._base_path + path, headers=self._headers)
+                response = connection.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                self._close()
+                if attempt == 0:
+                    continue  # Server heeft de oude verbinding gesloten: één keer opnieuw
+                raise urllib.error.URLError(e) from e
+            except (http.client.HTTPException, OSError) as e:
+                self._close()
+                raise urllib.error.URLError(e) from e
+
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    path, response.status, response.reason, response.headers, None
+                )
+            return json.loads(body)
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        """Geef de open verbinding, of maak een nieuwe"""
+        if self._connection is None:
+            connection_cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            self._connection = connection_cls(self._host, timeout=timeout)
+        else:
+            self._connection.timeout = timeout
+            if self._connection.sock is not None:
+                self._connection.sock.settimeout(timeout)
+        return self._connection
+
+    def _close(self):
+        """Sluit de verbinding; de volgende call maakt een nieuwe"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class _RequestSignals(QObject):
+    """Signalen van een ERPNext request in de thread pool"""
+
+    finished = Signal(object)  # resultaat van de request
+    failed = Signal(object)    # de opgetreden exception
+
+
+class _RequestTask(QRunnable):
+    """Voer een ERPNext request uit in een worker thread"""
+
+    def __init__(self, job: Callable, signals: _RequestSignals):
+        super().__init__()
+        self._job = job
+        self._signals = signals
+
+    def run(self):
+        try:
+            result = self._job()
+        except Exception as e:
+            self._signals.failed.emit(e)
+            return
+        self._signals.finished.emit(result)
+
+
+def _start_request(parent: QObject, job: Callable, on_finished: Callable, on_failed: Callable):
+    """Start een netwerk request in de thread pool; de callbacks lopen op de GUI thread"""
+    # Zonder parent: de worker mag nog emitten als het paneel of de dialoog al gesloten is
+    signals = _RequestSignals()
+    signals.finished.connect(partial(_finish_request, parent, signals, on_finished))
+    signals.failed.connect(partial(_finish_request, parent, signals, on_failed))
+    QThreadPool.globalInstance().start(_RequestTask(job, signals))
+
+
+def _finish_request(parent: QObject, signals: _RequestSignals, callback: Callable, result):
+    """Ruim de signalen op en geef het resultaat door als de aanvrager nog bestaat"""
+    signals.deleteLater()
+    if isValid(parent):
+        callback(result)
+
+
+def _ping(test_url: str, authorization: str) -> int:
+    """Roep de ping methode van ERPNext aan en geef de HTTP status terug"""
+    req = urllib.request.Request(test_url)
+    req.add_header("Authorization", authorization)
+    with urllib.request.urlopen(req, timeout=5) as response:
+        return response.status
+
 
 class ERPNextSettingsDialog(QDialog):
     """Dialog voor ERPNext instellingen"""
@@ -50,9 +175,9 @@ class ERPNextSettingsDialog(QDialog):
         layout.addWidget(server_group)
 
         # Test verbinding knop
-        test_btn = QPushButton("Test Verbinding")
-        test_btn.clicked.connect(self._test_connection)
-        layout.addWidget(test_btn)
+        self._test_btn = QPushButton("Test Verbinding")
+        self._test_btn.clicked.connect(self._test_connection)
+        layout.addWidget(self._test_btn)
 
         # Status label
         self._status_label = QLabel("")
@@ -75,25 +200,37 @@ class ERPNextSettingsDialog(QDialog):
             self._status_label.setStyleSheet("color: #ef4444;")
             return
 
-        try:
-            # Probeer verbinding te maken
-            test_url = f"{url}/api/method/frappe.ping"
-            req = urllib.request.Request(test_url)
-            req.add_header("Authorization", f"token {self._api_key.text()}:{self._api_secret.text()}")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    self._status_label.setText("Verbinding succesvol!")
-                    self._status_label.setStyleSheet("color: #22c55e;")
-                else:
-                    self._status_label.setText(f"Fout: Status {response.status}")
-                    self._status_label.setStyleSheet("color: #ef4444;")
-        except urllib.error.URLError as e:
-            self._status_label.setText(f"Verbindingsfout: {str(e.reason)}")
-            self._status_label.setStyleSheet("color: #ef4444;")
-        except Exception as e:
-            self._status_label.setText(f"Fout: {str(e)}")
+        # Probeer verbinding te maken zonder de dialog te blokkeren
+        self._test_btn.setEnabled(False)
+        self._status_label.setText("Verbinden...")
+        self._status_label.setStyleSheet("color: #64748b;")
+        _start_request(
+            self,
+            partial(_ping, f"{url}/api/method/frappe.ping",
+                    f"token {self._api_key.text()}:{self._api_secret.text()}"),
+            self._on_test_finished,
+            self._on_test_failed,
+        )
+
+    def _on_test_finished(self, status: int):
+        """Toon het resultaat van de verbindingstest"""
+        self._test_btn.setEnabled(True)
+        if status == 200:
+            self._status_label.setText("Verbinding succesvol!")
+            self._status_label.setStyleSheet("color: #22c55e;")
+        else:
+            self._status_label.setText(f"Fout: Status {status}")
             self._status_label.setStyleSheet("color: #ef4444;")
 
+    def _on_test_failed(self, error: Exception):
+        """Toon de fout van de verbindingstest"""
+        self._test_btn.setEnabled(True)
+        if isinstance(error, urllib.error.URLError):
+            self._status_label.setText(f"Verbindingsfout: {str(error.reason)}")
+        else:
+            self._status_label.setText(f"Fout: {str(error)}")
+        self._status_label.setStyleSheet("color: #ef4444;")
+
     def get_settings(self) -> dict:
         """Haal de instellingen op"""
         return {
@@ -117,6 +254,9 @@ class ProjectPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._erpnext_settings = {}
+        self._erpnext_client: Optional[_ERPNextClient] = None
+        self._fetching_projects = False
+        self._customer_cache: dict = {}  # klant naam -> klantgegevens uit ERPNext
         self._load_erpnext_settings()  # Laad opgeslagen instellingen
         self._setup_ui()
 
@@ -319,9 +459,22 @@ class ProjectPanel(QWidget):
 
         if dialog.exec() == QDialog.Accepted:
             self._erpnext_settings = dialog.get_settings()
+            self._reset_erpnext_client()
             self._save_erpnext_settings()  # Sla op naar JSON
             self._fetch_projects()
 
+    def _get_erpnext_client(self) -> _ERPNextClient:
+        """Geef de client voor de huidige instellingen; de verbinding wordt hergebruikt"""
+        if self._erpnext_client is None:
+            self._erpnext_client = _ERPNextClient(self._erpnext_settings)
+        return self._erpnext_client
+
+    def _reset_erpnext_client(self):
+        """Gebruik na een wijziging van de instellingen een nieuwe verbinding"""
+        # Niet expliciet sluiten: een lopende request houdt de oude client vast
+        self._erpnext_client = None
+        self._customer_cache.clear()
+
     def _fetch_projects(self):
         """Haal projecten op uit ERPNext"""
         if not self._erpnext_settings.get("url"):
@@ -332,53 +485,90 @@ class ProjectPanel(QWidget):
             )
             return
 
-        try:
-            url = self._erpnext_settings["url"]
-            api_key = self._erpnext_settings["api_key"]
-            api_secret = self._erpnext_settings["api_secret"]
-
-            # Haal projecten op
-            projects_url = f"{url}/api/resource/Project?fields=[\"name\",\"project_name\",\"customer\"]&limit_page_length=100"
-            req = urllib.request.Request(projects_url)
-            req.add_header("Authorization", f"token {api_key}:{api_secret}")
-
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                projects = data.get("data", [])
-
-                self._project_combo.clear()
-                self._project_combo.addItem("-- Selecteer een project --", None)
-
-                for project in projects:
-                    display_name = project.get("project_name") or project.get("name")
-                    self._project_combo.addItem(display_name, project)
-
-                if len(projects) > 0:
-                    QMessageBox.information(
-                        self,
-                        "ERPNext",
-                        f"{len(projects)} projecten opgehaald."
-                    )
-                else:
-                    QMessageBox.information(
-                        self,
-                        "ERPNext",
-                        "Geen projecten gevonden."
-                    )
-
-        except urllib.error.URLError as e:
+        if self._fetching_projects:
+            return  # Er loopt al een request
+
+        # Haal projecten op in de thread pool
+        self._fetching_projects = True
+        projects_path = "/api/resource/Project?fields=[\"name\",\"project_name\",\"customer\"]&limit_page_length=100"
+        _start_request(
+            self,
+            partial(self._get_erpnext_client().get_json, projects_path),
+            self._on_projects_fetched,
+            self._on_projects_failed,
+        )
+
+    def _on_projects_fetched(self, data: dict):
+        """Vul de projectenlijst met het antwoord van ERPNext"""
+        self._fetching_projects = False
+        projects = data.get("data", [])
+
+        self._project_combo.clear()
+        self._project_combo.addItem("-- Selecteer een project --", None)
+
+        for project in projects:
+            display_name = project.get("project_name") or project.get("name")
+            self._project_combo.addItem(display_name, project)
+
+        # Opnieuw ophalen zodat wijzigingen in ERPNext zichtbaar worden
+        self._customer_cache.clear()
+        self._prefetch_customers(projects)
+
+        if len(projects) > 0:
+            QMessageBox.information(
+                self,
+                "ERPNext",
+                f"{len(projects)} projecten opgehaald."
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "ERPNext",
+                "Geen projecten gevonden."
+            )
+
+    def _on_projects_failed(self, error: Exception):
+        """Meld een fout bij het ophalen van de projecten"""
+        self._fetching_projects = False
+        if isinstance(error, urllib.error.URLError):
             QMessageBox.warning(
                 self,
                 "ERPNext Fout",
-                f"Kan geen verbinding maken met ERPNext:\n{str(e.reason)}"
+                f"Kan geen verbinding maken met ERPNext:\n{str(error.reason)}"
             )
-        except Exception as e:
+        else:
             QMessageBox.warning(
                 self,
                 "ERPNext Fout",
-                f"Fout bij ophalen projecten:\n{str(e)}"
+                f"Fout bij ophalen projecten:\n{str(error)}"
             )
 
+    def _prefetch_customers(self, projects: list):
+        """Haal de klanten van alle projecten in één request op, zodat selecteren direct is"""
+        names = sorted({project["customer"] for project in projects if project.get("customer")})
+        if not names:
+            return
+
+        query = urllib.parse.urlencode({
+            "fields": json.dumps(_CUSTOMER_FIELDS),
+            "filters": json.dumps([["name", "in", names]]),
+            "limit_page_length": len(names),
+        })
+        client = self._get_erpnext_client()
+        _start_request(
+            self,
+            partial(client.get_json, f"/api/resource/Customer?{query}"),
+            partial(self._on_customers_prefetched, client),
+            lambda error: None,  # Bij een fout volgt per selectie een losse request
+        )
+
+    def _on_customers_prefetched(self, client: _ERPNextClient, data: dict):
+        """Bewaar de vooraf opgehaalde klanten"""
+        if client is not self._erpnext_client:
+            return  # Instellingen intussen gewijzigd: mogelijk een andere server
+        for customer in data.get("data", []):
+            self._customer_cache[customer.get("name")] = customer
+
     def _on_project_selected(self, index: int):
         """Afhandeling van project selectie"""
         project_data = self._project_combo.currentData()
@@ -395,27 +585,39 @@ class ProjectPanel(QWidget):
             self._fetch_customer_details(customer_name)
 
     def _fetch_customer_details(self, customer_name: str):
-        """Haal klantgegevens op uit ERPNext"""
-        try:
-            url = self._erpnext_settings["url"]
-            api_key = self._erpnext_settings["api_key"]
-            api_secret = self._erpnext_settings["api_secret"]
+        """Haal klantgegevens op uit ERPNext, of uit de vooraf opgehaalde klanten"""
+        customer = self._customer_cache.get(customer_name)
+        if customer is not None:
+            self._set_customer(customer)
+            return
 
-            customer_url = f"{url}/api/resource/Customer/{urllib.parse.quote(customer_name)}"
-            req = urllib.request.Request(customer_url)
-            req.add_header("Authorization", f"token {api_key}:{api_secret}")
+        customer_path = f"/api/resource/Customer/{urllib.parse.quote(customer_name)}"
+        client = self._get_erpnext_client()
+        _start_request(
+            self,
+            partial(client.get_json, customer_path),
+            partial(self._on_customer_fetched, client, customer_name),
+            lambda error: None,  # Negeer fouten bij ophalen klantgegevens
+        )
 
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                customer = data.get("data", {})
+    def _on_customer_fetched(self, client: _ERPNextClient, customer_name: str, data: dict):
+        """Vul de klantgegevens in als het project nog geselecteerd is"""
+        if client is not self._erpnext_client:
+            return  # Instellingen intussen gewijzigd: mogelijk een andere server
+        customer = data.get("data", {})
+        self._customer_cache[customer_name] = customer
 
-                self._client_name.setText(customer.get("customer_name", ""))
-                # Adres moet apart opgehaald worden via Address doctype
-                self._client_email.setText(customer.get("email_id", ""))
-                self._client_phone.setText(customer.get("mobile_no", ""))
+        project_data = self._project_combo.currentData()
+        if not project_data or project_data.get("customer") != customer_name:
+            return  # Intussen een ander project gekozen
+        self._set_customer(customer)
 
-        except Exception:
-            pass  # Negeer fouten bij ophalen klantgegevens
+    def _set_customer(self, customer: dict):
+        """Vul de klantvelden met gegevens uit ERPNext"""
+        self._client_name.setText(customer.get("customer_name", ""))
+        # Adres moet apart opgehaald worden via Address doctype
+        self._client_email.setText(customer.get("email_id", ""))
+        self._client_phone.setText(customer.get("mobile_no", ""))
 
     def get_project_data(self) -> dict:
         """Haal alle projectgegevens op"""
@@ -463,6 +665,7 @@ class ProjectPanel(QWidget):
     def set_erpnext_settings(self, settings: dict):
         """Stel ERPNext instellingen in"""
         self._erpnext_settings = settings
+        self._reset_erpnext_client()
 
     def get_erpnext_settings(self) -> dict:
         """Haal ERPNext instellingen op"""
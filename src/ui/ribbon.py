@@ -9,6 +9,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QIcon, QAction, QColor
 
+from functools import partial
+
 from .icons import IconProvider
 
 
@@ -283,6 +285,31 @@ class OpenCalcRibbon(Ribbon):
         self._setup_import_tab()
         self._setup_view_tab()
 
+    def set_shared_actions(self, actions: dict):
+        """
+        Laat de ribbon knoppen de gedeelde menu acties uitvoeren.
+
+        De knoppen behouden hun eigen tekst en icoon, maar volgen de enabled
+        status van de actie. Sleutels: new, open, save, undo, redo, cut, copy, paste.
+        """
+        buttons = {
+            "new": self._new_btn, "open": self._open_btn, "save": self._save_btn,
+            "undo": self._undo_btn, "redo": self._redo_btn,
+            "cut": self._cut_btn, "copy": self._copy_btn, "paste": self._paste_btn,
+        }
+        for name, action in actions.items():
+            button = buttons.get(name)
+            if button is None:
+                continue
+            button.clicked.connect(action.trigger)
+            action.changed.connect(partial(self._sync_button_enabled, button, action))
+            self._sync_button_enabled(button, action)
+
+    @staticmethod
+    def _sync_button_enabled(button: QToolButton, action):
+        """Neem de enabled status van een actie over op een knop"""
+        button.setEnabled(action.isEnabled())
+
     def _setup_home_tab(self):
         """Configureer de Start tab (alles gecombineerd)"""
         tab = RibbonTab()
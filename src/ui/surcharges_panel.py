@@ -11,7 +11,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QColor
 
 from typing import Optional
-from ..models import CostSchedule
+from ..models import CostSchedule, CostItem
 
 
 class SurchargesPanel(QWidget):
@@ -22,6 +22,8 @@ class SurchargesPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._schedule: Optional[CostSchedule] = None
+        self._directe_kosten = 0.0  # Gecached subtotaal van de begroting
+        self._chapter_rows: Optional[tuple] = None  # Laatst getoonde (code, naam, bedrag) rijen
 
         # Opslagen percentages
         self._algemene_kosten = 8.0  # AK %
@@ -193,15 +195,45 @@ class SurchargesPanel(QWidget):
         layout.addStretch()
 
     def set_schedule(self, schedule: Optional[CostSchedule]):
-        """Stel de begroting in"""
+        """Stel de begroting in; zonder zichtbare wijziging wordt niets opnieuw opgebouwd"""
+        if schedule is self._schedule and schedule is not None:
+            if self._collect_chapter_rows() == self._chapter_rows:
+                return
         self._schedule = schedule
         self.refresh()
 
+    def _collect_chapter_rows(self) -> tuple:
+        """Code, naam en bedrag van alle hoofdstukken, zoals getoond in de tabel"""
+        if not self._schedule:
+            return ()
+        return tuple(
+            (item.identification, item.name, item.subtotal) for item in self._schedule.items
+        )
+
     def refresh(self):
         """Vernieuw de weergave"""
+        self._chapter_rows = self._collect_chapter_rows()
+        self._directe_kosten = sum(row[2] for row in self._chapter_rows)
         self._update_chapters_table()
         self._update_calc_table()
 
+    def add_delta(self, item_total: float, chapter: CostItem):
+        """
+        Verwerk een toegevoegd (positief) of verwijderd (negatief) bedrag binnen een
+        bestaand hoofdstuk, zonder de hele begroting opnieuw door te rekenen.
+        """
+        row = self._schedule.get_item_index(chapter) if self._schedule else -1
+        if row < 0 or row >= self._chapters_table.rowCount():
+            self.refresh()
+            return
+
+        self._directe_kosten += item_total
+        self._chapter_rows = None  # Volgende set_schedule bouwt weer volledig op
+        amount_item = self._chapters_table.item(row, 2)
+        if amount_item:
+            amount_item.setText(f"€ {chapter.subtotal:,.2f}")
+        self._update_calc_table()
+
     def _update_chapters_table(self):
         """Update de hoofdstukken tabel"""
         self._chapters_table.setRowCount(0)
@@ -209,21 +241,21 @@ class SurchargesPanel(QWidget):
         if not self._schedule:
             return
 
-        for item in self._schedule.items:
+        for identification, name, subtotal in self._chapter_rows:
             row = self._chapters_table.rowCount()
             self._chapters_table.insertRow(row)
 
             # Code
-            code_item = QTableWidgetItem(item.identification)
+            code_item = QTableWidgetItem(identification)
             code_item.setTextAlignment(Qt.AlignCenter)
             self._chapters_table.setItem(row, 0, code_item)
 
             # Omschrijving
-            name_item = QTableWidgetItem(item.name)
+            name_item = QTableWidgetItem(name)
             self._chapters_table.setItem(row, 1, name_item)
 
             # Bedrag
-            amount_item = QTableWidgetItem(f"€ {item.subtotal:,.2f}")
+            amount_item = QTableWidgetItem(f"€ {subtotal:,.2f}")
             amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
             self._chapters_table.setItem(row, 2, amount_item)
 
@@ -234,7 +266,7 @@ class SurchargesPanel(QWidget):
         if not self._schedule:
             return
 
-        directe_kosten = self._schedule.subtotal
+        directe_kosten = self._directe_kosten
         ak_bedrag = directe_kosten * (self._algemene_kosten / 100)
         subtotaal_ak = directe_kosten + ak_bedrag
         wr_bedrag = subtotaal_ak * (self._winst_risico / 100)
@@ -304,6 +336,7 @@ class SurchargesPanel(QWidget):
         self._btw_percentage = value
         if self._schedule:
             self._schedule.vat_rate = value
+            self._schedule.mark_modified()
         self._update_calc_table()
         self.surchargesChanged.emit()
 